@@ -0,0 +1,62 @@
+import json
+import socket
+from typing import Optional
+
+from pysysinfo.daemon.server import DEFAULT_SOCKET_PATH
+
+
+class InventoryClient:
+    """
+    Queries a running ``InventoryDaemon``.
+    The connection is kept open between queries, so repeated queries do not pay for a new connection.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: Optional[float] = 1.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+
+    def _connect(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(self.timeout)
+        self._sock.connect(self.socket_path)
+        self._reader = self._sock.makefile("rb")
+
+    def query_raw(self, component: str = "all") -> bytes:
+        """Returns the JSON response of the daemon, without parsing it."""
+        if self._sock is None:
+            self._connect()
+        self._sock.sendall(component.encode("utf-8") + b"\n")
+        response = self._reader.readline()
+        if not response:
+            self.close()
+            raise ConnectionError("The inventory daemon closed the connection")
+        return response.rstrip(b"\n")
+
+    def query(self, component: str = "all") -> dict:
+        """
+        :param component: ``cpu``, ``memory``, ``storage``, ``graphics``, ``network``, ``usb`` or ``all``
+        :return: The component's data, as a dictionary
+        """
+        return json.loads(self.query_raw(component))
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def query(component: str = "all", socket_path: str = DEFAULT_SOCKET_PATH) -> dict:
+    """Queries the daemon once, over a short-lived connection."""
+    with InventoryClient(socket_path) as client:
+        return client.query(component)
@@ -0,0 +1,311 @@
+import argparse
+import json
+import os
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from pysysinfo.dumps.linux.common import invalidate_pci_topology
+from pysysinfo.models.info_models import HardwareManagerInterface
+from pysysinfo.util.command import default_runner
+
+
+def _default_socket_path() -> str:
+    if "PYSYSINFO_SOCKET" in os.environ:
+        return os.environ["PYSYSINFO_SOCKET"]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "pysysinfo.sock")
+    if sys.platform == "darwin":
+        # $TMPDIR is private to each user on macOS
+        return os.path.join(tempfile.gettempdir(), "pysysinfo.sock")
+    return "/run/pysysinfo/pysysinfo.sock"
+
+
+#: The socket path used when none is given: ``$XDG_RUNTIME_DIR/pysysinfo.sock``, or ``/run/pysysinfo/pysysinfo.sock``.
+#: Can be overridden with the ``PYSYSINFO_SOCKET`` env variable.
+DEFAULT_SOCKET_PATH = _default_socket_path()
+
+#: Only the user running the daemon can connect to the socket by default
+DEFAULT_SOCKET_MODE = 0o600
+
+#: Refresh interval, in seconds, for each component.
+#: Components that rarely change are refreshed less often.
+DEFAULT_INTERVALS = {
+    "cpu": 3600.0,
+    "memory": 3600.0,
+    "storage": 60.0,
+    "graphics": 60.0,
+    "network": 60.0,
+    "usb": 60.0,
+}
+
+#: Programs whose cached output describes each component, so is dropped when a device of the component changes.
+#: ``pci`` events are not a component of their own, see ``watcher.UEVENT_SUBSYSTEMS``.
+COMPONENT_PROGRAMS = {
+    "cpu": ("lscpu",),
+    "graphics": ("lspci", "nvidia-smi"),
+    "network": ("lspci",),
+    "pci": ("lspci",),
+}
+
+#: Components whose devices sit on the PCI bus, so a change to them may change the PCI topology
+PCI_COMPONENTS = frozenset({"pci", "graphics", "network"})
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Removes a socket left behind by a previous daemon.
+
+    :raises FileExistsError: If the path is not a socket, or belongs to another user
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise FileExistsError(f"{path} exists, and is not a socket owned by this user")
+    os.unlink(path)
+
+
+def _socket_dir_mode(socket_mode: int) -> int:
+    """
+    :param socket_mode: Permissions of the socket
+    :return: Permissions of a directory created for the socket. Only the owner can list it,
+             and the group and others can only enter it if the socket lets them connect.
+    """
+    mode = 0o700
+    if socket_mode & 0o060:
+        mode |= 0o010
+    if socket_mode & 0o006:
+        mode |= 0o001
+    return mode
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers one request per line, until the client disconnects.
+    A request is the name of a component, or ``all``.
+    """
+
+    def handle(self):
+        daemon: InventoryDaemon = self.server.inventory_daemon
+        for line in self.rfile:
+            component = line.decode("utf-8", errors="replace").strip()
+            if not component:
+                continue
+            self.wfile.write(daemon.response_for(component) + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class InventoryDaemon:
+    """
+    Keeps a warm ``HardwareInfo`` in memory and serves it over a Unix socket.
+
+    Every component is refreshed in its own background thread, on its own schedule.
+    Responses are serialized to JSON once per refresh, so a query is a single dictionary lookup.
+    """
+
+    def __init__(
+            self,
+            manager: Optional[HardwareManagerInterface] = None,
+            socket_path: str = DEFAULT_SOCKET_PATH,
+            intervals: Optional[Dict[str, float]] = None,
+            watch: bool = False,
+            socket_mode: int = DEFAULT_SOCKET_MODE,
+    ):
+        if manager is None:
+            from pysysinfo import HardwareManager
+            manager = HardwareManager()
+
+        self.manager = manager
+        self.socket_path = socket_path
+        #: Permissions of the socket. Any user who can connect can read the inventory.
+        self.socket_mode = socket_mode
+        self.intervals = dict(DEFAULT_INTERVALS)
+        if intervals:
+            self.intervals.update(intervals)
+
+        #: Pre-serialized JSON for every component that has been collected at least once.
+        self._payloads: Dict[str, bytes] = {}
+        #: Monotonic timestamp of the last refresh of each component.
+        self.last_refresh: Dict[str, float] = {}
+
+        self._lock = threading.Lock()
+        self._all_payload: Optional[bytes] = None
+        self._stop = threading.Event()
+        self._wake: Dict[str, threading.Event] = {c: threading.Event() for c in self.intervals}
+        self._threads = []
+        self._server: Optional[_UnixServer] = None
+
+        #: When enabled, components are refreshed as soon as a device is added or removed.
+        self.watch = watch
+        self._watcher = None
+
+    def refresh(self, component: str) -> None:
+        """Collects a component synchronously and replaces its cached response."""
+        fetch = getattr(self.manager, f"fetch_{component}_info", None)
+        if fetch is None:
+            return
+
+        data = fetch()
+        if data is None:
+            # This component is not implemented on the current platform
+            return
+
+        payload = data.model_dump_json().encode("utf-8")
+        with self._lock:
+            self._payloads[component] = payload
+            self._all_payload = None
+            self.last_refresh[component] = time.monotonic()
+
+    def invalidate(self, component: str) -> None:
+        """
+        Drops the cached results that a change to a component makes stale,
+        and asks the background thread of the component to refresh it as soon as possible.
+        """
+        # Cached tool output may describe the device that just changed
+        for program in COMPONENT_PROGRAMS.get(component, ()):
+            default_runner.invalidate(program=program)
+        if component in PCI_COMPONENTS:
+            # A hotplugged device changes the PCI bus
+            invalidate_pci_topology()
+        if component in self._wake:
+            self._wake[component].set()
+
+    def response_for(self, component: str) -> bytes:
+        if component == "all":
+            return self._all_response()
+
+        payload = self._payloads.get(component)
+        if payload is None:
+            return json.dumps({"error": f"Unknown or unavailable component: {component}"}).encode("utf-8")
+        return payload
+
+    def _all_response(self) -> bytes:
+        with self._lock:
+            if self._all_payload is None:
+                # The components are already JSON, so we only need to stitch them together
+                parts = [b'"' + name.encode() + b'":' + payload for name, payload in self._payloads.items()]
+                self._all_payload = b"{" + b",".join(parts) + b"}"
+            return self._all_payload
+
+    def _refresh_loop(self, component: str) -> None:
+        # The first collection is done by `start()`, so we wait before refreshing
+        wake = self._wake[component]
+        while True:
+            wake.wait(self.intervals[component])
+            wake.clear()
+            if self._stop.is_set():
+                return
+            try:
+                self.refresh(component)
+            except Exception:
+                # Keep serving the last good data, and try again on the next cycle
+                pass
+
+    def start(self) -> None:
+        """Collects every component once, then starts the refresh threads and the socket server."""
+        # Fail before any work is done if the socket path is taken by something else
+        socket_dir = os.path.dirname(self.socket_path)
+        if socket_dir and not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir, mode=_socket_dir_mode(self.socket_mode))
+        _remove_stale_socket(self.socket_path)
+
+        if self.watch:
+            from pysysinfo.daemon.watcher import ChangeWatcher
+            # Started first, so that no change is missed while the components are collected
+            self._watcher = ChangeWatcher()
+            self._watcher.subscribe(lambda event: self.invalidate(event.component))
+            self._watcher.start()
+
+        for component in self.intervals:
+            try:
+                self.refresh(component)
+            except Exception:
+                pass
+
+        for component in self.intervals:
+            thread = threading.Thread(
+                target=self._refresh_loop, args=(component,), name=f"pysysinfo-{component}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+        # Bound with a restrictive umask, so that nobody else can connect before its mode is set
+        umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, self.socket_mode)
+        self._server.inventory_daemon = self
+        threading.Thread(target=self._server.serve_forever, name="pysysinfo-server", daemon=True).start()
+
+    def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+        self._stop.set()
+        for wake in self._wake.values():
+            wake.set()
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        try:
+            _remove_stale_socket(self.socket_path)
+        except FileExistsError:
+            # Something else took the path over. It is not ours to remove.
+            pass
+
+    def serve_forever(self) -> None:
+        self.start()
+        try:
+            self._stop.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve hardware information over a Unix socket.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Path of the Unix socket to listen on")
+    for component, interval in DEFAULT_INTERVALS.items():
+        parser.add_argument(
+            f"--{component}-interval", type=float, default=interval,
+            help=f"Seconds between {component} refreshes (default: {interval:g})"
+        )
+    parser.add_argument(
+        "--socket-mode", type=lambda value: int(value, 8), default=DEFAULT_SOCKET_MODE,
+        help=f"Permissions of the socket, in octal (default: {DEFAULT_SOCKET_MODE:o})"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Refresh components when devices are added or removed (Linux only)"
+    )
+    args = parser.parse_args()
+
+    intervals = {c: getattr(args, f"{c}_interval") for c in DEFAULT_INTERVALS}
+    InventoryDaemon(
+        socket_path=args.socket, intervals=intervals, watch=args.watch, socket_mode=args.socket_mode
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import socket
+import struct
+import sys
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Constants from <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+
+# Header of `struct inotify_event`: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+# From <linux/netlink.h>
+NETLINK_KOBJECT_UEVENT = 15
+
+#: Directories that are watched by default, and the component that changes when their entries change.
+#: Entries in /dev are classified by name, see `_dev_component()`.
+#: sysfs does not send inotify events when its entries are added or removed, so it is not watched:
+#: changes there are reported by the uevent socket.
+DEFAULT_PATHS = {
+    "/dev": None,
+    "/dev/dri": "graphics",
+}
+
+_DEV_PATTERNS = [
+    (re.compile(r"^(sd|nvme|vd|xvd|hd|mmcblk|dm-|md|loop|zram|sr)"), "storage"),
+    (re.compile(r"^(dri|nvidia|kfd|fb)"), "graphics"),
+]
+
+#: Kernel uevent subsystems, and the component they belong to.
+UEVENT_SUBSYSTEMS = {
+    "block": "storage",
+    "nvme": "storage",
+    "scsi": "storage",
+    "net": "network",
+    "drm": "graphics",
+    "memory": "memory",
+    "cpu": "cpu",
+    "usb": "usb",
+    # A PCI device changes the PCI topology. The devices on top of it, e.g. its net interface or drm card,
+    # send their own events for the component they belong to.
+    "pci": "pci",
+}
+
+
+class ChangeEvent(NamedTuple):
+    #: The component whose cached data is no longer valid, e.g. ``storage``.
+    component: str
+    #: ``add``, ``remove``, ``change``, etc.
+    action: str
+    #: The name of the device, e.g. ``sdb``.
+    name: str
+    #: ``inotify`` or ``uevent``.
+    source: str
+
+
+def _dev_component(name: str) -> Optional[str]:
+    for pattern, component in _DEV_PATTERNS:
+        if pattern.match(name):
+            return component
+    return None
+
+
+def _inotify_action(mask: int) -> str:
+    if mask & (IN_CREATE | IN_MOVED_TO):
+        return "add"
+    if mask & (IN_DELETE | IN_MOVED_FROM):
+        return "remove"
+    return "change"
+
+
+def parse_inotify_events(buffer: bytes) -> List[tuple]:
+    """
+    :param buffer: Raw data read from an inotify file descriptor
+    :return: List of (watch descriptor, mask, name) tuples
+    """
+    events = []
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(buffer):
+        wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+        offset += _EVENT_HEADER.size
+        name = buffer[offset:offset + length].split(b"\0", 1)[0].decode("utf-8", errors="replace")
+        offset += length
+        events.append((wd, mask, name))
+    return events
+
+
+def parse_uevent(message: bytes) -> Optional[ChangeEvent]:
+    """
+    Parses a kernel uevent, which looks like: ``add@/devices/...\\0ACTION=add\\0SUBSYSTEM=block\\0...``
+    :return: ``None`` if the event does not belong to any component
+    """
+    fields = {}
+    for part in message.split(b"\0")[1:]:
+        if b"=" in part:
+            key, value = part.split(b"=", 1)
+            fields[key.decode(errors="replace")] = value.decode(errors="replace")
+
+    component = UEVENT_SUBSYSTEMS.get(fields.get("SUBSYSTEM", ""))
+    if component is None:
+        return None
+
+    name = fields.get("DEVNAME") or fields.get("INTERFACE") or fields.get("DEVPATH", "").rsplit("/", 1)[-1]
+    return ChangeEvent(component, fields.get("ACTION", "change"), name, "uevent")
+
+
+class ChangeWatcher:
+    """
+    Watches for devices being added or removed, and notifies subscribers with a ``ChangeEvent``.
+
+    The kernel uevent netlink socket reports devices that sysfs adds or removes,
+    and inotify on /dev catches device nodes that appear without a uevent reaching us, e.g. inside containers.
+    Nothing is polled, so the watcher costs nothing while the hardware does not change.
+
+    Only Linux is supported. ``start()`` raises ``NotImplementedError`` elsewhere.
+    """
+
+    def __init__(self, paths: Optional[Dict[str, Optional[str]]] = None, netlink: bool = True):
+        self.paths = DEFAULT_PATHS if paths is None else paths
+        self.netlink = netlink
+
+        self._subscribers: List[Callable[[ChangeEvent], None]] = []
+        self._watches: Dict[int, Optional[str]] = {}
+        self._inotify_fd: Optional[int] = None
+        self._netlink_sock: Optional[socket.socket] = None
+        self._stop_r, self._stop_w = None, None
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        self._subscribers.append(callback)
+
+    def _notify(self, event: ChangeEvent) -> None:
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def _open_inotify(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._inotify_fd = fd
+
+        for path, component in self.paths.items():
+            if not os.path.isdir(path):
+                continue
+            wd = libc.inotify_add_watch(fd, path.encode(), WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = component
+
+    def _open_netlink(self) -> None:
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+            # Multicast group 1 receives the events sent by the kernel
+            sock.bind((0, 1))
+            sock.setblocking(False)
+            self._netlink_sock = sock
+        except (OSError, AttributeError):
+            # Netlink is not available, e.g. inside some containers. inotify still works.
+            self._netlink_sock = None
+
+    def _handle_inotify(self) -> None:
+        try:
+            buffer = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        for wd, mask, name in parse_inotify_events(buffer):
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, so every watched component may be stale,
+                # including each one that the entries of an unclassified directory, e.g. /dev, can belong to
+                components = {c for c in self._watches.values() if c}
+                if None in self._watches.values():
+                    components.update(component for _, component in _DEV_PATTERNS)
+                for component in sorted(components):
+                    self._notify(ChangeEvent(component, "change", "", "inotify"))
+                continue
+
+            if wd not in self._watches:
+                continue
+            component = self._watches[wd] or _dev_component(name)
+            if component:
+                self._notify(ChangeEvent(component, _inotify_action(mask), name, "inotify"))
+
+    def _handle_netlink(self) -> None:
+        try:
+            message = self._netlink_sock.recv(64 * 1024)
+        except BlockingIOError:
+            return
+
+        if event := parse_uevent(message):
+            self._notify(event)
+
+    def _run(self) -> None:
+        readers = [self._stop_r, self._inotify_fd]
+        if self._netlink_sock is not None:
+            readers.append(self._netlink_sock.fileno())
+
+        while True:
+            ready, _, _ = select.select(readers, [], [])
+            if self._stop_r in ready:
+                return
+            if self._inotify_fd in ready:
+                self._handle_inotify()
+            if self._netlink_sock is not None and self._netlink_sock.fileno() in ready:
+                self._handle_netlink()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """:return: Whether inotify and uevents are available, i.e. whether this is Linux"""
+        return sys.platform.startswith("linux") and hasattr(socket, "AF_NETLINK")
+
+    def start(self) -> None:
+        """:raises NotImplementedError: If this is not Linux"""
+        if not self.is_supported():
+            raise NotImplementedError("Watching for device changes is only supported on Linux")
+        self._open_inotify()
+        if self.netlink:
+            self._open_netlink()
+
+        self._stop_r, self._stop_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, name="pysysinfo-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        os.write(self._stop_w, b"\0")
+        self._thread.join()
+        self._thread = None
+
+        for fd in (self._stop_r, self._stop_w, self._inotify_fd):
+            os.close(fd)
+        self._stop_r = self._stop_w = self._inotify_fd = None
+        self._watches = {}
+
+        if self._netlink_sock is not None:
+            self._netlink_sock.close()
+            self._netlink_sock = None
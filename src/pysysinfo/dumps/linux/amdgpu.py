@@ -0,0 +1,218 @@
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from pysysinfo.dumps.linux.common import SysfsAttribute
+
+PCI_ROOT_PATH = "/sys/bus/pci/devices/"
+
+AMD_VENDOR_ID = "0x1002"
+
+# Attributes in the PCI device directory, exposed by the amdgpu driver
+_DEVICE_ATTRIBUTES = [
+    "gpu_busy_percent",
+    "mem_info_vram_used",
+    "mem_info_vram_total",
+    "pp_dpm_sclk",
+    "pp_dpm_mclk",
+]
+
+
+class AMDGPUSample(NamedTuple):
+    #: PCI address of the GPU, e.g. ``0000:03:00.0``
+    slot: str
+    #: ``time.monotonic()`` when the sample was taken
+    timestamp: float
+    #: GPU utilisation, in percent
+    busy_percent: Optional[int]
+    #: VRAM in use, in bytes
+    vram_used: Optional[int]
+    #: Total VRAM, in bytes
+    vram_total: Optional[int]
+    #: Temperature of each sensor, in degrees Celsius, keyed by the sensor label, e.g. ``edge`` or ``junction``
+    temperatures: Dict[str, float]
+    #: Average board power, in watts
+    power_watts: Optional[float]
+    #: Current shader clock, in MHz
+    sclk_mhz: Optional[int]
+    #: Current memory clock, in MHz
+    mclk_mhz: Optional[int]
+
+
+def parse_dpm_clock(content: str) -> Optional[int]:
+    """
+    Parses a ``pp_dpm_*`` clock level table, which marks the current level with ``*``::
+
+        0: 500Mhz
+        1: 800Mhz *
+        2: 1000Mhz
+
+    :return: The current clock, in MHz
+    """
+    for line in content.splitlines():
+        if line.rstrip().endswith("*"):
+            value = line.split(":", 1)[-1].strip().rstrip("*").strip()
+            digits = value.lower().rstrip("mhz").strip()
+            if digits.isnumeric():
+                return int(digits)
+    return None
+
+
+def _open_optional(path: str) -> Optional[SysfsAttribute]:
+    try:
+        return SysfsAttribute(path)
+    except OSError:
+        # Attributes depend on the GPU generation and the kernel version
+        return None
+
+
+class _AMDGPUCard:
+    """The attribute handles of one GPU, resolved once."""
+
+    def __init__(self, slot: str, device_path: str):
+        self.slot = slot
+        self.attributes: Dict[str, Optional[SysfsAttribute]] = {
+            name: _open_optional(os.path.join(device_path, name)) for name in _DEVICE_ATTRIBUTES
+        }
+        # (label, handle) for each temperature sensor
+        self.temperatures: List[Tuple[str, SysfsAttribute]] = []
+        self.power: Optional[SysfsAttribute] = None
+
+        hwmon_root = os.path.join(device_path, "hwmon")
+        try:
+            hwmon_dirs = sorted(os.listdir(hwmon_root))
+        except OSError:
+            hwmon_dirs = []
+
+        for hwmon in hwmon_dirs:
+            hwmon_path = os.path.join(hwmon_root, hwmon)
+            try:
+                entries = sorted(os.listdir(hwmon_path))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.startswith("temp") and entry.endswith("_input"):
+                    handle = _open_optional(os.path.join(hwmon_path, entry))
+                    if handle is None:
+                        continue
+                    sensor = entry[:-len("_input")]
+                    label = sensor
+                    try:
+                        with open(os.path.join(hwmon_path, f"{sensor}_label")) as f:
+                            label = f.read().strip() or sensor
+                    except OSError:
+                        pass
+                    self.temperatures.append((label, handle))
+
+            if self.power is None:
+                # Older kernels report power1_average, newer ones may only have power1_input
+                self.power = (_open_optional(os.path.join(hwmon_path, "power1_average"))
+                              or _open_optional(os.path.join(hwmon_path, "power1_input")))
+
+    def _read_int(self, name: str) -> Optional[int]:
+        handle = self.attributes.get(name)
+        if handle is None:
+            return None
+        try:
+            return handle.read_int()
+        except (OSError, ValueError):
+            # e.g. EBUSY while the GPU is in runtime suspend
+            return None
+
+    def _read_clock(self, name: str) -> Optional[int]:
+        handle = self.attributes.get(name)
+        if handle is None:
+            return None
+        try:
+            return parse_dpm_clock(handle.read())
+        except OSError:
+            return None
+
+    def sample(self) -> AMDGPUSample:
+        temperatures = {}
+        for label, handle in self.temperatures:
+            try:
+                # Reported in millidegrees Celsius
+                temperatures[label] = handle.read_int() / 1000
+            except (OSError, ValueError):
+                continue
+
+        power_watts = None
+        if self.power is not None:
+            try:
+                # Reported in microwatts
+                power_watts = self.power.read_int() / 1_000_000
+            except (OSError, ValueError):
+                pass
+
+        return AMDGPUSample(
+            slot=self.slot,
+            timestamp=time.monotonic(),
+            busy_percent=self._read_int("gpu_busy_percent"),
+            vram_used=self._read_int("mem_info_vram_used"),
+            vram_total=self._read_int("mem_info_vram_total"),
+            temperatures=temperatures,
+            power_watts=power_watts,
+            sclk_mhz=self._read_clock("pp_dpm_sclk"),
+            mclk_mhz=self._read_clock("pp_dpm_mclk"),
+        )
+
+    def close(self) -> None:
+        handles = list(self.attributes.values()) + [h for _, h in self.temperatures] + [self.power]
+        for handle in handles:
+            if handle is not None:
+                handle.close()
+
+
+class AMDGPUSampler:
+    """
+    Samples live telemetry of every GPU driven by ``amdgpu``.
+
+    The cards and their sysfs attributes are found once, when the sampler is created,
+    and the attributes are kept open. Each ``sample()`` only re-reads them.
+    Create a new sampler if GPUs are added or removed.
+    """
+
+    def __init__(self, root: str = PCI_ROOT_PATH):
+        self._cards: List[_AMDGPUCard] = []
+
+        try:
+            devices = sorted(os.listdir(root))
+        except OSError:
+            devices = []
+
+        for device in devices:
+            device_path = os.path.join(root, device)
+            try:
+                with open(os.path.join(device_path, "vendor")) as f:
+                    if f.read().strip().lower() != AMD_VENDOR_ID:
+                        continue
+            except OSError:
+                continue
+
+            # Only present when the amdgpu driver is bound to the device
+            if not os.path.exists(os.path.join(device_path, "mem_info_vram_total")):
+                continue
+
+            self._cards.append(_AMDGPUCard(device, device_path))
+
+    @property
+    def slots(self) -> List[str]:
+        """:return: PCI addresses of the sampled GPUs"""
+        return [card.slot for card in self._cards]
+
+    def sample(self) -> List[AMDGPUSample]:
+        """:return: One sample per GPU"""
+        return [card.sample() for card in self._cards]
+
+    def close(self) -> None:
+        for card in self._cards:
+            card.close()
+        self._cards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,161 @@
+import os
+from typing import Dict, List, Optional
+
+from pysysinfo.dumps.linux.common import list_optional, read_optional, read_sysfs
+from pysysinfo.models.size_models import Megabyte
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.storage_models import BlockDevice
+
+BLOCK_CLASS_PATH = "/sys/class/block/"
+
+# Name prefix -> kind, for virtual devices that are not told apart by their sysfs attributes
+_KIND_PREFIXES = [
+    ("loop", "loop"),
+    ("zram", "zram"),
+    ("nbd", "nbd"),
+    ("sr", "rom"),
+]
+
+
+def _read_device(entry: os.DirEntry) -> BlockDevice:
+    """
+    :raises OSError: If the device number can not be read
+    """
+    path = entry.path
+    device = BlockDevice(name=entry.name, dev=read_sysfs(os.path.join(path, "dev")), kind="disk")
+
+    if (size := read_optional(os.path.join(path, "size"))) is not None and size.isnumeric():
+        # The size is always in 512-byte sectors, regardless of the logical block size
+        device.size = Megabyte(capacity=int(size) * 512 // 1024 ** 2)
+
+    device.holders = list_optional(os.path.join(path, "holders"))
+    device.slaves = list_optional(os.path.join(path, "slaves"))
+
+    if (partition := read_optional(os.path.join(path, "partition"))) is not None:
+        device.kind = "partition"
+        device.partition_number = int(partition) if partition.isnumeric() else None
+        # Partitions are nested in the directory of their disk, e.g. .../block/sda/sda1
+        device.parent = os.path.basename(os.path.dirname(os.readlink(path))) if entry.is_symlink() else None
+    elif entry.name.startswith("dm-"):
+        device.dm_name = read_optional(os.path.join(path, "dm", "name"))
+        uuid = read_optional(os.path.join(path, "dm", "uuid")) or ""
+        device.kind = "lvm" if uuid.startswith("LVM-") else "dm"
+    elif entry.name.startswith("md"):
+        device.kind = "md"
+        device.md_level = read_optional(os.path.join(path, "md", "level"))
+    else:
+        for prefix, kind in _KIND_PREFIXES:
+            if entry.name.startswith(prefix):
+                device.kind = kind
+                break
+
+    return device
+
+
+class BlockGraph:
+    """
+    Every block device and how they are stacked, e.g. an LVM volume on an MD RAID of two disk partitions.
+    Devices are indexed by name and by device number.
+    """
+
+    def __init__(self, devices: List[BlockDevice]):
+        self.devices = devices
+        self.by_name: Dict[str, BlockDevice] = {device.name: device for device in devices}
+        self.by_dev: Dict[str, BlockDevice] = {device.dev: device for device in devices}
+        # Partitions are not listed as holders of their disk
+        self._partitions: Dict[str, List[str]] = {}
+        for device in devices:
+            if device.parent:
+                self._partitions.setdefault(device.parent, []).append(device.name)
+        self._disks_cache: Dict[str, List[str]] = {}
+
+    def get(self, name: str) -> Optional[BlockDevice]:
+        return self.by_name.get(name)
+
+    def get_by_dev(self, dev: str) -> Optional[BlockDevice]:
+        """:param dev: Device number, e.g. ``253:0``"""
+        return self.by_dev.get(dev)
+
+    def lower(self, name: str) -> List[str]:
+        """:return: Devices directly below ``name``: its slaves, and the disk of a partition"""
+        device = self.by_name.get(name)
+        if device is None:
+            return []
+        lower = list(device.slaves)
+        if device.parent:
+            lower.append(device.parent)
+        return lower
+
+    def physical_disks(self, name: str) -> List[str]:
+        """
+        :return: The disks that ultimately back ``name``, e.g. ``["sda", "sdb"]`` for an LVM volume
+                 on a RAID1 of ``sda2`` and ``sdb2``. A disk is backed by itself.
+        """
+        if name in self._disks_cache:
+            return self._disks_cache[name]
+
+        disks = set()
+        seen = {name}
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            if current in self._disks_cache:
+                disks.update(self._disks_cache[current])
+                continue
+            lower = self.lower(current)
+            if not lower and current in self.by_name:
+                disks.add(current)
+            for below in lower:
+                if below not in seen:
+                    seen.add(below)
+                    stack.append(below)
+
+        result = sorted(disks)
+        self._disks_cache[name] = result
+        return result
+
+    def upper(self, name: str) -> List[str]:
+        """:return: Every device stacked on top of ``name``, directly or indirectly"""
+        found = []
+        seen = {name}
+        stack = [name]
+        while stack:
+            device = self.by_name.get(stack.pop())
+            if device is None:
+                continue
+            children = device.holders + self._partitions.get(device.name, [])
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    found.append(child)
+                    stack.append(child)
+        return found
+
+
+def fetch_block_graph(root: str = BLOCK_CLASS_PATH, status: Optional[Status] = None) -> BlockGraph:
+    """
+    Reads every block device in one pass over ``/sys/class/block``: disks, partitions, device-mapper
+    (including LVM), MD RAID, loop and zram devices.
+
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+
+    if not os.path.isdir(root):
+        status.type = StatusType.FAILED
+        status.messages.append(f"The {root} directory does not exist")
+        return BlockGraph([])
+
+    devices = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                devices.append(_read_device(entry))
+            except OSError as e:
+                # The device may have been removed while we were reading it
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not read block device {entry.name}: {e}")
+
+    devices.sort(key=lambda device: device.name)
+    return BlockGraph(devices)
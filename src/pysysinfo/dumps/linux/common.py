@@ -1,40 +1,167 @@
 # Source: https://github.com/KernelWanderers/OCSysInfo/blob/main/src/util/pci_root.py
+import os
+import re
+from typing import Dict, List, Optional
 
+from pysysinfo.util.command import STATIC_TTL, default_runner
+from pysysinfo.util.deadline import Deadline
 
-def pci_path_linux(device_slot: str):
+# The active scheduler is in brackets, e.g. "none [mq-deadline] kyber"
+_ACTIVE_SCHEDULER = re.compile(r"\[([^]]+)]")
+
+_CPU_DIRECTORY = re.compile(r"^cpu(\d+)$")
+
+_DIGITS = re.compile(r"(\d+)")
+
+PCI_SLOT_PATTERN = re.compile(r"^[0-9a-fA-F]{4,}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-7]$")
+
+
+PCI_DEVICES_PATH = "/sys/bus/pci/devices/"
+
+#: Transfer rate of each PCIe generation, as the kernel prints it in ``current_link_speed``, e.g. ``16.0 GT/s PCIe``
+PCIE_SPEED_TO_GEN: Dict[str, int] = {
+    "2.5": 1,
+    "5.0": 2,
+    "8.0": 3,
+    "16.0": 4,
+    "32.0": 5,
+    "64.0": 6,
+}
+
+# Older kernels print whole rates without a decimal, e.g. "5 GT/s" and "8 GT/s"
+_LINK_SPEED = re.compile(r"^\s*(\d+(?:\.\d+)?) GT/s")
+
+
+def parse_link_speed(raw_speed: str) -> Optional[float]:
     """
-    :param device_slot: format: <domain>:<bus>:<slot>.<function>
-    :return: PCI Path
+    :param raw_speed: e.g. ``8.0 GT/s PCIe``
+    :return: The transfer rate in GT/s, or ``None`` if it is unknown, e.g. ``Unknown``
     """
+    match = _LINK_SPEED.match(raw_speed)
+    return float(match.group(1)) if match else None
 
-    # Construct PCI path
-    # E.g: PciRoot(0x0)/Pci(0x2,0x0)
-    try:
-        domain = int(device_slot.split(":")[0], 16)
-        pci_path = f"PciRoot({hex(domain)})"
-    except (IndexError, ValueError):
-        return None
 
-    # Collect path components (current device and parents)
-    paths = []
+def pcie_gen_from_speed(raw_speed: str) -> Optional[int]:
+    """
+    :param raw_speed: e.g. ``8.0 GT/s PCIe``
+    :return: The PCIe generation, e.g. ``3``, or ``None`` if the speed is not a known generation
+    """
+    speed = parse_link_speed(raw_speed)
+    # Normalized to the form of the keys, e.g. "5" to "5.0"
+    return None if speed is None else PCIE_SPEED_TO_GEN.get(f"{speed:.1f}")
+
+
+class PCITopology:
+    """
+    Where each PCI function sits in the bus hierarchy.
+
+    Each ``/sys/bus/pci/devices/<slot>`` symlink is resolved once, to e.g.
+    ``/sys/devices/pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:00.0``, which lists every upstream bridge.
+    Paths are memoized, so the path of a device reuses the path of its bridge.
+    A device that was hotplugged after the topology was read is resolved when it is first looked up.
+    """
+
+    def __init__(self, root: str = PCI_DEVICES_PATH):
+        self.root = root
+        # slot -> upstream bridge, or None for a function on a root bus
+        self._parents: Dict[str, Optional[str]] = {}
+        self._paths: Dict[str, str] = {}
+
+        try:
+            slots = os.listdir(root)
+        except OSError:
+            slots = []
+
+        for slot in slots:
+            self._resolve(slot)
+
+    def _resolve(self, slot: str) -> bool:
+        """
+        Records the upstream bridges of a device, from its symlink.
+
+        :return: Whether the device exists
+        """
+        link = os.path.join(self.root, slot)
+        if not os.path.exists(link):
+            return False
+        components = [c for c in os.path.realpath(link).split("/") if PCI_SLOT_PATTERN.match(c)]
+        if not components or components[-1] != slot:
+            return False
+        for index, component in enumerate(components):
+            self._parents[component] = components[index - 1] if index else None
+        return True
 
-    # Add current device
-    current_components = _get_address_components(device_slot)
-    if current_components:
-        paths.append(",".join(current_components))
+    @property
+    def slots(self) -> List[str]:
+        """:return: Every PCI function on the bus, in bus order"""
+        return sorted(self._parents)
 
-    # Find parent bridges
-    # Check if 'slot' is listed in the directory of other devices
-    parent_components = _get_address_components(device_slot)
-    if parent_components:
-        paths.append(",".join(parent_components))
+    def parent(self, device_slot: str) -> Optional[str]:
+        """:return: The bridge directly upstream of the device, or ``None`` if it is on a root bus or not found"""
+        return self._parents.get(device_slot)
 
-    # Sort paths and append to pci_path
-    # Note: Sorting logic preserved from original code
-    for comp in sorted(paths, reverse=True):
-        pci_path += f"/Pci({comp})"
+    def path(self, device_slot: str) -> Optional[str]:
+        """
+        :param device_slot: format: <domain>:<bus>:<slot>.<function>
+        :return: PCI Path, e.g. ``PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)``.
+                 If the device is not found, only the device itself is in the path.
+        """
+        if (path := self._paths.get(device_slot)) is not None:
+            return path
+        if device_slot not in self._parents and PCI_SLOT_PATTERN.match(device_slot):
+            # e.g. hotplugged since the topology was read
+            self._resolve(device_slot)
 
-    return pci_path
+        # Walk up to the first device whose path is known, or to the root bus
+        chain = [device_slot]
+        while (parent := self._parents.get(chain[-1])) is not None and parent not in self._paths:
+            chain.append(parent)
+
+        if parent is not None:
+            path = self._paths[parent]
+        else:
+            try:
+                path = f"PciRoot({hex(int(chain[-1].split(':')[0], 16))})"
+            except (IndexError, ValueError):
+                return None
+
+        for slot in reversed(chain):
+            components = _get_address_components(slot)
+            if components is None:
+                return None
+            path += f"/Pci({','.join(components)})"
+            if slot in self._parents:
+                self._paths[slot] = path
+
+        return path
+
+
+_topology: Optional[PCITopology] = None
+
+
+def pci_topology() -> PCITopology:
+    """:return: The PCI topology of this machine, which is read on first use"""
+    global _topology
+    if _topology is None:
+        _topology = PCITopology()
+    return _topology
+
+
+def invalidate_pci_topology() -> None:
+    """Reads the PCI topology again on next use, e.g. after a device was hotplugged"""
+    global _topology
+    _topology = None
+
+
+def pci_path_linux(device_slot: str):
+    """
+    :param device_slot: format: <domain>:<bus>:<slot>.<function>
+    :return: PCI Path
+    """
+
+    # Construct PCI path, with a component for each upstream bridge
+    # E.g: PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)
+    return pci_topology().path(device_slot)
 
 
 def _get_address_components(slot_name):
@@ -50,3 +177,173 @@ def _get_address_components(slot_name):
         return tuple(hex(int(n, 16)) for n in device_func.split("."))
     except (ValueError, IndexError, AttributeError):
         return None
+
+
+def pci_slot_from_path(device_path: str) -> Optional[str]:
+    """
+    :param device_path: Resolved sysfs path of a device, e.g. ``/sys/devices/pci0000:00/0000:00:04.0/virtio3``
+    :return: The closest PCI function that the device sits on, e.g. ``0000:00:04.0``,
+             or ``None`` if the device is not on the PCI bus
+    """
+    for component in reversed(device_path.split("/")):
+        if PCI_SLOT_PATTERN.match(component):
+            return component
+    return None
+
+
+def parse_scheduler(raw_scheduler: str) -> str:
+    """
+    :param raw_scheduler: Contents of ``queue/scheduler``, e.g. ``none [mq-deadline] kyber``
+    :return: The active scheduler, e.g. ``mq-deadline``
+    """
+    match = _ACTIVE_SCHEDULER.search(raw_scheduler)
+    return match.group(1) if match else raw_scheduler
+
+
+def parse_cpulist(cpulist: str) -> int:
+    """
+    :param cpulist: CPUs in the kernel's cpulist format, e.g. ``0-7,16-23``
+    :return: A bitmap where bit N is set if CPU N is listed
+    :raises ValueError: If the list is malformed
+    """
+    mask = 0
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(x) for x in part.split("-", 1))
+            mask |= ((1 << (end - start + 1)) - 1) << start
+        else:
+            mask |= 1 << int(part)
+    return mask
+
+
+def bitmap_cpus(mask: int) -> List[int]:
+    """:return: The CPUs set in a bitmap from ``parse_cpulist()``, in ascending order"""
+    cpus = []
+    while mask:
+        lowest = mask & -mask
+        cpus.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return cpus
+
+
+def format_cpulist(mask: int) -> str:
+    """:return: The CPUs set in a bitmap, in the kernel's cpulist format, e.g. ``0-7,16-23``"""
+    ranges = []
+    for cpu in bitmap_cpus(mask):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
+
+
+def online_cpus(root: str = "/sys/devices/system/cpu/") -> List[int]:
+    """
+    :return: The online CPUs, in ascending order
+    :raises OSError: If the CPUs can not be listed
+    """
+    try:
+        return bitmap_cpus(parse_cpulist(read_sysfs(os.path.join(root, "online"))))
+    except (OSError, ValueError):
+        return sorted(int(match.group(1)) for entry in os.listdir(root) if (match := _CPU_DIRECTORY.match(entry)))
+
+
+def lspci_device_info(device_slot: str, deadline: Optional[Deadline] = None) -> Dict[str, str]:
+    """
+    :param device_slot: format: <domain>:<bus>:<slot>.<function>
+    :param deadline: ``lspci`` is killed if it runs past this deadline
+    :return: The fields reported by ``lspci -vmm`` for the device, e.g. ``Vendor``, ``Device``, ``SVendor``
+    """
+    # lspci may not be available in some distros, in which case this raises
+    command = ["lspci", "-s", device_slot, "-vmm"]
+    lspci_output = default_runner.run(command, ttl=STATIC_TTL, deadline=deadline).stdout
+
+    data = {}
+    for line in lspci_output.splitlines():
+        if ":" in line:
+            key, value = line.split(':', maxsplit=1)
+            data[key.strip()] = value.strip()
+    return data
+
+
+def read_sysfs(path: str) -> str:
+    """
+    Reads a sysfs or procfs attribute with a single ``read()``, since they are at most a page long.
+    This skips the buffering layers of ``open()``, which adds up when reading many small attributes.
+
+    :raises OSError: If the attribute can not be read
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        return os.read(fd, 65536).decode("utf-8", errors="replace").strip()
+    finally:
+        os.close(fd)
+
+
+def read_optional(path: str) -> Optional[str]:
+    """:return: The attribute, as read by ``read_sysfs()``, or ``None`` if it can not be read, e.g. it does not exist"""
+    try:
+        return read_sysfs(path)
+    except OSError:
+        return None
+
+
+def read_int(path: str) -> Optional[int]:
+    """:return: The attribute as an integer, e.g. ``-1``, or ``None`` if it can not be read or is not an integer"""
+    value = read_optional(path)
+    return int(value) if value is not None and value.lstrip("-").isnumeric() else None
+
+
+def natural_key(name: str) -> list:
+    """Sort key which orders the numbers in names by value, so that e.g. ``nvme2`` comes before ``nvme10``"""
+    return [int(part) if part.isdigit() else part for part in _DIGITS.split(name)]
+
+
+def list_optional(path: str) -> List[str]:
+    """:return: The entries of a directory, in natural order, or an empty list if it can not be listed"""
+    try:
+        return sorted(os.listdir(path), key=natural_key)
+    except OSError:
+        return []
+
+
+class SysfsAttribute:
+    """
+    A sysfs attribute that is opened once and read many times.
+
+    sysfs regenerates an attribute's content on every read from offset 0, so ``pread()`` on a kept-open descriptor
+    returns fresh values without the path lookup and ``open()`` of each sample.
+    """
+
+    #: sysfs attributes are at most one page long
+    SIZE = 4096
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+
+    def read(self) -> str:
+        return os.pread(self._fd, self.SIZE, 0).decode("utf-8", errors="replace").strip()
+
+    def read_int(self) -> int:
+        return int(self.read())
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
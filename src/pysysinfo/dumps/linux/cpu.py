@@ -1,19 +1,29 @@
+import platform
 import re
 import subprocess
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
+from pysysinfo.dumps.linux.cpu_cache import fetch_caches
+from pysysinfo.dumps.linux.cpu_topology import fetch_core_clusters
 from pysysinfo.models.cpu_models import CPUInfo
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.codenames import default_codename_manager
+from pysysinfo.util.command import STATIC_TTL, default_runner
+from pysysinfo.util.deadline import Deadline
 
 
-def _arm_cpu_cores() -> Optional[int]:
+def _arm_cpu_cores(deadline: Optional[Deadline] = None) -> Optional[int]:
     try:
-        result = subprocess.run(["lscpu", "-p"], capture_output=True, text=True).stdout
+        command = ["lscpu", "-p"]
+        result = default_runner.run(command, ttl=STATIC_TTL, deadline=deadline).stdout
         lines = [x for x in result.splitlines() if not x.startswith("#")]
         # Format: CPU,Core,Socket,Node,,L1d,L1i,L2,L3
         core_ids = [x.split(",")[1] for x in lines]
         # The number of distinct Core IDs is the number of cores
         return len(set(core_ids))
+    except subprocess.TimeoutExpired:
+        # Reported by the caller, which knows that the probe timed out rather than failed
+        raise
     except Exception as e:
         return None
 
@@ -54,6 +64,17 @@ def _cpu_threads(raw_cpu_info: str) -> Optional[int]:
     except:
         return None
 
+def _x86_signature(cpu_lines: str) -> Optional[Tuple[str, int, int, Optional[int]]]:
+    """:return: The CPUID vendor, family, model and stepping, e.g. ``("GenuineIntel", 6, 183, 1)``"""
+    vendor = re.search(r"^vendor_id\s+:\s+(\S+)", cpu_lines, re.MULTILINE)
+    family = re.search(r"^cpu family\s+:\s+(\d+)", cpu_lines, re.MULTILINE)
+    # "model name" does not match, since only whitespace may come before the colon
+    model = re.search(r"^model\s+:\s+(\d+)", cpu_lines, re.MULTILINE)
+    stepping = re.search(r"^stepping\s+:\s+(\d+)", cpu_lines, re.MULTILINE)
+    if not (vendor and family and model):
+        return None
+    return vendor.group(1), int(family.group(1)), int(model.group(1)), int(stepping.group(1)) if stepping else None
+
 def _x86_flags(cpu_lines: str) -> Optional[List[str]]:
     flags_match = re.search(r"flags\s+:\s+(.+)", cpu_lines)
     if not flags_match:
@@ -66,7 +87,7 @@ def _x86_flags(cpu_lines: str) -> Optional[List[str]]:
     ]
     return flags
 
-def fetch_arm_cpu_info(raw_cpu_info: str) -> CPUInfo:
+def fetch_arm_cpu_info(raw_cpu_info: str, deadline: Optional[Deadline] = None) -> CPUInfo:
     cpu_info = CPUInfo()
 
     cpu_info.architecture = "ARM"
@@ -86,10 +107,19 @@ def fetch_arm_cpu_info(raw_cpu_info: str) -> CPUInfo:
         cpu_info.status.type = StatusType.PARTIAL
         cpu_info.status.messages.append("Could not find CPU threads")
 
-    cpu_info.cores = _arm_cpu_cores()
-    if not cpu_info.cores:
+    if deadline is not None and deadline.expired:
         cpu_info.status.type = StatusType.PARTIAL
-        cpu_info.status.messages.append("Could not find CPU cores")
+        cpu_info.status.messages.append("Could not find CPU cores: deadline exceeded before running lscpu")
+    else:
+        try:
+            cpu_info.cores = _arm_cpu_cores(deadline)
+        except subprocess.TimeoutExpired as e:
+            cpu_info.status.type = StatusType.PARTIAL
+            cpu_info.status.messages.append(f"Could not find CPU cores: {e}")
+        else:
+            if not cpu_info.cores:
+                cpu_info.status.type = StatusType.PARTIAL
+                cpu_info.status.messages.append("Could not find CPU cores")
 
     # nothing more can be retrieved from /proc/cpuinfo for ARM
     return cpu_info
@@ -141,10 +171,23 @@ def fetch_x86_cpu_info(raw_cpu_info: str) -> CPUInfo:
     # The number of CPU Threads is the number of times the processor data is enumerated.
     cpu_info.threads = len(info_lines)
 
+    if signature := _x86_signature(cpu_lines):
+        try:
+            codename = default_codename_manager.lookup(*signature)
+        except (OSError, ValueError) as e:
+            cpu_info.status.type = StatusType.PARTIAL
+            cpu_info.status.messages.append(f"Could not read the CPU codename index: {e}")
+            codename = None
+        # CPUs that are not in the index are left without a codename
+        if codename is not None:
+            cpu_info.codename = codename.codename
+            cpu_info.microarchitecture = codename.microarchitecture
+            cpu_info.generation = codename.generation
+
     return cpu_info
 
 
-def fetch_cpu_info() -> CPUInfo:
+def fetch_cpu_info(deadline: Optional[Deadline] = None) -> CPUInfo:
     cpu_info = CPUInfo()
 
     # todo: Check if any of the regexes may suffer from string having two `\t`s
@@ -161,11 +204,18 @@ def fetch_cpu_info() -> CPUInfo:
         cpu_info.status.messages.append("/proc/cpuinfo has no content")
         return cpu_info
 
-    architecture = subprocess.run(['uname', '-m'], capture_output=True, text=True)
-
-    if ("aarch64" in architecture.stdout) or ("arm" in architecture.stdout):
-        return fetch_arm_cpu_info(raw_cpu_info)
-
-    return fetch_x86_cpu_info(raw_cpu_info)
+    try:
+        command = ['uname', '-m']
+        machine = default_runner.run(command, ttl=STATIC_TTL, deadline=deadline).stdout
+    except Exception:
+        # uname is only used for the machine name, which the interpreter also knows
+        machine = platform.machine().lower()
+
+    if ("aarch64" in machine) or ("arm" in machine):
+        cpu_info = fetch_arm_cpu_info(raw_cpu_info, deadline)
+    else:
+        cpu_info = fetch_x86_cpu_info(raw_cpu_info)
 
-    # todo: get CPU codename from CodenameManager
+    cpu_info.caches = fetch_caches(status=cpu_info.status)
+    cpu_info.clusters = fetch_core_clusters(status=cpu_info.status)
+    return cpu_info
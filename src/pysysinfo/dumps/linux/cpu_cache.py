@@ -0,0 +1,93 @@
+import os
+import re
+from typing import Dict, Iterator, List, Optional
+
+from pysysinfo.dumps.linux.common import online_cpus, parse_cpulist, read_int, read_sysfs
+from pysysinfo.models.cpu_models import CacheInfo
+from pysysinfo.models.size_models import Kilobyte
+from pysysinfo.models.status_models import Status, StatusType
+
+CPU_ROOT_PATH = "/sys/devices/system/cpu/"
+
+_INDEX = re.compile(r"^index\d+$")
+_SIZE = re.compile(r"^(\d+)([KMG]?)$")
+_SIZE_UNITS = {"": 1 / 1024, "K": 1, "M": 1024, "G": 1024 ** 2}
+
+
+def _read_cache(index_path: str, shared_cpus: str, mask: int) -> CacheInfo:
+    cache = CacheInfo(level=int(read_sysfs(os.path.join(index_path, "level"))), cpus=shared_cpus)
+    cache._cpu_mask = mask
+
+    try:
+        cache.type = read_sysfs(os.path.join(index_path, "type"))
+    except OSError:
+        pass
+
+    try:
+        # e.g. "32K" or "32768K"
+        if match := _SIZE.match(read_sysfs(os.path.join(index_path, "size"))):
+            cache.size = Kilobyte(capacity=int(int(match.group(1)) * _SIZE_UNITS[match.group(2)]))
+    except OSError:
+        pass
+
+    cache.ways = read_int(os.path.join(index_path, "ways_of_associativity"))
+    cache.line_size = read_int(os.path.join(index_path, "coherency_line_size"))
+    return cache
+
+
+def iter_caches(root: str = CPU_ROOT_PATH, status: Optional[Status] = None) -> Iterator[CacheInfo]:
+    """
+    Yields each cache instance once, however many CPUs share it.
+
+    A cache is only read through the first CPU that shares it. Once a CPU is known to share every
+    cache index of the CPUs before it, e.g. the sibling thread of a core, its cache directory is not read at all.
+    Nothing is yielded if the kernel does not report caches, e.g. in some virtual machines.
+
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+
+    try:
+        cpus = online_cpus(root)
+    except OSError:
+        return
+
+    # cache index -> bitmap of the CPUs whose cache at that index has been read
+    covered: Dict[str, int] = {}
+    for cpu in cpus:
+        bit = 1 << cpu
+        if covered and all(mask & bit for mask in covered.values()):
+            continue
+
+        cache_path = os.path.join(root, f"cpu{cpu}", "cache")
+        try:
+            indexes = sorted(entry for entry in os.listdir(cache_path) if _INDEX.match(entry))
+        except OSError:
+            continue
+
+        for index in indexes:
+            if covered.get(index, 0) & bit:
+                continue
+
+            index_path = os.path.join(cache_path, index)
+            try:
+                shared_cpus = read_sysfs(os.path.join(index_path, "shared_cpu_list"))
+                mask = parse_cpulist(shared_cpus) | bit
+                cache = _read_cache(index_path, shared_cpus, mask)
+            except (OSError, ValueError) as e:
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not read cache {index} of CPU {cpu}: {e}")
+                covered[index] = covered.get(index, 0) | bit
+                continue
+
+            covered[index] = covered.get(index, 0) | mask
+            yield cache
+
+
+def fetch_caches(root: str = CPU_ROOT_PATH, status: Optional[Status] = None) -> List[CacheInfo]:
+    """
+    :return: Every cache instance, ordered by level, and then by the first CPU that shares it
+    """
+    caches = list(iter_caches(root, status))
+    return sorted(caches, key=lambda cache: (cache.level, cache.type or "", cache.cpu_mask & -cache.cpu_mask))
@@ -0,0 +1,148 @@
+import os
+import re
+from typing import Dict, List, Optional
+
+from pysysinfo.dumps.linux.common import format_cpulist, online_cpus, parse_cpulist, read_int, read_sysfs
+from pysysinfo.models.cpu_models import CoreCluster
+from pysysinfo.models.status_models import Status, StatusType
+
+CPU_ROOT_PATH = "/sys/devices/system/cpu/"
+DEVICES_PATH = "/sys/devices/"
+
+# Hybrid Intel CPUs register a PMU for each core type, which lists the CPUs of that type
+_HYBRID_PMUS = (
+    ("cpu_core", "performance"),
+    ("cpu_atom", "efficiency"),
+)
+_POLICY = re.compile(r"^policy\d+$")
+
+
+def _lowest_cpu(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def _hybrid_groups(devices_path: str, online: int, status: Status) -> Dict[str, int]:
+    """:return: Core type -> CPUs, or nothing if the CPU is not a hybrid Intel CPU"""
+    groups = {}
+    for pmu, core_type in _HYBRID_PMUS:
+        path = os.path.join(devices_path, pmu, "cpus")
+        if not os.path.exists(path):
+            continue
+        try:
+            mask = parse_cpulist(read_sysfs(path)) & online
+        except (OSError, ValueError) as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not read the CPUs of {pmu}: {e}")
+            continue
+        if mask:
+            groups[core_type] = mask
+    return groups
+
+
+def _capacity_groups(root: str, online: int) -> Dict[Optional[int], int]:
+    """
+    :return: Capacity -> CPUs. The capacity is ``None`` if the kernel does not report it.
+
+    Every CPU of a cpufreq policy is the same kind of core, so only the first CPU of each policy is read.
+    """
+    groups: Dict[Optional[int], int] = {}
+    covered = 0
+
+    try:
+        policies = sorted(entry for entry in os.listdir(os.path.join(root, "cpufreq")) if _POLICY.match(entry))
+    except OSError:
+        policies = []
+
+    for policy in policies:
+        try:
+            related = parse_cpulist(read_sysfs(os.path.join(root, "cpufreq", policy, "related_cpus"))) & online
+        except (OSError, ValueError):
+            continue
+        if not related or related & covered:
+            continue
+        capacity = read_int(os.path.join(root, f"cpu{_lowest_cpu(related)}", "cpu_capacity"))
+        groups[capacity] = groups.get(capacity, 0) | related
+        covered |= related
+
+    remaining = online & ~covered
+    while remaining:
+        cpu = _lowest_cpu(remaining)
+        capacity = read_int(os.path.join(root, f"cpu{cpu}", "cpu_capacity"))
+        groups[capacity] = groups.get(capacity, 0) | (1 << cpu)
+        remaining &= remaining - 1
+
+    return groups
+
+
+def _count_cores(root: str, mask: int) -> Optional[int]:
+    """:return: The number of physical cores, reading the siblings of one thread per core"""
+    cores = 0
+    remaining = mask
+    while remaining:
+        cpu = _lowest_cpu(remaining)
+        try:
+            siblings = parse_cpulist(read_sysfs(os.path.join(root, f"cpu{cpu}", "topology", "thread_siblings_list")))
+        except (OSError, ValueError):
+            return None
+        cores += 1
+        remaining &= ~(siblings | (1 << cpu))
+    return cores
+
+
+def _build_cluster(root: str, mask: int, core_type: Optional[str]) -> CoreCluster:
+    first = _lowest_cpu(mask)
+    cluster = CoreCluster(
+        type=core_type,
+        cpus=format_cpulist(mask),
+        cores=_count_cores(root, mask),
+        threads=bin(mask).count("1"),
+        capacity=read_int(os.path.join(root, f"cpu{first}", "cpu_capacity")),
+    )
+    cluster._cpu_mask = mask
+    # In kHz
+    if (max_frequency := read_int(os.path.join(root, f"cpu{first}", "cpufreq", "cpuinfo_max_freq"))) is not None:
+        cluster.max_frequency = max_frequency // 1000
+    return cluster
+
+
+def fetch_core_clusters(
+        root: str = CPU_ROOT_PATH,
+        devices_path: str = DEVICES_PATH,
+        status: Optional[Status] = None,
+) -> List[CoreCluster]:
+    """
+    Groups the online CPUs into clusters of identical cores, fastest first.
+
+    Hybrid Intel CPUs (Alder Lake and later) are split into P-cores and E-cores by the PMU of each core type.
+    Other CPUs are split by the capacity that the kernel reports for each core, which tells apart
+    the clusters of a big.LITTLE ARM SoC. CPUs that do not report a capacity are treated as one cluster.
+
+    :param status: Errors encountered are recorded here
+    :return: The clusters, or nothing if the CPUs could not be listed
+    """
+    if status is None:
+        status = Status()
+
+    try:
+        online = sum(1 << cpu for cpu in online_cpus(root))
+    except OSError:
+        return []
+    if not online:
+        return []
+
+    hybrid = _hybrid_groups(devices_path, online, status)
+    if hybrid:
+        clusters = [_build_cluster(root, mask, core_type) for core_type, mask in hybrid.items()]
+        return sorted(clusters, key=lambda cluster: cluster.type != "performance")
+
+    groups = _capacity_groups(root, online)
+    clusters = [_build_cluster(root, mask, None) for mask in groups.values()]
+    clusters.sort(key=lambda cluster: (cluster.capacity or 0, cluster.max_frequency or 0), reverse=True)
+
+    if len(clusters) > 1:
+        for cluster in clusters[1:-1]:
+            cluster.type = "balanced"
+        clusters[0].type = "performance"
+        clusters[-1].type = "efficiency"
+
+    return clusters
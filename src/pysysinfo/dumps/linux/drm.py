@@ -0,0 +1,154 @@
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+from pysysinfo.dumps.linux.common import PCI_SLOT_PATTERN, read_optional
+from pysysinfo.models.gpu_models import DisplayOutput, GPUInfo
+
+DRM_ROOT_PATH = "/sys/class/drm/"
+DEV_DRI_PATH = "/dev/dri/"
+
+#: Drivers of cards that only drive displays, or are virtual. They are not GPUs, even if they have a render node.
+#: e.g. the boot framebuffer (simpledrm), USB display adapters (evdi for DisplayLink, udl, gud)
+#: and virtual displays (vkms, hyperv_drm).
+DISPLAY_ONLY_DRIVERS = frozenset({
+    "simpledrm", "ofdrm", "vesadrm", "efidrm",
+    "evdi", "udl", "gud", "gm12u320", "appletbdrm",
+    "vkms", "vgem", "hyperv_drm",
+})
+
+_CARD = re.compile(r"^card\d+$")
+_RENDER_NODE = re.compile(r"^renderD\d+$")
+# Connectors are named after their card, e.g. card0-HDMI-A-1
+_CONNECTOR = re.compile(r"^(card\d+)-(.+)$")
+
+
+class DRMCard(NamedTuple):
+    #: Name of the card, e.g. ``card0``
+    name: str
+    #: Resolved sysfs path of the device behind the card
+    device_path: str
+    #: PCI address of the device, or ``None`` for platform devices, e.g. on ARM SoCs
+    pci_slot: Optional[str]
+    #: Kernel driver bound to the device, e.g. ``amdgpu``
+    driver: Optional[str]
+    #: Render node, e.g. ``/dev/dri/renderD128``
+    render_node: Optional[str]
+    #: Display outputs of the card
+    outputs: List[DisplayOutput]
+    #: First device tree ``compatible`` string, e.g. ``arm,mali-bifrost``. Only for device tree platforms.
+    compatible: Optional[str]
+
+    @property
+    def is_gpu(self) -> bool:
+        """
+        :return: Whether the card can render. Display controllers, e.g. simpledrm or a DisplayLink adapter,
+            have no render node, or are driven by one of ``DISPLAY_ONLY_DRIVERS``.
+        """
+        return self.render_node is not None and self.driver not in DISPLAY_ONLY_DRIVERS
+
+    @property
+    def card_node(self) -> str:
+        """:return: Primary node, e.g. ``/dev/dri/card0``"""
+        return os.path.join(DEV_DRI_PATH, self.name)
+
+
+class DRMIndex:
+    """DRM cards, indexed by PCI address, card name and render node."""
+
+    def __init__(self, cards: List[DRMCard]):
+        self.cards = cards
+        self.by_slot: Dict[str, DRMCard] = {card.pci_slot: card for card in cards if card.pci_slot}
+        self.by_name: Dict[str, DRMCard] = {card.name: card for card in cards}
+        self.by_render_node: Dict[str, DRMCard] = {card.render_node: card for card in cards if card.render_node}
+
+    def render_node(self, pci_slot: str) -> Optional[str]:
+        """:return: The render node of the GPU at ``pci_slot``, e.g. ``/dev/dri/renderD128``"""
+        card = self.by_slot.get(pci_slot)
+        return card.render_node if card else None
+
+
+def _read_output(path: str, name: str) -> DisplayOutput:
+    status = read_optional(os.path.join(path, "status"))
+    enabled = read_optional(os.path.join(path, "enabled"))
+    return DisplayOutput(
+        name=name,
+        # `unknown` is reported by some drivers, e.g. for virtual outputs
+        connected={"connected": True, "disconnected": False}.get(status),
+        enabled={"enabled": True, "disabled": False}.get(enabled),
+    )
+
+
+def scan_drm(root: str = DRM_ROOT_PATH) -> DRMIndex:
+    """
+    Walks the DRM class directory once, and maps each card to its device, driver, render node and outputs.
+    Cards are found whether or not they are on the PCI bus.
+
+    :return: An empty index if DRM is not available
+    """
+    if not os.path.exists(root):
+        return DRMIndex([])
+
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return DRMIndex([])
+
+    render_nodes: Dict[str, str] = {}
+    outputs: Dict[str, List[DisplayOutput]] = {}
+    for entry in entries:
+        if _RENDER_NODE.match(entry):
+            # The render node shares its device with the card
+            device_path = os.path.realpath(os.path.join(root, entry, "device"))
+            render_nodes.setdefault(device_path, os.path.join(DEV_DRI_PATH, entry))
+        elif match := _CONNECTOR.match(entry):
+            card, connector = match.groups()
+            outputs.setdefault(card, []).append(_read_output(os.path.join(root, entry), connector))
+
+    cards = []
+    for entry in entries:
+        if not _CARD.match(entry):
+            continue
+
+        device_link = os.path.join(root, entry, "device")
+        if not os.path.exists(device_link):
+            # Virtual cards, e.g. vgem, have no device
+            continue
+        device_path = os.path.realpath(device_link)
+
+        device_name = os.path.basename(device_path)
+        driver_link = os.path.join(device_link, "driver")
+        driver = os.path.basename(os.path.realpath(driver_link)) if os.path.exists(driver_link) else None
+
+        compatible = read_optional(os.path.join(device_link, "of_node", "compatible"))
+        if compatible:
+            # The property is a list of NUL-separated strings, from most to least specific
+            compatible = compatible.split("\0", 1)[0]
+
+        cards.append(DRMCard(
+            name=entry,
+            device_path=device_path,
+            # A card may also be a USB display adapter, which only sits below a PCI USB controller
+            pci_slot=device_name if PCI_SLOT_PATTERN.match(device_name) else None,
+            driver=driver,
+            render_node=render_nodes.get(device_path),
+            outputs=outputs.get(entry, []),
+            compatible=compatible or None,
+        ))
+
+    return DRMIndex(cards)
+
+
+def populate_drm_info(gpu: GPUInfo, card: DRMCard) -> GPUInfo:
+    gpu.driver = card.driver
+    gpu.drm_card = card.card_node
+    gpu.render_node = card.render_node
+    gpu.outputs = list(card.outputs)
+    return gpu
+
+
+def drm_gpu_info(card: DRMCard) -> GPUInfo:
+    """:return: GPU info for a card that is not on the PCI bus, where DRM is the only source"""
+    gpu = GPUInfo()
+    gpu.name = card.compatible or card.driver
+    return populate_drm_info(gpu, card)
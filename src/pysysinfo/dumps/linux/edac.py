@@ -0,0 +1,168 @@
+import os
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pysysinfo.dumps.linux.common import SysfsAttribute, read_optional
+from pysysinfo.models.memory_models import MemoryModuleInfo
+from pysysinfo.models.status_models import Status, StatusType
+
+EDAC_ROOT_PATH = "/sys/devices/system/edac/mc/"
+
+_CONTROLLER = re.compile(r"^mc\d+$")
+_DIMM = re.compile(r"^(dimm|rank)\d+$")
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]")
+
+
+class EDACDimm(NamedTuple):
+    #: Memory controller, e.g. ``mc0``
+    controller: str
+    #: DIMM (or rank) within the controller, e.g. ``dimm3``
+    name: str
+    #: Label set by the driver or by ``edac-ctl``, e.g. ``P0_Node0_Channel1_Dimm0 DIMM_B1``
+    label: str
+    #: Errors corrected since boot
+    corrected: Optional[int]
+    #: Errors that could not be corrected since boot
+    uncorrected: Optional[int]
+
+
+def _read_count(path: str) -> Optional[int]:
+    value = read_optional(path)
+    return int(value) if value is not None and value.isnumeric() else None
+
+
+def _dimm_dirs(root: str) -> List[Tuple[str, str, str]]:
+    """:return: (controller, dimm, path) for every DIMM that EDAC reports"""
+    try:
+        controllers = sorted(c for c in os.listdir(root) if _CONTROLLER.match(c))
+    except OSError:
+        return []
+
+    dimms = []
+    for controller in controllers:
+        controller_path = os.path.join(root, controller)
+        try:
+            entries = sorted(os.listdir(controller_path))
+        except OSError:
+            continue
+        dimms.extend((controller, entry, os.path.join(controller_path, entry))
+                     for entry in entries if _DIMM.match(entry))
+    return dimms
+
+
+def iter_edac_dimms(root: str = EDAC_ROOT_PATH, status: Optional[Status] = None) -> Iterator[EDACDimm]:
+    """
+    Yields the error counters of each DIMM known to EDAC.
+    Nothing is yielded if no EDAC driver is loaded, which is the case on most machines without ECC memory.
+
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+
+    for controller, name, path in _dimm_dirs(root):
+        dimm = EDACDimm(
+            controller=controller,
+            name=name,
+            label=read_optional(os.path.join(path, "dimm_label")) or "",
+            corrected=_read_count(os.path.join(path, "dimm_ce_count")),
+            uncorrected=_read_count(os.path.join(path, "dimm_ue_count")),
+        )
+        if dimm.corrected is None and dimm.uncorrected is None:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not read EDAC error counts of {controller}/{name}")
+        yield dimm
+
+
+class EDACPoller:
+    """
+    Re-reads only the EDAC error counter files.
+
+    The DIMMs and their labels are found once, and the counter files are kept open,
+    so a poll is two ``pread()`` calls per DIMM. Create a new poller after memory hotplug.
+    """
+
+    def __init__(self, root: str = EDAC_ROOT_PATH):
+        # (dimm with its static fields, corrected counter, uncorrected counter)
+        self._dimms: List[Tuple[EDACDimm, Optional[SysfsAttribute], Optional[SysfsAttribute]]] = []
+        for controller, name, path in _dimm_dirs(root):
+            dimm = EDACDimm(controller, name, read_optional(os.path.join(path, "dimm_label")) or "", None, None)
+            self._dimms.append((dimm, _open_counter(os.path.join(path, "dimm_ce_count")),
+                                _open_counter(os.path.join(path, "dimm_ue_count"))))
+
+    def poll(self) -> List[EDACDimm]:
+        """:return: Every DIMM, with its current counters"""
+        return [
+            dimm._replace(corrected=_poll_counter(corrected), uncorrected=_poll_counter(uncorrected))
+            for dimm, corrected, uncorrected in self._dimms
+        ]
+
+    def close(self) -> None:
+        for _, corrected, uncorrected in self._dimms:
+            for counter in (corrected, uncorrected):
+                if counter is not None:
+                    counter.close()
+        self._dimms = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _open_counter(path: str) -> Optional[SysfsAttribute]:
+    try:
+        return SysfsAttribute(path)
+    except OSError:
+        return None
+
+
+def _poll_counter(counter: Optional[SysfsAttribute]) -> Optional[int]:
+    if counter is None:
+        return None
+    try:
+        return counter.read_int()
+    except (OSError, ValueError):
+        return None
+
+
+def _normalize(locator: str) -> str:
+    return _NON_ALPHANUMERIC.sub("", locator.lower())
+
+
+def _module_locators(module: MemoryModuleInfo) -> List[str]:
+    if module.slot is None or not module.slot.channel:
+        return []
+    # ghes_edac labels DIMMs as "<bank locator> <device locator>", other drivers are configured
+    # with the device locator by edac-ctl
+    locators = [module.slot.channel]
+    if module.slot.bank:
+        locators.insert(0, f"{module.slot.bank} {module.slot.channel}")
+    return [_normalize(locator) for locator in locators]
+
+
+def join_edac_to_modules(modules: List[MemoryModuleInfo], dimms: List[EDACDimm]) -> None:
+    """
+    Sets the error counters of each memory module whose SMBIOS locator matches an EDAC DIMM label.
+    Modules without a matching label are left unset, and so are modules whose locator matches the label
+    of DIMMs on several memory controllers, e.g. a ``DIMM_A1`` on each socket.
+    """
+    # Several controllers may use the same label, so every DIMM with a label is kept
+    by_label: Dict[str, List[EDACDimm]] = {}
+    for dimm in dimms:
+        if dimm.label:
+            by_label.setdefault(_normalize(dimm.label), []).append(dimm)
+
+    for module in modules:
+        for locator in _module_locators(module):
+            candidates = by_label.get(locator)
+            if not candidates:
+                # Labels may carry a prefix, e.g. "CPU0_DIMM_A1" for the locator "DIMM_A1"
+                candidates = [d for label, matches in by_label.items() if label.endswith(locator) for d in matches]
+            # Only an unambiguous match is used
+            dimm = candidates[0] if len(candidates) == 1 else None
+            if dimm is not None:
+                module.corrected_errors = dimm.corrected
+                module.uncorrected_errors = dimm.uncorrected
+                break
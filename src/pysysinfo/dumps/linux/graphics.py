@@ -1,12 +1,13 @@
 import glob
 import os
-import subprocess
-from typing import Optional
+from typing import Callable, Iterator, Optional, Set
 
-from pysysinfo.dumps.linux.common import pci_path_linux
+from pysysinfo.dumps.linux.common import lspci_device_info, pci_path_linux, pcie_gen_from_speed
+from pysysinfo.dumps.linux.drm import drm_gpu_info, populate_drm_info, scan_drm
 from pysysinfo.models.gpu_models import GPUInfo, GraphicsInfo
 from pysysinfo.models.size_models import Megabyte
-from pysysinfo.models.status_models import StatusType
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.util.deadline import Deadline
 from pysysinfo.util.nvidia import fetch_gpu_details_nvidia
 
 
@@ -42,23 +43,7 @@ def _pcie_gen(device) -> Optional[int]:
         with open(path, "r") as f:
             raw_speed = f.read().strip()  # e.g., "16.0 GT/s"
 
-        # Mapping Dictionary
-        speed_to_gen = {
-            "2.5 GT/s": 1,
-            "5.0 GT/s": 2,
-            "8.0 GT/s": 3,
-            "16.0 GT/s": 4,
-            "32.0 GT/s": 5,
-            "64.0 GT/s": 6
-        }
-
-        for k, v in speed_to_gen.items():
-            """ `8.0 GT/s PCIe` may be a possible candidate, so we dont use direct matching"""
-            if k in raw_speed:
-                return v
-
-        return None
-
+        return pcie_gen_from_speed(raw_speed)
     except Exception as e:
         return None
 
@@ -82,8 +67,8 @@ def _populate_amd_info(gpu: GPUInfo, device: str) -> GPUInfo:
         gpu.vram = Megabyte(capacity=vram_capacity)
     return gpu
 
-def _populate_nvidia_info(gpu: GPUInfo, device: str) -> GPUInfo:
-    gpu_name, pcie_width, pcie_gen, vram_total = fetch_gpu_details_nvidia(device)
+def _populate_nvidia_info(gpu: GPUInfo, device: str, deadline: Optional[Deadline] = None) -> GPUInfo:
+    gpu_name, pcie_width, pcie_gen, vram_total = fetch_gpu_details_nvidia(device, deadline)
     if gpu_name: gpu.name = gpu_name
     if pcie_width: gpu.pcie_width = pcie_width
     if pcie_gen: gpu.pcie_gen = pcie_gen
@@ -91,19 +76,9 @@ def _populate_nvidia_info(gpu: GPUInfo, device: str) -> GPUInfo:
 
     return gpu
 
-def _populate_lspci_info(gpu: GPUInfo, device: str) -> GPUInfo:
-    try:
-        lspci_output = subprocess.run(["lspci", "-s", device, "-vmm"], capture_output=True, text=True).stdout
-        # We gather all data here and parse whatever data we have. Subsystem data may not be returned.
-    except Exception as e:
-        # lspci may not be available in some distros
-        raise e
-
-    data = {}
-    for line in lspci_output.splitlines():
-        if ":" in line:
-            key, value = line.split(':', maxsplit=1)
-            data[key.strip()] = value.strip()
+def _populate_lspci_info(gpu: GPUInfo, device: str, deadline: Optional[Deadline] = None) -> GPUInfo:
+    # We gather all data here and parse whatever data we have. Subsystem data may not be returned.
+    data = lspci_device_info(device, deadline)
 
     gpu.manufacturer = data.get("Vendor")
     gpu.name = data.get("Device")
@@ -113,22 +88,82 @@ def _populate_lspci_info(gpu: GPUInfo, device: str) -> GPUInfo:
     return gpu
 
 
-def fetch_graphics_info() -> GraphicsInfo:
-    graphics_info = GraphicsInfo()
+# The GPUInfo fields that each probe fills in.
+# A probe is only run when at least one of its fields is requested.
+_PROBE_FIELDS = {
+    "device_id": {"device_id"},
+    "link_width": {"pcie_width"},
+    "acpi_path": {"acpi_path"},
+    "pci_path": {"pci_path"},
+    "pcie_gen": {"pcie_gen"},
+    "amd": {"vram"},
+    "nvidia": {"name", "pcie_width", "pcie_gen", "vram"},
+    "lspci": {"manufacturer", "name", "subsystem_manufacturer", "subsystem_model"},
+    "drm": {"driver", "drm_card", "render_node", "outputs"},
+}
 
-    if not os.path.exists(PCI_ROOT_PATH):
-        graphics_info.status.type = StatusType.FAILED
-        graphics_info.status.messages.append("/sys/bus/pci/devices/ not found")
-        return graphics_info
 
-    for device in os.listdir(PCI_ROOT_PATH):
+def _plan_probes(fields: Optional[Set[str]]) -> Set[str]:
+    """
+    :param fields: The GPUInfo fields requested by the caller. ``None`` requests every field.
+    :return: The names of the probes that need to be run
+    """
+    if fields is None:
+        return set(_PROBE_FIELDS)
+
+    unknown = set(fields) - set(GPUInfo.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown GPUInfo fields: {', '.join(sorted(unknown))}")
+
+    return {probe for probe, provided in _PROBE_FIELDS.items() if provided & set(fields)}
+
+
+def iter_gpus(
+        vendor_id: Optional[str] = None,
+        predicate: Optional[Callable[[GPUInfo], bool]] = None,
+        status: Optional[Status] = None,
+        fields: Optional[Set[str]] = None,
+        deadline: Optional[Deadline] = None,
+) -> Iterator[GPUInfo]:
+    """
+    Yields each GPU as soon as it is parsed.
+    PCI GPUs come first, followed by GPUs that only DRM knows about, e.g. the GPU of an ARM SoC.
+
+    :param vendor_id: Only yield GPUs with this PCI vendor id, e.g. ``0x10de``.
+                      Other GPUs are skipped before any external tools are run for them.
+    :param predicate: Only yield GPUs for which this returns ``True``
+    :param status: Errors encountered are recorded here
+    :param fields: Only collect these GPUInfo fields, e.g. ``{"vendor_id", "device_id", "vram"}``.
+                   Probes that do not provide any of them, such as ``lspci``, are skipped.
+                   ``vendor_id`` is always collected.
+    :param deadline: External tools that would run past this deadline are stopped,
+                     and the status becomes ``PARTIAL``
+    """
+    if status is None:
+        status = Status()
+
+    probes = _plan_probes(fields)
+
+    # Walking DRM is cheap, and it is the only way to find GPUs that are not on the PCI bus
+    drm = scan_drm()
+
+    if not os.path.exists(PCI_ROOT_PATH):
+        if not drm.cards:
+            status.type = StatusType.FAILED
+            status.messages.append("/sys/bus/pci/devices/ not found")
+            return
+        pci_devices = []
+    else:
+        pci_devices = os.listdir(PCI_ROOT_PATH)
+
+    for device in pci_devices:
         # print("Found device: ", device)
         try:
             if not _check_gpu_class(device):
                 continue
         except Exception as e:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not open file for {device}: {e}")
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not open file for {device}: {e}")
             continue
 
         gpu = GPUInfo()
@@ -137,51 +172,93 @@ def fetch_graphics_info() -> GraphicsInfo:
         try:
             with open(os.path.join(gpu_path, "vendor")) as f:
                 gpu.vendor_id = f.read().strip()
-            with open(os.path.join(gpu_path, "device")) as f:
-                gpu.device_id = f.read().strip()
-            with open(os.path.join(gpu_path, "current_link_width")) as f:
-                width = f.read().strip()
-            if width.isnumeric() and int(width) > 0:
-                gpu.pcie_width = int(width)
         except Exception as e:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not get GPU properties: {e}")
-        try:
-            with open(os.path.join(gpu_path, "firmware_node", "path")) as f:
-                acpi_path = f.read().strip()
-            gpu.acpi_path = acpi_path
-        except Exception as e:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not get ACPI path: {e}")
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get GPU properties: {e}")
+
+        if vendor_id is not None and (gpu.vendor_id or "").lower() != vendor_id.lower():
+            continue
+
         try:
-            pci_path = pci_path_linux(device)
-            gpu.pci_path = pci_path
+            if "device_id" in probes:
+                with open(os.path.join(gpu_path, "device")) as f:
+                    gpu.device_id = f.read().strip()
+            if "link_width" in probes:
+                with open(os.path.join(gpu_path, "current_link_width")) as f:
+                    width = f.read().strip()
+                if width.isnumeric() and int(width) > 0:
+                    gpu.pcie_width = int(width)
         except Exception as e:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not get PCI path: {e}")
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get GPU properties: {e}")
+
+        if "acpi_path" in probes:
+            try:
+                with open(os.path.join(gpu_path, "firmware_node", "path")) as f:
+                    acpi_path = f.read().strip()
+                gpu.acpi_path = acpi_path
+            except Exception as e:
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not get ACPI path: {e}")
+
+        if "pci_path" in probes:
+            try:
+                pci_path = pci_path_linux(device)
+                gpu.pci_path = pci_path
+            except Exception as e:
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not get PCI path: {e}")
 
-        if pcie_gen := _pcie_gen(device):
-            gpu.pcie_gen = pcie_gen
-        else:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not get PCI gen")
+        if "pcie_gen" in probes:
+            if pcie_gen := _pcie_gen(device):
+                gpu.pcie_gen = pcie_gen
+            else:
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not get PCI gen")
 
         if gpu.vendor_id == "0x1002":
-            gpu = _populate_amd_info(gpu, device)
+            if "amd" in probes:
+                gpu = _populate_amd_info(gpu, device)
         elif gpu.vendor_id and gpu.vendor_id.lower() == "0x10de":
             # get VRAM for Nvidia GPUs
+            if "nvidia" in probes:
+                try:
+                    gpu = _populate_nvidia_info(gpu, device, deadline)
+                except Exception as e:
+                    status.type = StatusType.PARTIAL
+                    status.messages.append(f"Could not get additional GPU info for NVIDIA GPU {device}: {e}")
+
+        if "lspci" in probes:
             try:
-                gpu = _populate_nvidia_info(gpu, device)
+                gpu = _populate_lspci_info(gpu, device, deadline)
             except Exception as e:
-                graphics_info.status.type = StatusType.PARTIAL
-                graphics_info.status.messages.append(f"Could not get additional GPU info for NVIDIA GPU {device}: {e}")
+                status.type = StatusType.PARTIAL
+                status.messages.append(f"Could not parse LSPCI output for GPU {device}: {e}")
 
-        try:
-            gpu = _populate_lspci_info(gpu, device)
-        except Exception as e:
-            graphics_info.status.type = StatusType.PARTIAL
-            graphics_info.status.messages.append(f"Could not parse LSPCI output for GPU {device}: {e}")
+        if "drm" in probes and device in drm.by_slot:
+            gpu = populate_drm_info(gpu, drm.by_slot[device])
+
+        if predicate is None or predicate(gpu):
+            yield gpu
+
+    if vendor_id is not None:
+        # GPUs without a PCI vendor id can not match
+        return
+
+    for card in drm.cards:
+        # PCI GPUs were reported above. Display-only cards, e.g. simpledrm on every UEFI desktop, are not GPUs.
+        if card.pci_slot is not None or not card.is_gpu:
+            continue
+        gpu = drm_gpu_info(card)
+        if predicate is None or predicate(gpu):
+            yield gpu
 
-        graphics_info.modules.append(gpu)
 
+def fetch_graphics_info(fields: Optional[Set[str]] = None, deadline: Optional[Deadline] = None) -> GraphicsInfo:
+    """
+    :param fields: Only collect these GPUInfo fields. ``None`` collects every field.
+    :param deadline: External tools that would run past this deadline are stopped
+    """
+    graphics_info = GraphicsInfo()
+    graphics_info.modules.extend(iter_gpus(status=graphics_info.status, fields=fields, deadline=deadline))
     return graphics_info
@@ -0,0 +1,132 @@
+import os
+import re
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from pysysinfo.dumps.linux.common import SysfsAttribute, natural_key, read_optional
+
+HWMON_CLASS_PATH = "/sys/class/hwmon/"
+
+_HWMON = re.compile(r"^hwmon\d+$")
+_INPUT = re.compile(r"^(temp|fan|power|in)(\d+)_input$")
+
+# Sensor type -> (kind, unit, divisor from the raw sysfs value to the unit)
+_SENSOR_TYPES = {
+    "temp": ("temperature", "°C", 1000),
+    "fan": ("fan", "RPM", 1),
+    "power": ("power", "W", 1_000_000),
+    "in": ("voltage", "V", 1000),
+}
+
+# A value is at most a few digits, so a short read is enough
+_READ_SIZE = 32
+
+
+class HwmonSensor(NamedTuple):
+    #: Driver of the chip, e.g. ``coretemp``, ``k10temp``, ``nvme`` or ``amdgpu``
+    chip: str
+    #: e.g. ``hwmon3``
+    hwmon: str
+    #: Device that the chip belongs to, e.g. ``0000:03:00.0`` or ``nvme0``, if any
+    device: Optional[str]
+    #: ``temperature``, ``fan``, ``power`` or ``voltage``
+    kind: str
+    #: e.g. ``Package id 0``, ``Composite`` or ``edge``. The attribute name, e.g. ``temp1``, if there is no label.
+    label: str
+    #: ``°C``, ``RPM``, ``W`` or ``V``
+    unit: str
+
+
+class HwmonSample(NamedTuple):
+    #: ``time.monotonic()`` when the sample was taken
+    timestamp: float
+    #: The value of each sensor, in the order of ``HwmonSampler.sensors``.
+    #: ``None`` if the sensor could not be read, e.g. an NVMe drive in a low power state.
+    values: List[Optional[float]]
+
+
+def _device_name(hwmon_path: str) -> Optional[str]:
+    device_path = os.path.join(hwmon_path, "device")
+    if not os.path.exists(device_path):
+        # Virtual chips, e.g. acpitz, are not attached to a device
+        return None
+    return os.path.basename(os.path.realpath(device_path))
+
+
+class HwmonSampler:
+    """
+    Samples every temperature, fan, power and voltage sensor that hwmon exposes,
+    e.g. for CPUs, GPUs and NVMe drives.
+
+    The sensors, their labels and their chips are found once, when the sampler is created,
+    and the value files are kept open. Each ``sample()`` is one ``pread()`` per sensor.
+    Create a new sampler if devices are added or removed.
+    """
+
+    def __init__(self, root: str = HWMON_CLASS_PATH):
+        self._sensors: List[HwmonSensor] = []
+        self._attributes: List[SysfsAttribute] = []
+        # (file descriptor, divisor) of each sensor, in the order of self._sensors
+        self._inputs: List[Tuple[int, int]] = []
+
+        try:
+            hwmons = sorted((entry for entry in os.listdir(root) if _HWMON.match(entry)), key=natural_key)
+        except OSError:
+            hwmons = []
+
+        for hwmon in hwmons:
+            hwmon_path = os.path.join(root, hwmon)
+            try:
+                entries = sorted(os.listdir(hwmon_path), key=natural_key)
+            except OSError:
+                continue
+
+            chip = read_optional(os.path.join(hwmon_path, "name")) or hwmon
+            device = _device_name(hwmon_path)
+
+            for entry in entries:
+                match = _INPUT.match(entry)
+                if match is None:
+                    continue
+                try:
+                    attribute = SysfsAttribute(os.path.join(hwmon_path, entry))
+                except OSError:
+                    continue
+
+                sensor_type = match.group(1)
+                kind, unit, divisor = _SENSOR_TYPES[sensor_type]
+                name = f"{sensor_type}{match.group(2)}"
+                label = read_optional(os.path.join(hwmon_path, f"{name}_label")) or name
+
+                self._sensors.append(HwmonSensor(chip, hwmon, device, kind, label, unit))
+                self._attributes.append(attribute)
+                self._inputs.append((attribute.fileno(), divisor))
+
+    @property
+    def sensors(self) -> List[HwmonSensor]:
+        """:return: Every sampled sensor. Values in a sample are in the same order."""
+        return list(self._sensors)
+
+    def sample(self) -> HwmonSample:
+        values: List[Optional[float]] = []
+        append = values.append
+        for fd, divisor in self._inputs:
+            try:
+                append(int(os.pread(fd, _READ_SIZE, 0)) / divisor)
+            except (OSError, ValueError):
+                # e.g. ENODATA from a sensor that is not ready, or EIO from a suspended device
+                append(None)
+        return HwmonSample(time.monotonic(), values)
+
+    def close(self) -> None:
+        for attribute in self._attributes:
+            attribute.close()
+        self._attributes = []
+        self._inputs = []
+        self._sensors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
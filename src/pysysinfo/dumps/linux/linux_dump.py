@@ -1,7 +1,11 @@
+from typing import Optional, Set
+
 from pysysinfo.dumps.linux.cpu import fetch_cpu_info
 from pysysinfo.dumps.linux.graphics import fetch_graphics_info
 from pysysinfo.dumps.linux.memory import fetch_memory_info
+from pysysinfo.dumps.linux.network import fetch_network_info
 from pysysinfo.dumps.linux.storage import fetch_storage_info
+from pysysinfo.dumps.linux.usb import fetch_usb_info
 from pysysinfo.models.gpu_models import GraphicsInfo
 from pysysinfo.models.info_models import (
     CPUInfo,
@@ -10,7 +14,10 @@ from pysysinfo.models.info_models import (
     LinuxHardwareInfo,
     MemoryInfo,
 )
+from pysysinfo.models.network_models import NetworkInfo
 from pysysinfo.models.storage_models import StorageInfo
+from pysysinfo.models.usb_models import USBInfo
+from pysysinfo.util.deadline import Deadline
 
 
 class LinuxHardwareManager(HardwareManagerInterface):
@@ -24,27 +31,41 @@ class LinuxHardwareManager(HardwareManagerInterface):
             memory=MemoryInfo(),
             storage=StorageInfo(),
             graphics=GraphicsInfo(),
+            network=NetworkInfo(),
+            usb=USBInfo(),
         )
 
-    def fetch_cpu_info(self) -> CPUInfo:
-        self.info.cpu = fetch_cpu_info()
+    def fetch_cpu_info(self, timeout: Optional[float] = None) -> CPUInfo:
+        self.info.cpu = fetch_cpu_info(Deadline(timeout))
         return self.info.cpu
 
     def fetch_memory_info(self) -> MemoryInfo:
         self.info.memory = fetch_memory_info()
         return self.info.memory
 
-    def fetch_storage_info(self) -> StorageInfo:
-        self.info.storage = fetch_storage_info()
+    def fetch_storage_info(self, timeout: Optional[float] = None) -> StorageInfo:
+        self.info.storage = fetch_storage_info(Deadline(timeout))
         return self.info.storage
 
-    def fetch_graphics_info(self) -> GraphicsInfo:
-        self.info.graphics = fetch_graphics_info()
+    def fetch_graphics_info(self, fields: Optional[Set[str]] = None, timeout: Optional[float] = None) -> GraphicsInfo:
+        self.info.graphics = fetch_graphics_info(fields, Deadline(timeout))
         return self.info.graphics
 
-    def fetch_hardware_info(self) -> HardwareInfo:
-        self.fetch_cpu_info()
+    def fetch_network_info(self, timeout: Optional[float] = None) -> NetworkInfo:
+        self.info.network = fetch_network_info(Deadline(timeout))
+        return self.info.network
+
+    def fetch_usb_info(self) -> USBInfo:
+        self.info.usb = fetch_usb_info()
+        return self.info.usb
+
+    def fetch_hardware_info(self, timeout: Optional[float] = None) -> HardwareInfo:
+        # Each component gets whatever is left of the overall budget
+        deadline = Deadline(timeout)
+        self.fetch_cpu_info(timeout=deadline.remaining())
         self.fetch_memory_info()
-        self.fetch_storage_info()
-        self.fetch_graphics_info()
+        self.fetch_storage_info(timeout=deadline.remaining())
+        self.fetch_graphics_info(timeout=deadline.remaining())
+        self.fetch_network_info(timeout=deadline.remaining())
+        self.fetch_usb_info()
         return self.info
@@ -1,10 +1,12 @@
 import os
-from typing import Optional, List
+from typing import Callable, Iterator, Optional, List
 
 from pysysinfo.dumps.linux.dmi_decode import get_string_entry, MEMORY_TYPE
+from pysysinfo.dumps.linux.edac import iter_edac_dimms, join_edac_to_modules
+from pysysinfo.dumps.linux.numa import iter_numa_nodes, map_modules_to_nodes
 from pysysinfo.models.memory_models import MemoryInfo, MemoryModuleSlot, MemoryModuleInfo
 from pysysinfo.models.size_models import Megabyte, Kilobyte, StorageSize
-from pysysinfo.models.status_models import StatusType
+from pysysinfo.models.status_models import Status, StatusType
 
 # Thank you to [Quist](https://github.com/nadiaholmquist) for helping with our understanding of this.
 
@@ -90,13 +92,23 @@ def _dimm_speed(value: bytes) -> Optional[int]:
         return ram_speed
     return None
 
-def fetch_memory_info() -> MemoryInfo:
-    memory_info = MemoryInfo()
+def iter_memory_modules(
+        predicate: Optional[Callable[[MemoryModuleInfo], bool]] = None,
+        status: Optional[Status] = None,
+) -> Iterator[MemoryModuleInfo]:
+    """
+    Yields each memory module as soon as its DMI entry is parsed.
+
+    :param predicate: Only yield modules for which this returns ``True``
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
 
     if not os.path.isdir("/sys/firmware/dmi/entries"):
-        memory_info.status.type = StatusType.FAILED
-        memory_info.status.messages.append("The /sys/firmware/dmi/entries directory doesn't exist")
-        return memory_info
+        status.type = StatusType.FAILED
+        status.messages.append("The /sys/firmware/dmi/entries directory doesn't exist")
+        return
 
     """
     DMI Documentation: 
@@ -118,13 +130,13 @@ def fetch_memory_info() -> MemoryInfo:
             with open(f"{parent_dir.path}/raw", "rb") as f:
                 value = f.read()
         except PermissionError:
-            memory_info.status.type = StatusType.FAILED
-            memory_info.status.messages.append("Unable to open /sys/firmware/dmi/entries. Are you root?")
-            return memory_info
+            status.type = StatusType.FAILED
+            status.messages.append("Unable to open /sys/firmware/dmi/entries. Are you root?")
+            return
 
         except Exception as e:
-            memory_info.status.type = StatusType.PARTIAL
-            memory_info.status.messages.append("Error Reading DMI Entries: " + str(e))
+            status.type = StatusType.PARTIAL
+            status.messages.append("Error Reading DMI Entries: " + str(e))
             continue
 
         try:
@@ -132,36 +144,56 @@ def fetch_memory_info() -> MemoryInfo:
             strings = value[length_field:len(value)].split(b'\0')
 
             module.part_number = _part_no(strings, value)
+            # Used to map the module to a NUMA node
+            module._array_handle = int.from_bytes(value[0x04:0x06], "little")
 
             if (t := _dimm_type(value)) is not None:
                 module.type = t
             else:
-                memory_info.status.type = StatusType.PARTIAL
-                memory_info.status.messages.append("Could not get DIMM Type")
+                status.type = StatusType.PARTIAL
+                status.messages.append("Could not get DIMM Type")
 
             if (slot := _dimm_slot(strings, value)) is not None:
                 module.slot = slot
             else:
-                memory_info.status.type = StatusType.PARTIAL
-                memory_info.status.messages.append("Could not get DIMM Location")
+                status.type = StatusType.PARTIAL
+                status.messages.append("Could not get DIMM Location")
 
             module.manufacturer = get_string_entry(strings, value[0x17])
             if not module.manufacturer:
-                memory_info.status.type = StatusType.PARTIAL
-                memory_info.status.messages.append("Could not get DIMM Manufacturer")
+                status.type = StatusType.PARTIAL
+                status.messages.append("Could not get DIMM Manufacturer")
 
             if (capacity := _dimm_capacity(value)) is not None:
                 module.capacity = capacity
             else:
-                memory_info.status.type = StatusType.PARTIAL
-                memory_info.status.messages.append("Could not get DIMM Capacity")
+                status.type = StatusType.PARTIAL
+                status.messages.append("Could not get DIMM Capacity")
 
             module.supports_ecc = _ecc_support(value)
             module.frequency_mhz = _dimm_speed(value)
 
-            memory_info.modules.append(module)
-
         except Exception as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append("Error while fetching Memory Info: " + str(e))
+            continue
+
+        if predicate is None or predicate(module):
+            yield module
+
+
+def fetch_memory_info() -> MemoryInfo:
+    memory_info = MemoryInfo()
+    memory_info.modules.extend(iter_memory_modules(status=memory_info.status))
+    modules_failed = memory_info.status.type == StatusType.FAILED
+
+    memory_info.numa_nodes.extend(iter_numa_nodes(status=memory_info.status))
+    if modules_failed:
+        if memory_info.numa_nodes:
+            # The NUMA nodes are still reported, so the memory info is incomplete rather than missing
             memory_info.status.type = StatusType.PARTIAL
-            memory_info.status.messages.append("Error while fetching Memory Info: " + str(e))
+        return memory_info
+
+    map_modules_to_nodes(memory_info.modules, memory_info.numa_nodes)
+    join_edac_to_modules(memory_info.modules, list(iter_edac_dimms(status=memory_info.status)))
     return memory_info
@@ -0,0 +1,193 @@
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+MEMINFO_PATH = "/proc/meminfo"
+VMSTAT_PATH = "/proc/vmstat"
+PSI_MEMORY_PATH = "/proc/pressure/memory"
+
+
+class MemoryPressureSample(NamedTuple):
+    #: ``time.monotonic()`` when the sample was taken
+    timestamp: float
+
+    # From /proc/meminfo, in kilobytes
+    mem_total_kb: Optional[int]
+    mem_free_kb: Optional[int]
+    mem_available_kb: Optional[int]
+    buffers_kb: Optional[int]
+    cached_kb: Optional[int]
+    swap_total_kb: Optional[int]
+    swap_free_kb: Optional[int]
+    dirty_kb: Optional[int]
+    writeback_kb: Optional[int]
+
+    # From /proc/vmstat. These are counters since boot.
+    pgmajfault: Optional[int]
+    pswpin: Optional[int]
+    pswpout: Optional[int]
+    pgscan_direct: Optional[int]
+    oom_kill: Optional[int]
+
+    # From /proc/pressure/memory. ``None`` if the kernel was built without PSI.
+    #: Percentage of time in which at least one task was stalled on memory, over the last 10 seconds
+    psi_some_avg10: Optional[float]
+    psi_some_avg60: Optional[float]
+    #: Total stall time, in microseconds
+    psi_some_total_us: Optional[int]
+    #: Percentage of time in which all non-idle tasks were stalled on memory, over the last 10 seconds
+    psi_full_avg10: Optional[float]
+    psi_full_avg60: Optional[float]
+    psi_full_total_us: Optional[int]
+
+
+# Line prefix -> position in MemoryPressureSample
+_MEMINFO_FIELDS = {
+    b"MemTotal:": 1,
+    b"MemFree:": 2,
+    b"MemAvailable:": 3,
+    b"Buffers:": 4,
+    b"Cached:": 5,
+    b"SwapTotal:": 6,
+    b"SwapFree:": 7,
+    b"Dirty:": 8,
+    b"Writeback:": 9,
+}
+
+# The trailing space keeps e.g. `pswpin` from matching a longer counter name
+_VMSTAT_FIELDS = {
+    b"pgmajfault ": 10,
+    b"pswpin ": 11,
+    b"pswpout ": 12,
+    b"pgscan_direct ": 13,
+    b"oom_kill ": 14,
+}
+
+_PSI_SOME = 15
+_PSI_FULL = 18
+
+_FIELD_COUNT = len(MemoryPressureSample._fields)
+
+
+class _ProcFile:
+    """
+    A /proc file of ``name value`` lines that is kept open, and re-read from offset 0 on every sample.
+
+    The line of each wanted field is found on the first read, and only those lines are parsed afterwards.
+    The order of the lines does not change while the kernel runs.
+    """
+
+    def __init__(self, path: str, fields: Dict[bytes, int]):
+        self.fields = fields
+        # (line index, prefix, position in the sample)
+        self._plan: List[Tuple[int, bytes, int]] = []
+        try:
+            self._fd: Optional[int] = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except OSError:
+            self._fd = None
+
+    def _learn(self, lines: List[bytes]) -> None:
+        self._plan = [
+            (index, prefix, position)
+            for index, line in enumerate(lines)
+            for prefix, position in self.fields.items()
+            if line.startswith(prefix)
+        ]
+
+    def read_into(self, buffer: bytearray, values: list) -> None:
+        if self._fd is None:
+            return
+
+        lines = _read(self._fd, buffer).split(b"\n")
+        plan = self._plan
+        if not plan or plan[-1][0] >= len(lines) or not lines[plan[0][0]].startswith(plan[0][1]):
+            self._learn(lines)
+            plan = self._plan
+
+        for index, prefix, position in plan:
+            line = lines[index]
+            if line.startswith(prefix):
+                values[position] = int(line.split()[1])
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _read(fd: int, buffer: bytearray) -> bytes:
+    # preadv() fills the preallocated buffer, and regenerates the /proc file from offset 0
+    size = os.preadv(fd, [buffer], 0)
+    if size == len(buffer):
+        # The file outgrew the buffer. This does not happen with the default size, but is handled anyway.
+        buffer.extend(bytes(len(buffer)))
+        return _read(fd, buffer)
+    return bytes(buffer[:size])
+
+
+def parse_psi_line(line: bytes) -> Tuple[float, float, int]:
+    """
+    Parses a PSI line, e.g. ``some avg10=0.12 avg60=0.05 avg300=0.01 total=123456``
+
+    :return: avg10, avg60, total
+    """
+    parts = line.split()
+    return float(parts[1][6:]), float(parts[2][6:]), int(parts[4][6:])
+
+
+class MemoryPressureSampler:
+    """
+    Samples memory usage and pressure from ``/proc/meminfo``, ``/proc/vmstat`` and ``/proc/pressure/memory``.
+
+    The files are kept open and read into one preallocated buffer, and each sample is a fixed-layout
+    ``MemoryPressureSample``, so sampling at 10 Hz or more costs little. DIMM inventory is in ``fetch_memory_info()``.
+    """
+
+    #: Size of the read buffer. /proc/vmstat, the largest of the files, is about 5 KB.
+    BUFFER_SIZE = 16384
+
+    def __init__(self, meminfo_path: str = MEMINFO_PATH, vmstat_path: str = VMSTAT_PATH,
+                 psi_path: str = PSI_MEMORY_PATH):
+        self._buffer = bytearray(self.BUFFER_SIZE)
+        self._meminfo = _ProcFile(meminfo_path, _MEMINFO_FIELDS)
+        self._vmstat = _ProcFile(vmstat_path, _VMSTAT_FIELDS)
+        try:
+            self._psi: Optional[int] = os.open(psi_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except OSError:
+            # PSI is not available on kernels older than 4.20, or when disabled with psi=0
+            self._psi = None
+
+    def _read_psi(self, values: list) -> None:
+        if self._psi is None:
+            return
+        try:
+            lines = _read(self._psi, self._buffer).split(b"\n")
+        except OSError:
+            # Reading fails with EOPNOTSUPP when PSI is disabled at runtime
+            return
+        for line in lines:
+            if line.startswith(b"some "):
+                values[_PSI_SOME:_PSI_SOME + 3] = parse_psi_line(line)
+            elif line.startswith(b"full "):
+                values[_PSI_FULL:_PSI_FULL + 3] = parse_psi_line(line)
+
+    def sample(self) -> MemoryPressureSample:
+        values: list = [None] * _FIELD_COUNT
+        values[0] = time.monotonic()
+        self._meminfo.read_into(self._buffer, values)
+        self._vmstat.read_into(self._buffer, values)
+        self._read_psi(values)
+        return MemoryPressureSample._make(values)
+
+    def close(self) -> None:
+        self._meminfo.close()
+        self._vmstat.close()
+        if self._psi is not None:
+            os.close(self._psi)
+            self._psi = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,255 @@
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, NamedTuple, Optional, Set, Union
+
+from pysysinfo.dumps.linux.block_graph import BlockGraph, fetch_block_graph
+from pysysinfo.models.size_models import Kilobyte
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.storage_models import VolumeInfo
+from pysysinfo.util.deadline import Deadline
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+#: Timeout, in seconds, for the ``statvfs()`` of a single mount
+STATVFS_TIMEOUT = 2.0
+
+#: Filesystems that do not store data, so have no meaningful capacity
+PSEUDO_FILESYSTEMS: FrozenSet[str] = frozenset({
+    "autofs", "binfmt_misc", "bpf", "cgroup", "cgroup2", "configfs", "debugfs", "devpts", "devtmpfs",
+    "efivarfs", "fusectl", "hugetlbfs", "mqueue", "nsfs", "proc", "pstore", "ramfs", "rpc_pipefs",
+    "securityfs", "selinuxfs", "sysfs", "tracefs",
+})
+
+# Mount points whose statvfs() has not returned yet, across every call of statvfs_many(). A call on a hung NFS
+# mount may never return, so the mount point is skipped until it does, rather than leaking a thread per refresh.
+_in_flight: Set[str] = set()
+_in_flight_lock = threading.Lock()
+
+# Spaces, tabs, newlines and backslashes in paths are escaped as octal, e.g. "\040"
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+class MountEntry(NamedTuple):
+    mount_id: int
+    #: Device number of the filesystem, e.g. ``8:1``
+    dev: str
+    mount_point: str
+    options: List[str]
+    fs_type: str
+    source: str
+
+
+def _unescape(value: str) -> str:
+    return _OCTAL_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), value)
+
+
+def parse_mountinfo(content: str) -> List[MountEntry]:
+    """
+    Parses ``/proc/<pid>/mountinfo``, whose lines look like
+    ``36 35 98:0 /mnt1 /mnt/parent rw,noatime master:1 - ext3 /dev/root rw,errors=continue``
+
+    The number of optional fields (``master:1``) varies, so the filesystem fields are found after the ``-``.
+    """
+    entries = []
+    for line in content.splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index("-", 6)
+        except ValueError:
+            continue
+        if len(fields) < separator + 3:
+            continue
+        entries.append(MountEntry(
+            mount_id=int(fields[0]),
+            dev=fields[2],
+            mount_point=_unescape(fields[4]),
+            options=fields[5].split(","),
+            fs_type=fields[separator + 1],
+            source=_unescape(fields[separator + 2]),
+        ))
+    return entries
+
+
+def statvfs_many(
+        paths: List[str],
+        timeout: float = STATVFS_TIMEOUT,
+        max_workers: int = 4,
+        deadline: Optional[Deadline] = None,
+) -> List[Union[os.statvfs_result, Exception]]:
+    """
+    Calls ``os.statvfs()`` on each path concurrently, on a small pool of threads.
+
+    ``statvfs()`` on an unreachable NFS server blocks and can not be interrupted. So, a path that takes longer
+    than ``timeout`` is given up on, its thread is abandoned, and a new thread takes over the remaining paths.
+    The threads are daemon threads, so an abandoned thread does not keep the interpreter from exiting.
+    Until an abandoned call returns, later calls skip its path, so each hung mount holds at most one thread.
+
+    :param timeout: Seconds that each path is given, from when its call starts
+    :param max_workers: Maximum number of calls in flight, not counting abandoned ones
+    :param deadline: Paths that have not finished when the deadline passes are given up on
+    :return: For each path, its result, or the exception that was raised. Paths that timed out, or whose call from
+             an earlier time has not returned yet, get a ``TimeoutError``.
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) != len(paths):
+        # e.g. a mount point that is mounted over. Each path is only called once.
+        by_path = dict(zip(unique, statvfs_many(unique, timeout, max_workers, deadline)))
+        return [by_path[path] for path in paths]
+
+    results: List[Union[os.statvfs_result, Exception, None]] = [None] * len(paths)
+    done = [False] * len(paths)
+    pending: Deque[int] = deque(range(len(paths)))
+    # index -> time.monotonic() when its call started
+    started: Dict[int, float] = {}
+    condition = threading.Condition()
+    remaining = len(paths)
+
+    def worker() -> None:
+        nonlocal remaining
+        while True:
+            with condition:
+                if not pending:
+                    return
+                index = pending.popleft()
+                started[index] = time.monotonic()
+            path = paths[index]
+            with _in_flight_lock:
+                hung = path in _in_flight
+                _in_flight.add(path)
+            if hung:
+                result = TimeoutError(f"statvfs({path}) from an earlier call has not returned yet")
+            else:
+                try:
+                    result = os.statvfs(path)
+                except OSError as e:
+                    result = e
+                finally:
+                    with _in_flight_lock:
+                        _in_flight.discard(path)
+            with condition:
+                if done[index]:
+                    # This call timed out, and this thread has already been replaced
+                    return
+                results[index] = result
+                done[index] = True
+                del started[index]
+                remaining -= 1
+                condition.notify_all()
+
+    def spawn() -> None:
+        threading.Thread(target=worker, name="pysysinfo-statvfs", daemon=True).start()
+
+    with condition:
+        for _ in range(min(max_workers, len(paths))):
+            spawn()
+
+        while remaining:
+            now = time.monotonic()
+            if deadline is not None and deadline.expired:
+                for index in range(len(paths)):
+                    if not done[index]:
+                        results[index] = TimeoutError(f"Deadline passed before statvfs({paths[index]}) finished")
+                        done[index] = True
+                pending.clear()
+                break
+
+            for index, start in list(started.items()):
+                if now - start >= timeout:
+                    results[index] = TimeoutError(f"statvfs({paths[index]}) took longer than {timeout}s")
+                    done[index] = True
+                    del started[index]
+                    remaining -= 1
+                    spawn()
+
+            waits = [start + timeout - now for start in started.values()]
+            if deadline is not None and deadline.remaining() is not None:
+                waits.append(deadline.remaining())
+            condition.wait(max(0.0, min(waits)) if waits else timeout)
+
+    return results
+
+
+def _lookup_device(entry: MountEntry, graph: BlockGraph):
+    device = graph.get_by_dev(entry.dev)
+    if device is None and entry.source.startswith("/dev/"):
+        # btrfs, and some others, report an anonymous device number, e.g. 0:35,
+        # so fall back to the device that was mounted
+        device = graph.get(os.path.basename(os.path.realpath(entry.source)))
+    return device
+
+
+def fetch_volumes(
+        mountinfo_path: str = MOUNTINFO_PATH,
+        skip_pseudo: bool = True,
+        pseudo_filesystems: FrozenSet[str] = PSEUDO_FILESYSTEMS,
+        graph: Optional[BlockGraph] = None,
+        timeout: float = STATVFS_TIMEOUT,
+        deadline: Optional[Deadline] = None,
+        status: Optional[Status] = None,
+) -> List[VolumeInfo]:
+    """
+    Lists every mounted filesystem, with its usage and the block devices beneath it.
+
+    :param mountinfo_path: The mount table, which is read once
+    :param skip_pseudo: Whether to skip filesystems in ``pseudo_filesystems``, e.g. ``proc`` and ``sysfs``
+    :param graph: The block device graph to join mounts to. It is read from sysfs if not given.
+    :param timeout: Seconds that the ``statvfs()`` of each mount is given, e.g. for a hung NFS mount
+    :param deadline: Mounts whose ``statvfs()`` has not finished when the deadline passes are left without usage
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+
+    def partial(message: str) -> None:
+        if status.type != StatusType.FAILED:
+            status.type = StatusType.PARTIAL
+        status.messages.append(message)
+
+    try:
+        with open(mountinfo_path, "r") as f:
+            entries = parse_mountinfo(f.read())
+    except OSError as e:
+        partial(f"Could not read {mountinfo_path}: {e}")
+        return []
+
+    if skip_pseudo:
+        entries = [entry for entry in entries if entry.fs_type not in pseudo_filesystems]
+
+    if graph is None:
+        # Mounts are still listed without the block graph, so its errors are not ours
+        graph = fetch_block_graph()
+
+    volumes = []
+    for entry, result in zip(entries, statvfs_many([e.mount_point for e in entries], timeout, deadline=deadline)):
+        volume = VolumeInfo(
+            mount_point=entry.mount_point,
+            source=entry.source,
+            fs_type=entry.fs_type,
+            dev=entry.dev,
+            read_only="ro" in entry.options,
+        )
+
+        if (device := _lookup_device(entry, graph)) is not None:
+            volume.block_device = device.name
+            volume.physical_disks = graph.physical_disks(device.name)
+
+        if isinstance(result, PermissionError):
+            # e.g. /run/user/<uid>/doc of another user. Its usage is unknown, which is not an error.
+            pass
+        elif isinstance(result, Exception):
+            partial(f"Could not get usage of {entry.mount_point}: {result}")
+        else:
+            volume.total_size = Kilobyte(capacity=result.f_blocks * result.f_frsize // 1024)
+            volume.free_size = Kilobyte(capacity=result.f_bfree * result.f_frsize // 1024)
+            volume.available_size = Kilobyte(capacity=result.f_bavail * result.f_frsize // 1024)
+            # Some filesystems, e.g. btrfs and vfat, do not have a fixed number of inodes, and report 0
+            if result.f_files:
+                volume.total_inodes = result.f_files
+                volume.free_inodes = result.f_ffree
+
+        volumes.append(volume)
+
+    return volumes
@@ -0,0 +1,107 @@
+import os
+from typing import Callable, Iterator, Optional
+
+from pysysinfo.dumps.linux.common import lspci_device_info, pci_path_linux, pci_slot_from_path
+from pysysinfo.models.network_models import NICInfo, NetworkInfo
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.util.deadline import Deadline
+
+NET_ROOT_PATH = "/sys/class/net/"
+PCI_ROOT_PATH = "/sys/bus/pci/devices/"
+
+
+def _nic_pci_slot(interface: str) -> Optional[str]:
+    """
+    Finds the PCI function that an interface belongs to.
+    Some drivers (e.g. virtio) put their own device between the interface and the PCI function,
+    so we walk up the device path until we find a PCI address.
+    """
+    return pci_slot_from_path(os.path.realpath(os.path.join(NET_ROOT_PATH, interface, "device")))
+
+
+def iter_nics(
+        vendor_id: Optional[str] = None,
+        predicate: Optional[Callable[[NICInfo], bool]] = None,
+        status: Optional[Status] = None,
+        deadline: Optional[Deadline] = None,
+) -> Iterator[NICInfo]:
+    """
+    Yields each physical network controller as soon as it is parsed.
+    Virtual interfaces, such as ``lo`` and bridges, are skipped.
+
+    :param vendor_id: Only yield NICs with this PCI vendor id, e.g. ``0x8086``.
+                      Other NICs are skipped before any external tools are run for them.
+    :param predicate: Only yield NICs for which this returns ``True``
+    :param status: Errors encountered are recorded here
+    :param deadline: External tools that would run past this deadline are stopped,
+                     and the status becomes ``PARTIAL``
+    """
+    if status is None:
+        status = Status()
+
+    if not os.path.isdir(NET_ROOT_PATH):
+        status.type = StatusType.FAILED
+        status.messages.append(f"The {NET_ROOT_PATH} directory does not exist")
+        return
+
+    seen_slots = set()
+    for interface in sorted(os.listdir(NET_ROOT_PATH)):
+        # Only physical interfaces have a backing device
+        if not os.path.exists(os.path.join(NET_ROOT_PATH, interface, "device")):
+            continue
+
+        slot = _nic_pci_slot(interface)
+        if slot is None or slot in seen_slots:
+            # Non-PCI NICs are not supported yet, and one PCI function may expose many interfaces
+            continue
+        seen_slots.add(slot)
+
+        nic = NICInfo()
+        nic_path = os.path.join(PCI_ROOT_PATH, slot)
+
+        try:
+            with open(os.path.join(nic_path, "vendor")) as f:
+                nic.vendor_id = f.read().strip()
+        except Exception as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get NIC properties for {interface}: {e}")
+
+        if vendor_id is not None and (nic.vendor_id or "").lower() != vendor_id.lower():
+            continue
+
+        try:
+            with open(os.path.join(nic_path, "device")) as f:
+                nic.device_id = f.read().strip()
+        except Exception as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get NIC properties for {interface}: {e}")
+
+        try:
+            with open(os.path.join(nic_path, "firmware_node", "path")) as f:
+                nic.acpi_path = f.read().strip()
+        except Exception:
+            # Many NICs, e.g. ones on add-in cards, have no ACPI node
+            pass
+
+        try:
+            nic.pci_path = pci_path_linux(slot)
+        except Exception as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get PCI path for {interface}: {e}")
+
+        try:
+            data = lspci_device_info(slot, deadline)
+            nic.manufacturer = data.get("Vendor")
+            nic.name = data.get("Device")
+        except Exception as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not parse LSPCI output for NIC {interface}: {e}")
+
+        if predicate is None or predicate(nic):
+            yield nic
+
+
+def fetch_network_info(deadline: Optional[Deadline] = None) -> NetworkInfo:
+    network_info = NetworkInfo()
+    network_info.modules.extend(iter_nics(status=network_info.status, deadline=deadline))
+    return network_info
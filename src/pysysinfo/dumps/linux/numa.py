@@ -0,0 +1,111 @@
+import os
+import re
+from typing import Dict, Iterator, List, Optional
+
+from pysysinfo.dumps.linux.common import parse_cpulist, read_sysfs
+from pysysinfo.models.memory_models import HugePageInfo, MemoryModuleInfo, NUMANodeInfo
+from pysysinfo.models.size_models import Kilobyte
+from pysysinfo.models.status_models import Status, StatusType
+
+NODE_ROOT_PATH = "/sys/devices/system/node/"
+
+_NODE = re.compile(r"^node(\d+)$")
+_HUGEPAGES = re.compile(r"^hugepages-(\d+)kB$")
+
+
+def parse_node_meminfo(content: str) -> Dict[str, int]:
+    """
+    Parses ``node*/meminfo``, whose lines look like ``Node 0 MemTotal:       32658704 kB``
+
+    :return: Field name -> value. Values in ``kB`` are in kilobytes, the rest are counts.
+    """
+    values = {}
+    for line in content.splitlines():
+        parts = line.split()
+        if len(parts) >= 4 and parts[3].isnumeric():
+            values[parts[2].rstrip(":")] = int(parts[3])
+    return values
+
+
+def _hugepages(node_path: str) -> List[HugePageInfo]:
+    hugepages_path = os.path.join(node_path, "hugepages")
+    try:
+        entries = os.listdir(hugepages_path)
+    except OSError:
+        # Hugepages are not supported by the kernel
+        return []
+
+    pools = []
+    for entry in entries:
+        if match := _HUGEPAGES.match(entry):
+            pool_path = os.path.join(hugepages_path, entry)
+            pools.append(HugePageInfo(
+                page_size=Kilobyte(capacity=int(match.group(1))),
+                total=int(read_sysfs(os.path.join(pool_path, "nr_hugepages"))),
+                free=int(read_sysfs(os.path.join(pool_path, "free_hugepages"))),
+                surplus=int(read_sysfs(os.path.join(pool_path, "surplus_hugepages"))),
+            ))
+    return sorted(pools, key=lambda pool: pool.page_size.capacity)
+
+
+def iter_numa_nodes(root: str = NODE_ROOT_PATH, status: Optional[Status] = None) -> Iterator[NUMANodeInfo]:
+    """
+    Yields each NUMA node, with its CPUs, memory usage, distances and hugepage pools.
+    Nothing is yielded if the kernel was built without NUMA support.
+
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+
+    if not os.path.isdir(root):
+        return
+
+    node_ids = sorted(int(match.group(1)) for entry in os.listdir(root) if (match := _NODE.match(entry)))
+
+    for node_id in node_ids:
+        node_path = os.path.join(root, f"node{node_id}")
+        node = NUMANodeInfo(id=node_id)
+
+        try:
+            node.cpus = read_sysfs(os.path.join(node_path, "cpulist"))
+            node._cpu_mask = parse_cpulist(node.cpus)
+
+            meminfo = parse_node_meminfo(read_sysfs(os.path.join(node_path, "meminfo")))
+            if "MemTotal" in meminfo:
+                node.total_memory = Kilobyte(capacity=meminfo["MemTotal"])
+            if "MemFree" in meminfo:
+                node.free_memory = Kilobyte(capacity=meminfo["MemFree"])
+
+            node.distances = [int(x) for x in read_sysfs(os.path.join(node_path, "distance")).split()]
+            node.hugepages = _hugepages(node_path)
+        except (OSError, ValueError) as e:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not get NUMA node {node_id} info: {e}")
+
+        yield node
+
+
+def map_modules_to_nodes(modules: List[MemoryModuleInfo], nodes: List[NUMANodeInfo]) -> None:
+    """
+    Sets the NUMA node of each memory module, where possible.
+
+    SMBIOS does not record NUMA nodes. However, each socket has its own Physical Memory Array,
+    and the arrays are listed in socket order. So, when every node with memory has exactly one populated array,
+    the arrays can be matched to the nodes in order. Otherwise, the nodes are left unset.
+    """
+    memory_nodes = [n.id for n in nodes if n.total_memory is not None and n.total_memory.capacity > 0]
+    populated = [m for m in modules if m.capacity is not None and m.capacity.capacity > 0]
+
+    if len(memory_nodes) == 1:
+        for module in populated:
+            module.numa_node = memory_nodes[0]
+        return
+
+    arrays = sorted({m._array_handle for m in populated if m._array_handle is not None})
+    if not arrays or len(arrays) != len(memory_nodes):
+        return
+
+    node_for_array = dict(zip(arrays, memory_nodes))
+    for module in populated:
+        module.numa_node = node_for_array.get(module._array_handle)
@@ -0,0 +1,128 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from pysysinfo.dumps.linux.common import list_optional, natural_key, parse_scheduler, read_int, read_optional
+from pysysinfo.models.size_models import Megabyte
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.storage_models import NVMeController, NVMeNamespace
+
+NVME_CLASS_PATH = "/sys/class/nvme/"
+NVME_SUBSYSTEM_PATH = "/sys/class/nvme-subsystem/"
+
+_CONTROLLER = re.compile(r"^nvme\d+$")
+_SUBSYSTEM = re.compile(r"^nvme-subsys\d+$")
+# The number after "n" is the instance of the namespace within its subsystem (or controller), not its NSID
+_NAMESPACE = re.compile(r"^nvme\d+n(\d+)$")
+# A path to a multipath namespace through one controller, e.g. nvme0c1n1. It is hidden from /dev.
+_MULTIPATH = re.compile(r"^nvme\d+c\d+n(\d+)$")
+
+
+def _read_namespace(name: str, path: str) -> NVMeNamespace:
+    namespace = NVMeNamespace(name=name, nsid=read_int(os.path.join(path, "nsid")))
+
+    if (size := read_int(os.path.join(path, "size"))) is not None:
+        # In 512-byte sectors, regardless of the logical block size
+        namespace.size = Megabyte(capacity=size * 512 // 1024 ** 2)
+
+    queue = os.path.join(path, "queue")
+    namespace.logical_block_size = read_int(os.path.join(queue, "logical_block_size"))
+    namespace.nr_requests = read_int(os.path.join(queue, "nr_requests"))
+    if (scheduler := read_optional(os.path.join(queue, "scheduler"))) is not None:
+        namespace.scheduler = parse_scheduler(scheduler)
+
+    return namespace
+
+
+def _scan_subsystems(root: str) -> Tuple[Dict[str, str], Dict[Tuple[str, str], Tuple[str, str]]]:
+    """
+    :return: controller -> subsystem, and (subsystem, namespace instance) -> (name, path)
+             for each multipath namespace
+    """
+    controller_subsystem = {}
+    heads = {}
+    for subsystem in list_optional(root):
+        if not _SUBSYSTEM.match(subsystem):
+            continue
+        subsystem_path = os.path.join(root, subsystem)
+        for entry in list_optional(subsystem_path):
+            if _CONTROLLER.match(entry):
+                controller_subsystem[entry] = subsystem
+            elif match := _NAMESPACE.match(entry):
+                heads[(subsystem, match.group(1))] = (entry, os.path.join(subsystem_path, entry))
+    return controller_subsystem, heads
+
+
+def fetch_nvme(
+        class_root: str = NVME_CLASS_PATH,
+        subsystem_root: str = NVME_SUBSYSTEM_PATH,
+        status: Optional[Status] = None,
+) -> Tuple[List[NVMeController], List[NVMeNamespace]]:
+    """
+    Reads every NVMe controller and namespace from sysfs, without ``nvme-cli``.
+    This covers PCIe controllers as well as NVMe-oF (TCP, RDMA, FC) controllers.
+
+    With native multipath, a namespace is reached through several controllers,
+    so it is listed once, with every controller that it is reached through.
+
+    :param status: Errors encountered are recorded here
+    :return: The controllers, and the namespaces
+    """
+    if status is None:
+        status = Status()
+
+    controller_subsystem, heads = _scan_subsystems(subsystem_root)
+
+    controllers = []
+    namespaces: Dict[str, NVMeNamespace] = {}
+
+    for name in list_optional(class_root):
+        if not _CONTROLLER.match(name):
+            continue
+
+        path = os.path.join(class_root, name)
+        controller = NVMeController(
+            name=name,
+            model=read_optional(os.path.join(path, "model")),
+            serial=read_optional(os.path.join(path, "serial")),
+            firmware_rev=read_optional(os.path.join(path, "firmware_rev")),
+            transport=read_optional(os.path.join(path, "transport")),
+            address=read_optional(os.path.join(path, "address")),
+            state=read_optional(os.path.join(path, "state")),
+            subsystem=controller_subsystem.get(name),
+            subsystem_nqn=read_optional(os.path.join(path, "subsysnqn")),
+        )
+        numa_node = read_int(os.path.join(path, "numa_node"))
+        # -1 means the controller is not attached to a NUMA node
+        controller.numa_node = numa_node if numa_node is not None and numa_node >= 0 else None
+
+        if controller.model is None:
+            status.type = StatusType.PARTIAL
+            status.messages.append(f"Could not read NVMe controller {name}")
+
+        for entry in list_optional(path):
+            if _NAMESPACE.match(entry):
+                namespace_name, namespace_path = entry, os.path.join(path, entry)
+            elif match := _MULTIPATH.match(entry):
+                head = heads.get((controller.subsystem, match.group(1)))
+                if head is None:
+                    status.type = StatusType.PARTIAL
+                    status.messages.append(f"Could not find the multipath namespace of {entry}")
+                    continue
+                namespace_name, namespace_path = head
+            else:
+                continue
+
+            if namespace_name not in namespaces:
+                namespaces[namespace_name] = _read_namespace(namespace_name, namespace_path)
+            namespaces[namespace_name].controllers.append(name)
+            controller.namespaces.append(namespace_name)
+
+        controllers.append(controller)
+
+    # Multipath namespaces whose paths are all down are still listed by their subsystem
+    for namespace_name, namespace_path in heads.values():
+        if namespace_name not in namespaces:
+            namespaces[namespace_name] = _read_namespace(namespace_name, namespace_path)
+
+    return controllers, sorted(namespaces.values(), key=lambda namespace: natural_key(namespace.name))
@@ -0,0 +1,158 @@
+import os
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from pysysinfo.dumps.linux.common import PCIE_SPEED_TO_GEN, PCITopology, parse_link_speed, pci_topology, read_optional
+from pysysinfo.models.status_models import Status, StatusType
+
+
+class PCIeLink(NamedTuple):
+    #: PCI function, e.g. ``0000:03:00.0``
+    slot: str
+    vendor_id: Optional[str]
+    device_id: Optional[str]
+    #: PCI class code, e.g. ``0x010802`` for an NVMe controller
+    class_code: Optional[str]
+    #: The bridge directly upstream
+    bridge: Optional[str]
+    #: Transfer rates, in GT/s
+    current_speed: Optional[float]
+    max_speed: Optional[float]
+    current_width: Optional[int]
+    max_width: Optional[int]
+    #: The function at the other end of the link: the bridge upstream,
+    #: or the device downstream for a root port or a switch downstream port
+    partner: Optional[str] = None
+    partner_max_speed: Optional[float] = None
+    partner_max_width: Optional[int] = None
+
+    @property
+    def current_gen(self) -> Optional[int]:
+        return _gen(self.current_speed)
+
+    @property
+    def max_gen(self) -> Optional[int]:
+        return _gen(self.max_speed)
+
+    @property
+    def supported_speed(self) -> Optional[float]:
+        """:return: The fastest speed that both ends of the link support, in GT/s"""
+        return _lower(self.max_speed, self.partner_max_speed)
+
+    @property
+    def supported_width(self) -> Optional[int]:
+        """:return: The widest width that both ends of the link support"""
+        return _lower(self.max_width, self.partner_max_width)
+
+    @property
+    def degraded(self) -> bool:
+        """
+        Whether the link trained below what both of its ends support, in speed or in width.
+        e.g. a Gen3 x4 device behind a Gen4 x16 root port is not degraded when the link trains at Gen3 x4.
+        Note that some GPUs lower their link speed when idle, to save power.
+        """
+        if None not in (self.current_speed, self.supported_speed) and self.current_speed < self.supported_speed:
+            return True
+        return None not in (self.current_width, self.supported_width) and self.current_width < self.supported_width
+
+
+def _lower(value, other):
+    # The lower of two values, either of which may be unknown
+    if value is None or other is None:
+        return value if other is None else other
+    return min(value, other)
+
+
+def _gen(speed: Optional[float]) -> Optional[int]:
+    return None if speed is None else PCIE_SPEED_TO_GEN.get(f"{speed:.1f}")
+
+
+def _width(raw_width: Optional[str]) -> Optional[int]:
+    # Functions without a trained link report a width of 0
+    if raw_width is None or not raw_width.isnumeric() or int(raw_width) == 0:
+        return None
+    return int(raw_width)
+
+
+def iter_pcie_links(
+        predicate: Optional[Callable[[PCIeLink], bool]] = None,
+        topology: Optional[PCITopology] = None,
+        status: Optional[Status] = None,
+) -> Iterator[PCIeLink]:
+    """
+    Yields the link of every PCI Express function on the bus, e.g. GPUs, NVMe controllers, NICs and bridges.
+    Functions without a link, such as conventional PCI devices, are skipped.
+
+    :param predicate: Only yield links for which this returns ``True``, e.g. ``lambda link: link.degraded``
+    :param topology: The PCI bus to read. The topology of this machine is used if not given.
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+    if topology is None:
+        topology = pci_topology()
+
+    if not topology.slots:
+        status.type = StatusType.FAILED
+        status.messages.append(f"No PCI devices found in {topology.root}")
+        return
+
+    # Every link is read first, since the maximum of a link depends on the function at its other end
+    links = {}
+    for slot in topology.slots:
+        path = os.path.join(topology.root, slot)
+        current_speed = read_optional(os.path.join(path, "current_link_speed"))
+        if current_speed is None:
+            continue
+
+        max_speed = read_optional(os.path.join(path, "max_link_speed"))
+        link = PCIeLink(
+            slot=slot,
+            vendor_id=read_optional(os.path.join(path, "vendor")),
+            device_id=read_optional(os.path.join(path, "device")),
+            class_code=read_optional(os.path.join(path, "class")),
+            bridge=topology.parent(slot),
+            current_speed=parse_link_speed(current_speed),
+            max_speed=parse_link_speed(max_speed) if max_speed is not None else None,
+            current_width=_width(read_optional(os.path.join(path, "current_link_width"))),
+            max_width=_width(read_optional(os.path.join(path, "max_link_width"))),
+        )
+
+        if link.current_speed is None and link.current_width is None:
+            # The link is down, or the function is not PCI Express
+            continue
+        links[slot] = link
+
+    children = {}
+    for slot, link in links.items():
+        if link.bridge is not None:
+            children.setdefault(link.bridge, []).append(slot)
+
+    for slot, link in links.items():
+        if _faces_downstream(slot, topology):
+            # Root ports and switch downstream ports train against the device behind them.
+            # Each function of a multi-function device shares the one link, so the first one stands for it.
+            partner = children[slot][0] if slot in children else None
+        else:
+            partner = link.bridge if link.bridge in links else None
+
+        if partner is not None:
+            link = link._replace(
+                partner=partner,
+                partner_max_speed=links[partner].max_speed,
+                partner_max_width=links[partner].max_width,
+            )
+
+        if predicate is None or predicate(link):
+            yield link
+
+
+def _faces_downstream(slot: str, topology: PCITopology) -> bool:
+    """
+    Whether the link of a function leads away from the root, as for root ports and switch downstream ports.
+    Facing alternates from the root bus: the device behind a root port faces upstream,
+    and if it is a switch, its downstream ports, which are behind it, face downstream again.
+    """
+    depth = 0
+    while (slot := topology.parent(slot)) is not None:
+        depth += 1
+    return depth % 2 == 0
@@ -0,0 +1,164 @@
+import os
+import re
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from pysysinfo.dumps.linux.common import SysfsAttribute, format_cpulist, natural_key, online_cpus, read_sysfs
+from pysysinfo.models.status_models import Status, StatusType
+
+POWERCAP_PATH = "/sys/class/powercap/"
+CPU_ROOT_PATH = "/sys/devices/system/cpu/"
+
+# e.g. intel-rapl:0 for a package, and intel-rapl:0:1 for a subdomain of it, such as DRAM.
+# AMD CPUs are exposed through the same driver. intel-rapl-mmio duplicates the package domains, so it is skipped.
+_ZONE = re.compile(r"^intel-rapl:(\d+)(?::(\d+))?$")
+# e.g. package-0, or package-0-die-1 on CPUs with several dies per package
+_PACKAGE_NAME = re.compile(r"^package-(\d+)")
+
+
+class RaplDomain(NamedTuple):
+    #: e.g. ``intel-rapl:0:1``
+    zone: str
+    #: ``package-0``, ``core``, ``uncore``, ``dram`` or ``psys``
+    name: str
+    #: ``physical_package_id`` of the CPUs in the package. ``None`` for domains that span packages, e.g. ``psys``.
+    package: Optional[int]
+    #: Online CPUs of the package, in the kernel's cpulist format, e.g. ``0-7,16-23``
+    cpus: Optional[str]
+    #: The energy counter wraps around to 0 after this value
+    max_energy_range_uj: int
+
+
+class RaplSample(NamedTuple):
+    #: ``time.monotonic()`` when the sample was taken
+    timestamp: float
+    #: The energy counter of each domain, in the order of ``RaplSampler.domains``.
+    #: ``None`` if the counter could not be read.
+    energy_uj: List[Optional[int]]
+
+
+def _package_cpus(cpu_root: str) -> Dict[int, str]:
+    """:return: physical_package_id -> online CPUs of the package"""
+    packages: Dict[int, int] = {}
+    try:
+        cpus = online_cpus(cpu_root)
+    except OSError:
+        return {}
+    for cpu in cpus:
+        try:
+            package = int(read_sysfs(os.path.join(cpu_root, f"cpu{cpu}", "topology", "physical_package_id")))
+        except (OSError, ValueError):
+            continue
+        packages[package] = packages.get(package, 0) | (1 << cpu)
+    return {package: format_cpulist(mask) for package, mask in packages.items()}
+
+
+class RaplSampler:
+    """
+    Samples the energy counters of RAPL (Running Average Power Limit) domains through powercap,
+    e.g. the energy used by each CPU package and its DRAM.
+
+    The domains are found once, when the sampler is created, and their ``energy_uj`` files are kept open.
+    Each ``sample()`` is one ``pread()`` per domain. Use ``energy()`` and ``power()`` between two samples,
+    which account for counters that wrapped around in between.
+
+    ``energy_uj`` is only readable by root on most kernels. Domains that could not be opened are left out,
+    and recorded in ``status``.
+    """
+
+    def __init__(self, root: str = POWERCAP_PATH, cpu_root: str = CPU_ROOT_PATH, status: Optional[Status] = None):
+        if status is None:
+            status = Status()
+        self.status = status
+
+        self._domains: List[RaplDomain] = []
+        self._counters: List[SysfsAttribute] = []
+
+        try:
+            zones = sorted((entry for entry in os.listdir(root) if _ZONE.match(entry)), key=natural_key)
+        except OSError:
+            zones = []
+
+        package_cpus = _package_cpus(cpu_root) if zones else {}
+        # Package zone index -> package id, which its subdomains share
+        zone_packages: Dict[str, Optional[int]] = {}
+
+        for zone in zones:
+            zone_path = os.path.join(root, zone)
+            parent, child = _ZONE.match(zone).groups()
+            try:
+                name = read_sysfs(os.path.join(zone_path, "name"))
+                max_energy_range_uj = int(read_sysfs(os.path.join(zone_path, "max_energy_range_uj")))
+                counter = SysfsAttribute(os.path.join(zone_path, "energy_uj"))
+            except (OSError, ValueError) as e:
+                self.status.type = StatusType.PARTIAL
+                self.status.messages.append(f"Could not open RAPL domain {zone}: {e}")
+                continue
+
+            if child is None:
+                match = _PACKAGE_NAME.match(name)
+                zone_packages[parent] = int(match.group(1)) if match else None
+            package = zone_packages.get(parent)
+
+            self._domains.append(RaplDomain(
+                zone, name, package, package_cpus.get(package), max_energy_range_uj
+            ))
+            self._counters.append(counter)
+
+        if zones and not self._domains:
+            self.status.type = StatusType.FAILED
+
+    @property
+    def domains(self) -> List[RaplDomain]:
+        """:return: Every sampled domain. Counters in a sample are in the same order."""
+        return list(self._domains)
+
+    def sample(self) -> RaplSample:
+        energy: List[Optional[int]] = []
+        append = energy.append
+        for counter in self._counters:
+            try:
+                append(counter.read_int())
+            except (OSError, ValueError):
+                append(None)
+        return RaplSample(time.monotonic(), energy)
+
+    def energy(self, earlier: RaplSample, later: RaplSample) -> List[Optional[float]]:
+        """
+        Energy used by each domain between two samples. A counter wraps around in roughly a minute
+        at full load on some CPUs, so samples should be taken more often than that.
+
+        :return: In joules. ``None`` for domains that could not be read in either sample.
+        """
+        joules: List[Optional[float]] = []
+        for domain, start, end in zip(self._domains, earlier.energy_uj, later.energy_uj):
+            if start is None or end is None:
+                joules.append(None)
+                continue
+            delta = end - start
+            if delta < 0:
+                delta += domain.max_energy_range_uj
+            joules.append(delta / 1_000_000)
+        return joules
+
+    def power(self, earlier: RaplSample, later: RaplSample) -> List[Optional[float]]:
+        """
+        :return: Average power of each domain between two samples, in watts.
+            ``None`` for domains that could not be read in either sample.
+        """
+        elapsed = later.timestamp - earlier.timestamp
+        if elapsed <= 0:
+            return [None] * len(self._domains)
+        return [joules / elapsed if joules is not None else None for joules in self.energy(earlier, later)]
+
+    def close(self) -> None:
+        for counter in self._counters:
+            counter.close()
+        self._counters = []
+        self._domains = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
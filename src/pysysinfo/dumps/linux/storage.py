@@ -1,39 +1,173 @@
 import os
+import re
+from typing import Callable, Dict, Iterator, Optional
+
+from pysysinfo.dumps.linux.block_graph import BlockGraph, fetch_block_graph
+from pysysinfo.dumps.linux.common import parse_scheduler, read_sysfs
+from pysysinfo.dumps.linux.mounts import fetch_volumes
+from pysysinfo.dumps.linux.nvme import fetch_nvme
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.storage_models import BlockQueue, StorageInfo, DiskInfo
+from pysysinfo.util.deadline import Deadline
+
+BLOCK_ROOT_PATH = "/sys/block/"
+
+#: Integer attributes of BlockQueue, which are named after their file in queue/
+_QUEUE_INTEGERS = (
+    "nr_requests",
+    "read_ahead_kb",
+    "max_sectors_kb",
+    "rq_affinity",
+    "nomerges",
+    "physical_block_size",
+    "logical_block_size",
+)
+
+
+def read_block_queue(queue_path: str) -> Optional[BlockQueue]:
+    """
+    :param queue_path: e.g. ``/sys/block/sda/queue``
+    :return: The queue settings, or ``None`` if the device has no request queue
+    """
+    values = {}
+    for attribute in _QUEUE_INTEGERS + ("scheduler", "write_cache", "rotational"):
+        try:
+            values[attribute] = read_sysfs(os.path.join(queue_path, attribute))
+        except OSError:
+            # Not every attribute exists on every kernel or device, e.g. write_cache before 4.7
+            continue
+
+    if not values:
+        return None
+
+    queue = BlockQueue(**{
+        attribute: int(values[attribute])
+        for attribute in _QUEUE_INTEGERS if values.get(attribute, "").isnumeric()
+    })
+    if "scheduler" in values:
+        queue.scheduler = parse_scheduler(values["scheduler"])
+    queue.write_cache = values.get("write_cache")
+    if "rotational" in values:
+        queue.rotational = values["rotational"] == "1"
+    return queue
+
+
+def fetch_block_queues(root: str = BLOCK_ROOT_PATH) -> Dict[str, BlockQueue]:
+    """
+    Reads the queue settings of every block device in one pass, including those that are not disks,
+    e.g. device-mapper and MD RAID devices.
+
+    :return: Block device name -> queue settings
+    """
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return {}
+
+    queues = {}
+    for name in names:
+        if (queue := read_block_queue(os.path.join(root, name, "queue"))) is not None:
+            queues[name] = queue
+    return queues
+
+
+# Name prefix -> connector. e.g. vda for a virtio disk, xvda for a Xen disk and mmcblk0 for an eMMC or SD card.
+_DISK_CONNECTORS = [
+    ("nvme", "PCIe"),
+    ("sd", "SCSI"),
+    ("vd", "VirtIO"),
+    ("xvd", "Xen"),
+    ("mmcblk", "MMC"),
+]
+
+# Connector -> file under /sys/block/<name>/ with the vendor id. Xen disks do not have one.
+_VENDOR_FILES = {
+    # PCI vendor id of the NVMe controller
+    "PCIe": "device/device/vendor",
+    # e.g. ATA for SATA disks behind libata
+    # todo: Choose correct connector type for block devices that use the SCSI subsystem
+    "SCSI": "device/vendor",
+    # virtio vendor id, e.g. 0x1af4
+    "VirtIO": "device/vendor",
+    # JEDEC manufacturer id of the card
+    "MMC": "device/manfid",
+}
+
+# The boot and RPMB areas of an eMMC are listed as disks of their own, e.g. mmcblk0boot0
+_MMC_HARDWARE_PARTITION = re.compile(r"^mmcblk\d+(boot\d+|rpmb)$")
+
+
+def _disk_connector(folder: str) -> Optional[str]:
+    """Returns the connector of a block device from its name, or ``None`` if it is not a disk we support."""
+    if _MMC_HARDWARE_PARTITION.match(folder):
+        return None
+    for prefix, connector in _DISK_CONNECTORS:
+        if folder.startswith(prefix):
+            return connector
+    return None
+
+
+def iter_disks(
+        connector: Optional[str] = None,
+        vendor_id: Optional[str] = None,
+        predicate: Optional[Callable[[DiskInfo], bool]] = None,
+        graph: Optional[BlockGraph] = None,
+        status: Optional[Status] = None,
+) -> Iterator[DiskInfo]:
+    """
+    Yields each disk as soon as it is parsed.
+
+    :param connector: Only yield disks with this connector, e.g. ``PCIe`` for NVMe disks.
+                      Other block devices are skipped before any of their files are read.
+    :param vendor_id: Only yield disks with this vendor id, e.g. ``0x144d`` for Samsung NVMe disks.
+                      Other disks are skipped before any other files are read for them.
+    :param predicate: Only yield disks for which this returns ``True``
+    :param graph: The block device graph, whose physical disks are listed. It is read from sysfs if not given.
+    :param status: Errors encountered are recorded here
+    """
+    if status is None:
+        status = Status()
+    if graph is None:
+        graph = fetch_block_graph(status=status)
+
+    # Partitions, device-mapper, MD RAID, loop devices, etc. are stacked on top of disks, or are not disks at all
+    for device in graph.devices:
+        if device.kind != "disk" or graph.physical_disks(device.name) != [device.name]:
+            continue
+        folder = device.name
+
+        disk_connector = _disk_connector(folder)
+        if disk_connector is None:
+            continue
+        if connector is not None and disk_connector != connector:
+            continue
+
+        disk = DiskInfo(name=folder, connector=disk_connector)
+        # Read with the graph, from the same sysfs attribute
+        disk.size = device.size
 
-from pysysinfo.models.size_models import Megabyte
-from pysysinfo.models.status_models import StatusType
-from pysysinfo.models.storage_models import StorageInfo, DiskInfo
-
-
-def fetch_storage_info() -> StorageInfo:
-    storage_info = StorageInfo()
-
-    # Storage Block Information is in /sys/block
-    # todo: if /sys/subsystem exists, do not parse /sys/block
-    # https://www.kernel.org/doc/html/latest/admin-guide/sysfs-rules.html#:~:text=Classification%20by%20subsystem
-
-    if not os.path.isdir("/sys/block"):
-        storage_info.status.type = StatusType.FAILED
-        storage_info.status.messages.append("The /sys/block directory does not exist")
-        return storage_info
+        path = f"/sys/block/{folder}"
+        if (vendor_file := _VENDOR_FILES.get(disk_connector)) is not None:
+            try:
+                disk.vendor_id = open(f"{path}/{vendor_file}", "r").read().strip()
+            except Exception as e:
+                status.type = StatusType.PARTIAL
+                status.messages.append("Disk Info: " + str(e))
 
-    for folder in os.listdir("/sys/block"):
-        disk = DiskInfo()
+        if vendor_id is not None and (disk.vendor_id or "").lower() != vendor_id.lower():
+            continue
 
-        path = f"/sys/block/{folder}"
-        # todo: mmcblk detection e.g. eMMC storage
         try:
-            if (not "nvme" in folder) and (not "sd" in folder):
-                continue
-
-            # Check properties of block device
-            model = open(f"{path}/device/model", "r").read().strip()
+            # Check properties of block device.
+            # virtio and Xen disks do not report a model, and MMC cards report it as their name.
+            if disk_connector in ("PCIe", "SCSI", "MMC"):
+                model = open(f"{path}/device/{'name' if disk_connector == 'MMC' else 'model'}", "r").read().strip()
 
-            if model:
-                disk.model = model
-            else:
-                storage_info.status.type = StatusType.PARTIAL
-                storage_info.status.messages.append("Disk Model could not be found")
+                if model:
+                    disk.model = model
+                else:
+                    status.type = StatusType.PARTIAL
+                    status.messages.append("Disk Model could not be found")
 
             rotational = open(f"{path}/queue/rotational", "r").read().strip()
             removable = open(f"{path}/removable", "r").read().strip()
@@ -47,36 +181,32 @@ def fetch_storage_info() -> StorageInfo:
 
             disk.location = "Internal" if removable == "0" else "External"
 
-            if "nvme" in folder:
-                disk.connector = "PCIe"
+            if disk_connector == "PCIe":
                 disk.type = "Non-Volatile Memory Express (NVMe)"
 
                 # Uses PCI vendor & device ids to get a vendor for the NVMe block device
                 disk.device_id = open(f"{path}/device/device/device",
                                       "r").read().strip()
-                disk.vendor_id = open(f"{path}/device/device/vendor",
-                                      "r").read().strip()
-            elif "sd" in folder:
-                # todo: Choose correct connector type for block devices that use the SCSI subsystem
-                disk.connector = "SCSI"
-                disk.vendor_id = open(f"{path}/device/vendor", "r").read().strip()
-            else:
-                disk.connector = "Unknown"
-
-            """
-            Disk Size - Is the value in /sys/block/sda/size Multiplied by the Block Size
-            In Linux, the block size is always considered as 512
-            - https://github.com/torvalds/linux/blob/master/include/linux/types.h#L132
-            """
-
-            size = open(f"{path}/size", "r").read().strip()
-            size_in_bytes = int(size) * 512
-            disk.size = Megabyte(capacity=(size_in_bytes // 1024 ** 2))
+            elif disk_connector == "VirtIO":
+                # The virtio device id, e.g. 0x0002 for a block device
+                disk.device_id = open(f"{path}/device/device", "r").read().strip()
 
         except Exception as e:
-            storage_info.status.type = StatusType.PARTIAL
-            storage_info.status.messages.append("Disk Info: " + str(e))
+            status.type = StatusType.PARTIAL
+            status.messages.append("Disk Info: " + str(e))
+
+        if predicate is None or predicate(disk):
+            yield disk
 
-        storage_info.modules.append(disk)
 
+def fetch_storage_info(deadline: Optional[Deadline] = None) -> StorageInfo:
+    """:param deadline: Mounts whose usage has not been read when the deadline passes are left without it"""
+    storage_info = StorageInfo()
+    # Read once, to list the disks and to join mounts to the devices beneath them
+    graph = fetch_block_graph(status=storage_info.status)
+    storage_info.block_devices = graph.devices
+    storage_info.block_queues = fetch_block_queues()
+    storage_info.modules.extend(iter_disks(graph=graph, status=storage_info.status))
+    storage_info.volumes.extend(fetch_volumes(graph=graph, deadline=deadline, status=storage_info.status))
+    storage_info.nvme_controllers, storage_info.nvme_namespaces = fetch_nvme(status=storage_info.status)
     return storage_info
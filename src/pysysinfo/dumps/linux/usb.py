@@ -0,0 +1,132 @@
+import os
+import re
+from typing import Dict, List, Optional
+
+from pysysinfo.dumps.linux.common import natural_key, read_optional
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.usb_models import USBDevice, USBInfo
+from pysysinfo.util.ids import IDsDatabase, default_usb_ids
+
+USB_DEVICES_PATH = "/sys/bus/usb/devices/"
+
+# e.g. usb1 for the root hub of bus 1, and 1-2.3 for port 3 of the hub in port 2 of bus 1
+_ROOT_HUB = re.compile(r"^usb(\d+)$")
+_DEVICE = re.compile(r"^(\d+)-(\d+(?:\.\d+)*)$")
+# e.g. 1-2.3:1.0 for interface 0 of configuration 1. Interfaces of the root hub of bus 1 are 1-0:1.0.
+_INTERFACE = re.compile(r"^(\d+)-(\d+(?:\.\d+)*):\d+\.\d+$")
+
+
+def _read_hex(path: str) -> Optional[int]:
+    value = read_optional(path)
+    try:
+        return int(value, 16) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parent_port(port: str) -> Optional[str]:
+    """:return: The port of the hub that a device is plugged into"""
+    if _ROOT_HUB.match(port):
+        return None
+    bus, ports = _DEVICE.match(port).groups()
+    if "." not in ports:
+        return f"usb{bus}"
+    return f"{bus}-{ports.rsplit('.', 1)[0]}"
+
+
+def _read_device(device_path: str, port: str, ids: IDsDatabase) -> USBDevice:
+    device = USBDevice(port=port)
+
+    vendor_id = _read_hex(os.path.join(device_path, "idVendor"))
+    product_id = _read_hex(os.path.join(device_path, "idProduct"))
+    if vendor_id is not None:
+        device.vendor_id = f"0x{vendor_id:04x}"
+    if product_id is not None:
+        device.product_id = f"0x{product_id:04x}"
+
+    # The strings reported by the device are more specific, e.g. they name the board of a generic USB-serial chip
+    device.manufacturer = read_optional(os.path.join(device_path, "manufacturer")) or None
+    device.name = read_optional(os.path.join(device_path, "product")) or None
+    if device.manufacturer is None and vendor_id is not None:
+        device.manufacturer = ids.vendor(vendor_id)
+    if device.name is None and vendor_id is not None and product_id is not None:
+        device.name = ids.device(vendor_id, product_id)
+
+    device.serial = read_optional(os.path.join(device_path, "serial")) or None
+    device.usb_version = read_optional(os.path.join(device_path, "version")) or None
+
+    for attribute, field in (("busnum", "bus"), ("devnum", "device_number")):
+        value = read_optional(os.path.join(device_path, attribute))
+        if value is not None and value.isnumeric():
+            setattr(device, field, int(value))
+
+    # In Mbit/s, e.g. 1.5, 480 or 5000
+    try:
+        device.speed = float(read_optional(os.path.join(device_path, "speed")) or "")
+    except ValueError:
+        pass
+
+    device_class = _read_hex(os.path.join(device_path, "bDeviceClass"))
+    if device_class is not None:
+        device.device_class = f"0x{device_class:02x}"
+        if device_class:
+            device.class_name = ids.device_class(device_class)
+
+    return device
+
+
+def fetch_usb_info(
+        root: str = USB_DEVICES_PATH,
+        ids: Optional[IDsDatabase] = None,
+        status: Optional[Status] = None,
+) -> USBInfo:
+    """
+    Reads every USB device from sysfs in one pass, and arranges them into the tree of hubs they are plugged into.
+    Names are resolved through the USB ID database in process, without running ``lsusb``.
+
+    :param ids: The USB ID database. Defaults to the one installed with ``usbutils`` or ``hwdata``.
+    :param status: Errors encountered are recorded here. Defaults to the status of the returned ``USBInfo``.
+    """
+    usb_info = USBInfo()
+    if status is None:
+        status = usb_info.status
+    if ids is None:
+        ids = default_usb_ids
+
+    try:
+        entries = sorted(os.listdir(root), key=natural_key)
+    except OSError as e:
+        status.type = StatusType.FAILED
+        status.messages.append(f"Could not list USB devices: {e}")
+        return usb_info
+
+    devices: Dict[str, USBDevice] = {}
+    interface_classes: Dict[str, List[str]] = {}
+
+    for entry in entries:
+        path = os.path.join(root, entry)
+        if match := _INTERFACE.match(entry):
+            interface_class = _read_hex(os.path.join(path, "bInterfaceClass"))
+            if interface_class is not None:
+                bus, ports = match.groups()
+                port = f"usb{bus}" if ports == "0" else f"{bus}-{ports}"
+                interface_classes.setdefault(port, []).append(f"0x{interface_class:02x}")
+            continue
+        if not (_ROOT_HUB.match(entry) or _DEVICE.match(entry)):
+            continue
+
+        devices[entry] = _read_device(path, entry, ids)
+
+    for port, device in devices.items():
+        device.interface_classes = sorted(set(interface_classes.get(port, [])))
+
+        parent = _parent_port(port)
+        if parent is None:
+            usb_info.devices.append(device)
+        elif parent in devices:
+            devices[parent].children.append(device)
+        else:
+            # The hub was unplugged while the devices were listed
+            usb_info.devices.append(device)
+
+    return usb_info
@@ -1,14 +1,25 @@
-import subprocess
+from typing import Optional
 
 from pysysinfo.models.cpu_models import CPUInfo
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.command import STATIC_TTL, default_runner
+from pysysinfo.util.deadline import Deadline
 
+_SYSCTL_COMMANDS = [
+    ["sysctl", "machdep.cpu"],
+    ["uname", "-m"],
+    ["sysctl", "hw.cpu64bit_capable"],
+]
 
-def fetch_cpu_info() -> CPUInfo:
+
+def fetch_cpu_info(deadline: Optional[Deadline] = None) -> CPUInfo:
+    """:param deadline: Commands that would run past this deadline are killed, and their values are left out"""
     cpu_info = CPUInfo()
+    # These are independent, so they are started together. The calls below are then answered from the cache.
+    default_runner.run_many(_SYSCTL_COMMANDS, ttl=STATIC_TTL, deadline=deadline, default_timeout=None)
 
     try:
-        data = subprocess.check_output(["sysctl", "machdep.cpu"]).decode()
+        data = default_runner.run(["sysctl", "machdep.cpu"], ttl=STATIC_TTL, deadline=deadline, default_timeout=None, check=True).stdout
         """
         Sample output:
         machdep.cpu.cores_per_package: 8
@@ -25,7 +36,7 @@ def fetch_cpu_info() -> CPUInfo:
         return cpu_info
 
     try:
-        arch = subprocess.check_output(["uname", "-m"]).decode()
+        arch = default_runner.run(["uname", "-m"], ttl=STATIC_TTL, deadline=deadline, default_timeout=None, check=True).stdout
         """
         Output:
         x86_64 for late-model Intel Macs
@@ -52,7 +63,7 @@ def fetch_cpu_info() -> CPUInfo:
         cpu_info.status.messages.append("Unknown CPU architecture")
 
     try:
-        bitness_64 = subprocess.check_output(["sysctl", "hw.cpu64bit_capable"]).decode()
+        bitness_64 = default_runner.run(["sysctl", "hw.cpu64bit_capable"], ttl=STATIC_TTL, deadline=deadline, default_timeout=None, check=True).stdout
         bitness_64 = True if bitness_64.split(": ")[1].strip() == "1" else False
 
         if bitness_64:
@@ -124,10 +135,10 @@ def fetch_cpu_info() -> CPUInfo:
     # todo: Detect minor ARM versions as well, like 8.X and 9.X ?
     if "arm" in arch:
         try:
-            sme_presence = subprocess.check_output(["sysctl", "hw.optional.arm.FEAT_SME"]).decode()
+            sme_presence = default_runner.run(["sysctl", "hw.optional.arm.FEAT_SME"], ttl=STATIC_TTL, deadline=deadline, default_timeout=None, check=True).stdout
             sme_presence = True if sme_presence.split(": ")[1].strip() == "1" else False
 
-            sme2_presence = subprocess.check_output(["sysctl", "hw.optional.arm.FEAT_SME2"]).decode()
+            sme2_presence = default_runner.run(["sysctl", "hw.optional.arm.FEAT_SME2"], ttl=STATIC_TTL, deadline=deadline, default_timeout=None, check=True).stdout
             sme2_presence = True if sme2_presence.split(": ")[1].strip() == "1" else False
 
             if sme_presence or sme2_presence:
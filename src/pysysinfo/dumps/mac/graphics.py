@@ -1,15 +1,15 @@
 import binascii
-import subprocess
 
 from pysysinfo.dumps.mac.common import construct_pci_path_mac
 from pysysinfo.dumps.mac.ioreg import *
 from pysysinfo.models.gpu_models import GraphicsInfo, GPUInfo
 from pysysinfo.models.size_models import Megabyte
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.command import STATIC_TTL, default_runner
 
 
 def check_arm():
-    output = subprocess.run(['uname', '-m'], capture_output=True).stdout.decode("utf-8")
+    output = default_runner.run(['uname', '-m'], ttl=STATIC_TTL, default_timeout=None).stdout
     if "arm" in output.lower():
         return True
     return False
@@ -89,7 +89,7 @@ def fetch_graphics_info() -> GraphicsInfo:
                 # We use subsystem_model for the gpu generation
                 gpu.subsystem_model = str(gpu_config.get("gpu_gen")) if gpu_config.get("gpu_gen") else None
 
-                memory = subprocess.run(["sysctl", "hw.memsize"], capture_output=True).stdout.decode("utf-8")
+                memory = default_runner.run(["sysctl", "hw.memsize"], ttl=STATIC_TTL, default_timeout=None).stdout
                 memory = memory.split(":")[1].strip()
                 if memory.isnumeric():
                     gpu.vram = Megabyte(capacity=int(memory) // (1024 ** 2))
@@ -1,3 +1,5 @@
+from typing import Optional, Set
+
 from pysysinfo.dumps.mac.cpu import fetch_cpu_info
 from pysysinfo.dumps.mac.graphics import fetch_graphics_info
 from pysysinfo.dumps.mac.memory import fetch_memory_info
@@ -9,6 +11,7 @@ from pysysinfo.models.info_models import HardwareManagerInterface
 from pysysinfo.models.info_models import MacHardwareInfo
 from pysysinfo.models.memory_models import MemoryInfo
 from pysysinfo.models.storage_models import StorageInfo
+from pysysinfo.util.deadline import Deadline
 
 
 class MacHardwareManager(HardwareManagerInterface):
@@ -24,24 +27,31 @@ class MacHardwareManager(HardwareManagerInterface):
             graphics=GraphicsInfo(),
         )
 
-    def fetch_cpu_info(self) -> CPUInfo:
-        self.info.cpu = fetch_cpu_info()
+    def fetch_cpu_info(self, timeout: Optional[float] = None) -> CPUInfo:
+        """:param timeout: Time budget in seconds for the ``sysctl`` and ``uname`` calls"""
+        self.info.cpu = fetch_cpu_info(Deadline(timeout))
         return self.info.cpu
 
     def fetch_memory_info(self) -> MemoryInfo:
         self.info.memory = fetch_memory_info()
         return self.info.memory
 
-    def fetch_storage_info(self) -> StorageInfo:
+    def fetch_storage_info(self, timeout: Optional[float] = None) -> StorageInfo:
+        """:param timeout: Ignored on macOS, where storage is read from IOKit without running any tools"""
         self.info.storage = fetch_storage_info()
         return self.info.storage
 
-    def fetch_graphics_info(self) -> GraphicsInfo:
+    def fetch_graphics_info(self, fields: Optional[Set[str]] = None, timeout: Optional[float] = None) -> GraphicsInfo:
+        """
+        :param fields: Ignored on macOS, every field is always fetched
+        :param timeout: Ignored on macOS, where GPUs are read from IOKit without running any tools
+        """
         self.info.graphics = fetch_graphics_info()
         return self.info.graphics
 
-    def fetch_hardware_info(self) -> HardwareInfo:
-        self.fetch_cpu_info()
+    def fetch_hardware_info(self, timeout: Optional[float] = None) -> HardwareInfo:
+        """:param timeout: Overall time budget in seconds. Only the CPU runs tools on macOS, so only it is bounded."""
+        self.fetch_cpu_info(timeout)
         self.fetch_memory_info()
         self.fetch_storage_info()
         self.fetch_graphics_info()
@@ -1,10 +1,10 @@
 import plistlib
-import subprocess
 from typing import List
 
 from pysysinfo.models.memory_models import MemoryInfo, MemoryModuleInfo, MemoryModuleSlot
 from pysysinfo.models.size_models import Megabyte, StorageSize, Gigabyte
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.command import STATIC_TTL, default_runner
 
 
 def get_ram_size_from_reg(reg) -> List[StorageSize]:
@@ -41,7 +41,7 @@ def get_arm_ram_info() -> MemoryInfo:
     memory_info.status.messages.append("ARM macOS only exposes partial RAM data.")
 
     try:
-        value = subprocess.check_output(["system_profiler", "SPMemoryDataType", "-xml"])
+        value = default_runner.run(["system_profiler", "SPMemoryDataType", "-xml"], ttl=STATIC_TTL, default_timeout=None, text=False, check=True).stdout
         pl = plistlib.loads(value, fmt=plistlib.FMT_XML)
     except Exception as e:
         memory_info.status.type = StatusType.FAILED
@@ -81,7 +81,7 @@ def get_arm_ram_info() -> MemoryInfo:
 def get_ram_size_from_system_profiler() -> List[StorageSize]:
     sizes = []
     try:
-        value = subprocess.check_output(["system_profiler", "SPMemoryDataType", "-xml"])
+        value = default_runner.run(["system_profiler", "SPMemoryDataType", "-xml"], ttl=STATIC_TTL, default_timeout=None, text=False, check=True).stdout
         # value = subprocess.check_output(["cat", "/users/mahas/Downloads/c2d_profiler.txt"])
         pl = plistlib.loads(value, fmt=plistlib.FMT_XML)
         # pl is an array of dictionaries
@@ -105,7 +105,7 @@ def fetch_memory_info():
     Memory Module Information, can only work on Intel and AMD machines.
     Does not work on Apple Silicon, because the modules are part of the SoC, and the info we need is not exposed.
     """
-    arch = subprocess.check_output(["uname", "-m"]).decode()
+    arch = default_runner.run(["uname", "-m"], ttl=STATIC_TTL, default_timeout=None, check=True).stdout
     """
     Output:
     x86_64 for late-model Intel Macs
@@ -121,7 +121,7 @@ def fetch_memory_info():
     `-p` is used to traverse registry over the IODeviceTree plane (IOService is default)
     """
     try:
-        output = subprocess.check_output(["ioreg", "-alw0", "-p", "IODeviceTree"])
+        output = default_runner.run(["ioreg", "-alw0", "-p", "IODeviceTree"], ttl=STATIC_TTL, default_timeout=None, text=False, check=True).stdout
         # output = subprocess.check_output(["cat", "/Users/mahas/Downloads/tree.txt"])
         pl = plistlib.loads(output, fmt=plistlib.FMT_XML)
 
@@ -2,7 +2,6 @@ import csv
 import html
 import io
 import re
-import subprocess
 import time
 import winreg
 from typing import Optional
@@ -13,6 +12,7 @@ from pysysinfo.models.gpu_models import GPUInfo
 from pysysinfo.models.gpu_models import GraphicsInfo
 from pysysinfo.models.size_models import Megabyte
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.command import STATIC_TTL, default_runner
 from pysysinfo.util.nvidia import fetch_gpu_details_nvidia
 
 
@@ -78,7 +78,7 @@ def fetch_wmic_graphics_info() -> GraphicsInfo:
                "AdapterCompatibility,Name,AdapterRAM,VideoProcessor,PNPDeviceID,DriverVersion "
                "/format:csv")
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the WMIC command failed - possibly because it is not available on this system.
@@ -108,7 +108,7 @@ def fetch_wmi_cmdlet_graphics_info() -> GraphicsInfo:
                'Select-Object "AdapterCompatibility,Name,AdapterRAM,VideoProcessor,PNPDeviceID,DriverVersion" | '
                'ConvertTo-Csv -NoTypeInformation"')
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the PowerShell command failed.
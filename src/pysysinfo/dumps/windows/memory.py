@@ -1,10 +1,10 @@
-import subprocess
 from typing import List
 
 from pysysinfo.dumps.windows.win_enum import MEMORY_TYPE
 from pysysinfo.models.memory_models import MemoryInfo, MemoryModuleInfo, MemoryModuleSlot
 from pysysinfo.models.size_models import Megabyte
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.command import STATIC_TTL, default_runner
 
 """
 the WMIC command-line utility is deprecated, and is replaced by PowerShell cmdlets.
@@ -18,7 +18,7 @@ def fetch_wmic_memory_info() -> MemoryInfo:
                "BankLabel,Capacity,Manufacturer,PartNumber,Speed,DeviceLocator,SMBIOSMemoryType,DataWidth,TotalWidth "
                "/format:csv")
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the WMIC command failed - possibly because it is not available on this system.
@@ -40,7 +40,7 @@ def fetch_wmi_cmdlet_memory_info() -> MemoryInfo:
                'Select-Object BankLabel, Capacity, Manufacturer, PartNumber, Speed, DeviceLocator, SMBIOSMemoryType, DataWidth, TotalWidth | '
                'ConvertTo-Csv -NoTypeInformation"')
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the PowerShell command failed.
@@ -1,10 +1,10 @@
-import subprocess
 from typing import List
 
 from pysysinfo.dumps.windows.win_enum import MEDIA_TYPE, BUS_TYPE
 from pysysinfo.models.size_models import Megabyte
 from pysysinfo.models.status_models import StatusType
 from pysysinfo.models.storage_models import StorageInfo, DiskInfo
+from pysysinfo.util.command import STATIC_TTL, default_runner
 
 
 def fetch_wmic_storage_info() -> StorageInfo:
@@ -12,7 +12,7 @@ def fetch_wmic_storage_info() -> StorageInfo:
 
     command = r"wmic /namespace:\\root\Microsoft\Windows\Storage path MSFT_PhysicalDisk get FriendlyName,MediaType,BusType,Size,Manufacturer /format:csv"
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the WMIC command failed - possibly because it is not available on this system.
@@ -33,7 +33,7 @@ def fetch_wmi_cmdlet_storage_info() -> StorageInfo:
 
     command = r'powershell -Command "Get-CimInstance -Namespace "root/Microsoft/Windows/Storage" -ClassName MSFT_PhysicalDisk | Select-Object FriendlyName, MediaType, BusType, Size, Manufacturer | ConvertTo-Csv -NoTypeInformation"'
     try:
-        result = subprocess.check_output(command, shell=True, text=True)
+        result = default_runner.run(command, ttl=STATIC_TTL, default_timeout=None, shell=True, check=True).stdout
     except Exception as e:
         """
         This means the PowerShell command failed.
@@ -1,3 +1,5 @@
+from typing import Optional, Set
+
 from pysysinfo.dumps.windows.cpu import fetch_cpu_info
 from pysysinfo.dumps.windows.graphics import fetch_graphics_info
 from pysysinfo.dumps.windows.memory import fetch_memory_info
@@ -27,7 +29,8 @@ class WindowsHardwareManager(HardwareManagerInterface):
             network=NetworkInfo()
         )
 
-    def fetch_cpu_info(self) -> CPUInfo:
+    def fetch_cpu_info(self, timeout: Optional[float] = None) -> CPUInfo:
+        """:param timeout: Ignored on Windows"""
         self.info.cpu = fetch_cpu_info()
         return self.info.cpu
 
@@ -35,19 +38,26 @@ class WindowsHardwareManager(HardwareManagerInterface):
         self.info.memory = fetch_memory_info()
         return self.info.memory
 
-    def fetch_storage_info(self) -> StorageInfo:
+    def fetch_storage_info(self, timeout: Optional[float] = None) -> StorageInfo:
+        """:param timeout: Ignored on Windows"""
         self.info.storage = fetch_storage_info()
         return self.info.storage
 
-    def fetch_graphics_info(self) -> GraphicsInfo:
+    def fetch_graphics_info(self, fields: Optional[Set[str]] = None, timeout: Optional[float] = None) -> GraphicsInfo:
+        """
+        :param fields: Ignored on Windows, every field is always fetched
+        :param timeout: Ignored on Windows, the PowerShell fallback is not bounded either
+        """
         self.info.graphics = fetch_graphics_info()
         return self.info.graphics
     
-    def fetch_network_info(self) -> NetworkInfo:
+    def fetch_network_info(self, timeout: Optional[float] = None) -> NetworkInfo:
+        """:param timeout: Ignored on Windows"""
         self.info.network = fetch_wmi_cmdlet_network_info()
         return self.info.network
 
-    def fetch_hardware_info(self) -> HardwareInfo:
+    def fetch_hardware_info(self, timeout: Optional[float] = None) -> HardwareInfo:
+        """:param timeout: Ignored on Windows, where no component is bounded by a time budget yet"""
         self.fetch_cpu_info()
         self.fetch_memory_info()
         self.fetch_storage_info()
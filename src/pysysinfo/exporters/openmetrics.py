@@ -0,0 +1,349 @@
+import argparse
+import math
+import signal
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from pysysinfo.models.info_models import HardwareInfo, HardwareManagerInterface
+from pysysinfo.models.size_models import StorageSize
+from pysysinfo.models.status_models import StatusType
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_UNIT_BYTES = {
+    "KB": 1024,
+    "MB": 1024 ** 2,
+    "GB": 1024 ** 3,
+}
+
+#: Every metric family that is rendered from ``HardwareInfo``, in output order.
+#: Format: name -> (type, help)
+FAMILIES: Dict[str, Tuple[str, str]] = {
+    "pysysinfo_component_status": ("stateset", "Discovery status of each component"),
+    "pysysinfo_cpu": ("info", "CPU model information"),
+    "pysysinfo_cpu_cores": ("gauge", "Number of physical CPU cores"),
+    "pysysinfo_cpu_threads": ("gauge", "Number of logical CPU threads"),
+    "pysysinfo_memory_modules": ("gauge", "Number of memory modules"),
+    "pysysinfo_memory_capacity_bytes": ("gauge", "Total capacity of all memory modules"),
+    "pysysinfo_memory_module_capacity_bytes": ("gauge", "Capacity of a memory module"),
+    "pysysinfo_gpu": ("info", "GPU model information"),
+    "pysysinfo_gpu_vram_bytes": ("gauge", "Total VRAM of a GPU"),
+    "pysysinfo_disk": ("info", "Disk model information"),
+    "pysysinfo_disk_size_bytes": ("gauge", "Size of a disk"),
+    "pysysinfo_volume_size_bytes": ("gauge", "Size of a mounted filesystem"),
+    "pysysinfo_volume_available_bytes": ("gauge", "Space on a mounted filesystem that unprivileged users can use"),
+    "pysysinfo_usb_device": ("info", "USB device information, including hubs"),
+}
+
+#: Formatted label sets that are kept for reuse. Labels of volumes and devices that are gone are dropped first.
+LABEL_CACHE_SIZE = 4096
+
+#: A sample, as returned by a sampler: (metric family, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _size_bytes(size: Optional[StorageSize]) -> Optional[int]:
+    if size is None or size.unit not in _UNIT_BYTES:
+        return None
+    return size.capacity * _UNIT_BYTES[size.unit]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and not math.isfinite(value):
+        # OpenMetrics spells these NaN, +Inf and -Inf
+        return "NaN" if math.isnan(value) else ("+Inf" if value > 0 else "-Inf")
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class OpenMetricsExporter:
+    """
+    Renders ``HardwareInfo`` and live samplers as OpenMetrics text.
+
+    Rendered lines are cached per component, and only rendered again when the component is replaced,
+    e.g. when ``fetch_storage_info()`` is called again.
+    Label sets are formatted once and reused, so a scrape costs little more than joining strings.
+    Up to ``LABEL_CACHE_SIZE`` label sets are kept, so a long-running exporter does not grow as devices come and go.
+    """
+
+    def __init__(self, manager: Optional[HardwareManagerInterface] = None):
+        if manager is None:
+            from pysysinfo import HardwareManager
+            manager = HardwareManager()
+
+        self.manager = manager
+        # component name -> (component object, family -> lines)
+        self._component_cache: Dict[str, Tuple[BaseModel, Dict[str, List[str]]]] = {}
+        # Least recently used first
+        self._label_cache: "OrderedDict[Tuple[Tuple[str, str], ...], str]" = OrderedDict()
+        self._samplers: Dict[str, Tuple[str, str, Callable[[], Iterable[Sample]]]] = {}
+        self._lock = threading.Lock()
+
+    def add_sampler(self, family: str, sampler: Callable[[], Iterable[Sample]],
+                    help_text: str = "", metric_type: str = "gauge") -> None:
+        """
+        Registers a live sampler. It is called on every scrape.
+
+        :param family: Name of the metric family, e.g. ``pysysinfo_gpu_memory_used_bytes``
+        :param sampler: Callable that returns ``(family, labels, value)`` samples
+        :param help_text: Description of the metric family
+        :param metric_type: OpenMetrics type of the metric family
+        """
+        self._samplers[family] = (metric_type, help_text, sampler)
+
+    def _labels(self, labels: Dict[str, Optional[str]]) -> str:
+        key = tuple((k, str(v)) for k, v in labels.items() if v is not None)
+        formatted = self._label_cache.get(key)
+        if formatted is None:
+            if key:
+                formatted = "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in key) + "}"
+            else:
+                formatted = ""
+            self._label_cache[key] = formatted
+            if len(self._label_cache) > LABEL_CACHE_SIZE:
+                self._label_cache.popitem(last=False)
+        else:
+            self._label_cache.move_to_end(key)
+        return formatted
+
+    def _line(self, name: str, labels: Dict[str, Optional[str]], value: float) -> str:
+        return f"{name}{self._labels(labels)} {_format_value(value)}"
+
+    def _status_lines(self, component: str, data) -> List[str]:
+        return [
+            self._line("pysysinfo_component_status",
+                       {"component": component, "pysysinfo_component_status": status.value},
+                       data.status.type == status)
+            for status in StatusType
+        ]
+
+    def _render_cpu(self, cpu) -> Dict[str, List[str]]:
+        families = {"pysysinfo_component_status": self._status_lines("cpu", cpu)}
+        families["pysysinfo_cpu"] = [self._line("pysysinfo_cpu_info", {
+            "name": cpu.name,
+            "vendor": cpu.vendor,
+            "architecture": cpu.architecture,
+        }, 1)]
+        if cpu.cores is not None:
+            families["pysysinfo_cpu_cores"] = [self._line("pysysinfo_cpu_cores", {}, cpu.cores)]
+        if cpu.threads is not None:
+            families["pysysinfo_cpu_threads"] = [self._line("pysysinfo_cpu_threads", {}, cpu.threads)]
+        return families
+
+    def _render_memory(self, memory) -> Dict[str, List[str]]:
+        families = {"pysysinfo_component_status": self._status_lines("memory", memory)}
+        families["pysysinfo_memory_modules"] = [
+            self._line("pysysinfo_memory_modules", {}, len(memory.modules))
+        ]
+
+        total = 0
+        module_lines = []
+        for module in memory.modules:
+            capacity = _size_bytes(module.capacity)
+            if capacity is None:
+                continue
+            total += capacity
+            module_lines.append(self._line("pysysinfo_memory_module_capacity_bytes", {
+                "channel": module.slot.channel if module.slot else None,
+                "bank": module.slot.bank if module.slot else None,
+                "manufacturer": module.manufacturer,
+                "part_number": module.part_number,
+                "type": module.type,
+            }, capacity))
+
+        families["pysysinfo_memory_capacity_bytes"] = [self._line("pysysinfo_memory_capacity_bytes", {}, total)]
+        families["pysysinfo_memory_module_capacity_bytes"] = module_lines
+        return families
+
+    def _render_graphics(self, graphics) -> Dict[str, List[str]]:
+        families = {"pysysinfo_component_status": self._status_lines("graphics", graphics)}
+        info_lines, vram_lines = [], []
+        for index, gpu in enumerate(graphics.modules):
+            labels = {"index": index, "name": gpu.name}
+            info_lines.append(self._line("pysysinfo_gpu_info", {
+                **labels,
+                "vendor_id": gpu.vendor_id,
+                "device_id": gpu.device_id,
+                "manufacturer": gpu.manufacturer,
+            }, 1))
+            if (vram := _size_bytes(gpu.vram)) is not None:
+                vram_lines.append(self._line("pysysinfo_gpu_vram_bytes", labels, vram))
+
+        families["pysysinfo_gpu"] = info_lines
+        families["pysysinfo_gpu_vram_bytes"] = vram_lines
+        return families
+
+    def _render_storage(self, storage) -> Dict[str, List[str]]:
+        families = {"pysysinfo_component_status": self._status_lines("storage", storage)}
+        info_lines, size_lines = [], []
+        for index, disk in enumerate(storage.modules):
+            labels = {"index": index, "model": disk.model}
+            info_lines.append(self._line("pysysinfo_disk_info", {
+                **labels,
+                "type": disk.type,
+                "connector": disk.connector,
+                "location": disk.location,
+            }, 1))
+            if (size := _size_bytes(disk.size)) is not None:
+                size_lines.append(self._line("pysysinfo_disk_size_bytes", labels, size))
+
+        families["pysysinfo_disk"] = info_lines
+        families["pysysinfo_disk_size_bytes"] = size_lines
+
+        volume_size_lines, volume_available_lines = [], []
+        for volume in storage.volumes:
+            labels = {"mount_point": volume.mount_point, "fs_type": volume.fs_type, "device": volume.block_device}
+            if (size := _size_bytes(volume.total_size)) is not None:
+                volume_size_lines.append(self._line("pysysinfo_volume_size_bytes", labels, size))
+            if (available := _size_bytes(volume.available_size)) is not None:
+                volume_available_lines.append(self._line("pysysinfo_volume_available_bytes", labels, available))
+
+        families["pysysinfo_volume_size_bytes"] = volume_size_lines
+        families["pysysinfo_volume_available_bytes"] = volume_available_lines
+        return families
+
+    def _render_network(self, network) -> Dict[str, List[str]]:
+        return {"pysysinfo_component_status": self._status_lines("network", network)}
+
+    def _render_usb(self, usb) -> Dict[str, List[str]]:
+        families = {"pysysinfo_component_status": self._status_lines("usb", usb)}
+        families["pysysinfo_usb_device"] = [
+            self._line("pysysinfo_usb_device_info", {
+                "port": device.port,
+                "vendor_id": device.vendor_id,
+                "product_id": device.product_id,
+                "manufacturer": device.manufacturer,
+                "name": device.name,
+                "class": device.class_name,
+            }, 1)
+            for device in usb.iter_devices()
+        ]
+        return families
+
+    def _component_families(self, info: HardwareInfo) -> List[Dict[str, List[str]]]:
+        renderers = {
+            "cpu": self._render_cpu,
+            "memory": self._render_memory,
+            "storage": self._render_storage,
+            "graphics": self._render_graphics,
+            "network": self._render_network,
+            "usb": self._render_usb,
+        }
+
+        rendered = []
+        for component, renderer in renderers.items():
+            data = getattr(info, component)
+            if data is None:
+                continue
+
+            cached = self._component_cache.get(component)
+            # Holding a reference to the component keeps its identity from being reused
+            if cached is None or cached[0] is not data:
+                cached = (data, renderer(data))
+                self._component_cache[component] = cached
+            rendered.append(cached[1])
+
+        return rendered
+
+    def render(self) -> str:
+        """Renders the current hardware info of the manager, and all samplers, as OpenMetrics text."""
+        with self._lock:
+            components = self._component_families(self.manager.info)
+
+            output = []
+            for family, (metric_type, help_text) in FAMILIES.items():
+                lines = [line for families in components for line in families.get(family, ())]
+                if not lines:
+                    continue
+                output.append(f"# TYPE {family} {metric_type}")
+                output.append(f"# HELP {family} {help_text}")
+                output.extend(lines)
+
+            for family, (metric_type, help_text, sampler) in self._samplers.items():
+                try:
+                    samples = list(sampler())
+                except Exception:
+                    # A failing sampler should not break the whole scrape
+                    continue
+                output.append(f"# TYPE {family} {metric_type}")
+                if help_text:
+                    output.append(f"# HELP {family} {help_text}")
+                output.extend(self._line(name, labels, value) for name, labels, value in samples)
+
+            output.append("# EOF")
+            return "\n".join(output) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = self.server.exporter.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(exporter: OpenMetricsExporter, port: int = 9105, address: str = "") -> ThreadingHTTPServer:
+    """
+    Serves the exporter at ``/metrics`` in a background thread.
+
+    :return: The HTTP server. Call ``shutdown()`` on it to stop serving.
+    """
+    server = ThreadingHTTPServer((address, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.exporter = exporter
+    threading.Thread(target=server.serve_forever, name="pysysinfo-metrics", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve hardware information as OpenMetrics.")
+    parser.add_argument("--port", type=int, default=9105)
+    parser.add_argument("--address", default="")
+    parser.add_argument(
+        "--interval", type=float, default=60.0,
+        help="Seconds between hardware info refreshes (default: 60)"
+    )
+    args = parser.parse_args()
+
+    exporter = OpenMetricsExporter()
+    exporter.manager.fetch_hardware_info()
+    server = serve(exporter, args.port, args.address)
+
+    # Set on SIGTERM, e.g. from systemd, or on Ctrl+C, to stop refreshing and shut the server down
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    try:
+        while not stop.wait(args.interval):
+            try:
+                # Replaced components are rendered again on the next scrape
+                exporter.manager.fetch_hardware_info()
+            except Exception:
+                # Keep serving the last good data, and try again on the next cycle
+                pass
+    except KeyboardInterrupt:
+        stop.set()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
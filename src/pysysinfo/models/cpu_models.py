@@ -1,8 +1,64 @@
 from typing import List, Optional
 
-from pydantic import Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from pysysinfo.models.component_model import ComponentInfo
+from pysysinfo.models.size_models import StorageSize
+
+
+class CacheInfo(BaseModel):
+    """A CPU cache, which may be shared by several logical CPUs."""
+    #: 1 for L1, 2 for L2, etc.
+    level: int
+
+    #: ``Data``, ``Instruction`` or ``Unified``
+    type: Optional[str] = None
+
+    size: Optional[StorageSize] = None
+
+    #: Number of ways of associativity
+    ways: Optional[int] = None
+
+    #: Size of a cache line, in bytes
+    line_size: Optional[int] = None
+
+    #: Logical CPUs that share this cache, in the kernel's cpulist format, e.g. ``0-7,16-23``
+    cpus: str = ""
+
+    # Bit N is set if CPU N shares this cache
+    _cpu_mask: int = PrivateAttr(default=0)
+
+    @property
+    def cpu_mask(self) -> int:
+        return self._cpu_mask
+
+
+class CoreCluster(BaseModel):
+    """A group of identical cores, e.g. the P-cores of a hybrid Intel CPU or a cluster of a big.LITTLE ARM SoC."""
+    #: ``performance``, ``efficiency``, or ``balanced`` for the middle clusters of an SoC with more than two.
+    #: ``None`` when every core is the same.
+    type: Optional[str] = None
+
+    #: Logical CPUs of the cluster, in the kernel's cpulist format, e.g. ``0-15``
+    cpus: str = ""
+
+    #: The number of physical cores in the cluster
+    cores: Optional[int] = None
+    #: The number of logical threads in the cluster
+    threads: Optional[int] = None
+
+    #: Relative performance of a core, normalized so that the fastest core in the system is 1024
+    capacity: Optional[int] = None
+
+    #: Maximum frequency of a core, in MHz
+    max_frequency: Optional[int] = None
+
+    # Bit N is set if CPU N is in the cluster
+    _cpu_mask: int = PrivateAttr(default=0)
+
+    @property
+    def cpu_mask(self) -> int:
+        return self._cpu_mask
 
 
 class CPUInfo(ComponentInfo):
@@ -23,6 +79,15 @@ class CPUInfo(ComponentInfo):
     #: Manufacturer of the CPU. ``Intel``, for example.
     vendor: Optional[str] = None
 
+    #: Codename of the CPU, e.g. ``Raptor Lake-S``. Only known for x86 CPUs.
+    codename: Optional[str] = None
+
+    #: Core microarchitecture of the CPU, e.g. ``Raptor Cove`` or ``Zen 4``.
+    microarchitecture: Optional[str] = None
+
+    #: Product generation the CPU launched as, e.g. ``13th/14th Gen Core`` or ``EPYC 9004``.
+    generation: Optional[str] = None
+
     #: SSE flags supported by the CPU.
     sse_flags: List[str] = Field(default_factory=list)
 
@@ -30,3 +95,9 @@ class CPUInfo(ComponentInfo):
     cores: Optional[int] = None
     #: The number of logical threads supported by the CPU
     threads: Optional[int] = None
+
+    #: Every cache instance, e.g. one L3 per CCX on AMD, ordered by level
+    caches: List[CacheInfo] = Field(default_factory=list)
+
+    #: Groups of identical cores, fastest first. A CPU whose cores are all the same has one cluster.
+    clusters: List[CoreCluster] = Field(default_factory=list)
@@ -6,6 +6,19 @@ from pysysinfo.models.component_model import ComponentInfo
 from pysysinfo.models.size_models import StorageSize
 
 
+class DisplayOutput(BaseModel):
+    """A display connector of a GPU, e.g. an HDMI port"""
+
+    #: Connector name, e.g. ``HDMI-A-1`` or ``eDP-1``.
+    name: str
+
+    #: Whether a display is attached. ``null`` if the driver does not know.
+    connected: Optional[bool] = None
+
+    #: Whether the output is currently driven.
+    enabled: Optional[bool] = None
+
+
 class GPUInfo(BaseModel):
     """Information for one GPU is stored here"""
 
@@ -42,6 +55,22 @@ class GPUInfo(BaseModel):
     #: Total VRAM available on the GPU.
     vram: Optional[StorageSize] = None
 
+    #: Kernel driver bound to the GPU, e.g. ``amdgpu`` or ``panfrost``.
+    #: Only on Linux.
+    driver: Optional[str] = None
+
+    #: DRM primary node, e.g. ``/dev/dri/card0``.
+    #: Only on Linux.
+    drm_card: Optional[str] = None
+
+    #: DRM render node, e.g. ``/dev/dri/renderD128``. Used to run compute and rendering without a display.
+    #: Only on Linux.
+    render_node: Optional[str] = None
+
+    #: Display outputs of the GPU.
+    #: Only on Linux.
+    outputs: List[DisplayOutput] = Field(default_factory=list)
+
     #: Only for Apple Silicon GPUs: Number of GPU cores.
     #: ``null`` on all other platforms.
     apple_gpu_core_count: Optional[int] = None
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Set
 
 from pydantic import BaseModel
 
@@ -7,6 +7,7 @@ from pysysinfo.models.gpu_models import GraphicsInfo
 from pysysinfo.models.memory_models import MemoryInfo
 from pysysinfo.models.storage_models import StorageInfo
 from pysysinfo.models.network_models import NetworkInfo
+from pysysinfo.models.usb_models import USBInfo
 
 
 class HardwareInfo(BaseModel):
@@ -15,6 +16,7 @@ class HardwareInfo(BaseModel):
     storage: Optional[StorageInfo] = None
     graphics: Optional[GraphicsInfo] = None
     network: Optional[NetworkInfo] = None
+    usb: Optional[USBInfo] = None
 
 
 class LinuxHardwareInfo(HardwareInfo):
@@ -35,27 +37,56 @@ class HardwareManagerInterface:
     #: When any component's data is queried, the data is stored here.
     info: HardwareInfo
 
-    def fetch_hardware_info(self) -> HardwareInfo:
-        """Fetches all hardware Information."""
+    def fetch_hardware_info(self, timeout: Optional[float] = None) -> HardwareInfo:
+        """
+        Fetches all hardware Information.
+
+        :param timeout: Overall time budget in seconds, shared by every component.
+            Where supported, external tools that would run past it are stopped,
+            and the affected components get a ``PARTIAL`` status.
+        """
 
     pass
 
-    def fetch_cpu_info(self) -> CPUInfo:
-        """Fetches CPU Information."""
+    def fetch_cpu_info(self, timeout: Optional[float] = None) -> CPUInfo:
+        """
+        Fetches CPU Information.
+
+        :param timeout: Time budget in seconds for the external tools that are run.
+        """
         pass
 
-    def fetch_graphics_info(self) -> GraphicsInfo:
-        """Fetches GPU Information."""
+    def fetch_graphics_info(self, fields: Optional[Set[str]] = None, timeout: Optional[float] = None) -> GraphicsInfo:
+        """
+        Fetches GPU Information.
+
+        :param fields: Names of the ``GPUInfo`` fields that are needed, e.g. ``{"vendor_id", "device_id", "vram"}``.
+            Where supported, probes that only provide other fields are skipped.
+            Other fields may still be filled in. ``None`` fetches every field.
+        :param timeout: Time budget in seconds for the external tools that are run.
+        """
         pass
 
     def fetch_memory_info(self) -> MemoryInfo:
         """Fetches RAM Information."""
         pass
 
-    def fetch_storage_info(self) -> StorageInfo:
-        """Fetches Disk Information."""
+    def fetch_storage_info(self, timeout: Optional[float] = None) -> StorageInfo:
+        """
+        Fetches Disk Information.
+
+        :param timeout: Time budget in seconds for reading the usage of mounted filesystems.
+        """
+        pass
+
+    def fetch_network_info(self, timeout: Optional[float] = None) -> NetworkInfo:
+        """
+        Fetches Network Information.
+
+        :param timeout: Time budget in seconds for the external tools that are run.
+        """
         pass
 
-    def fetch_network_info(self) -> NetworkInfo:
-        """Fetches Network Information."""
+    def fetch_usb_info(self) -> USBInfo:
+        """Fetches USB device Information."""
         pass
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from pysysinfo.models.component_model import ComponentInfo
 from pysysinfo.models.size_models import StorageSize
@@ -20,7 +20,41 @@ class MemoryModuleInfo(BaseModel):
     frequency_mhz: Optional[int] = None
     slot: Optional[MemoryModuleSlot] = None
     supports_ecc: Optional[bool] = None
+    # NUMA node the module is attached to, where SMBIOS allows us to tell
+    numa_node: Optional[int] = None
+    # ECC error counts since boot, reported by the kernel's EDAC driver
+    corrected_errors: Optional[int] = None
+    uncorrected_errors: Optional[int] = None
+
+    # SMBIOS handle of the Physical Memory Array (Type 16) that the module belongs to
+    _array_handle: Optional[int] = PrivateAttr(default=None)
+
+
+class HugePageInfo(BaseModel):
+    page_size: StorageSize
+    total: int = 0
+    free: int = 0
+    surplus: int = 0
+
+
+class NUMANodeInfo(BaseModel):
+    id: int
+    # CPUs of the node, in the kernel's cpulist format, e.g. ``0-7,16-23``
+    cpus: str = ""
+    total_memory: Optional[StorageSize] = None
+    free_memory: Optional[StorageSize] = None
+    # Relative distance to each node, indexed by node id. The distance to itself is usually 10.
+    distances: List[int] = Field(default_factory=list)
+    hugepages: List[HugePageInfo] = Field(default_factory=list)
+
+    # Bit N is set if CPU N belongs to the node
+    _cpu_mask: int = PrivateAttr(default=0)
+
+    @property
+    def cpu_mask(self) -> int:
+        return self._cpu_mask
 
 
 class MemoryInfo(ComponentInfo):
     modules: List[MemoryModuleInfo] = Field(default_factory=list)
+    numa_nodes: List[NUMANodeInfo] = Field(default_factory=list)
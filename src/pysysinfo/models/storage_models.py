@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -6,7 +6,27 @@ from pysysinfo.models.component_model import ComponentInfo
 from pysysinfo.models.size_models import StorageSize
 
 
+class BlockQueue(BaseModel):
+    """Request queue settings of a block device, from /sys/block/<name>/queue"""
+    # Active I/O scheduler, e.g. none or mq-deadline
+    scheduler: Optional[str] = None
+    nr_requests: Optional[int] = None
+    read_ahead_kb: Optional[int] = None
+    max_sectors_kb: Optional[int] = None
+    # 0: complete requests on any CPU, 1: on the submitting CPU's group, 2: on the submitting CPU
+    rq_affinity: Optional[int] = None
+    # 0: all merges, 1: only simple merges, 2: no merges
+    nomerges: Optional[int] = None
+    # write back/write through
+    write_cache: Optional[str] = None
+    physical_block_size: Optional[int] = None
+    logical_block_size: Optional[int] = None
+    rotational: Optional[bool] = None
+
+
 class DiskInfo(BaseModel):
+    # Kernel name, e.g. sda
+    name: Optional[str] = None
     # Device Name
     model: Optional[str] = None
     manufacturer: Optional[str] = None
@@ -23,5 +43,98 @@ class DiskInfo(BaseModel):
     pass
 
 
+class BlockDevice(BaseModel):
+    # Kernel name, e.g. sda1 or dm-3
+    name: str
+    # Device number, e.g. 8:1
+    dev: str
+    # disk/partition/dm/lvm/md/loop/zram/nbd/rom
+    kind: str
+    size: Optional[StorageSize] = None
+    # For partitions: the disk that contains the partition
+    parent: Optional[str] = None
+    partition_number: Optional[int] = None
+    # For device-mapper devices: the name in /dev/mapper
+    dm_name: Optional[str] = None
+    # For MD RAID devices: the RAID level, e.g. raid1
+    md_level: Optional[str] = None
+    # Devices that are built on top of this device
+    holders: List[str] = Field(default_factory=list)
+    # Devices that this device is built on top of
+    slaves: List[str] = Field(default_factory=list)
+
+
+class VolumeInfo(BaseModel):
+    # Where the filesystem is mounted, e.g. /home
+    mount_point: str
+    # What is mounted, e.g. /dev/sda1 or server:/export
+    source: Optional[str] = None
+    # ext4/xfs/nfs4/etc.
+    fs_type: Optional[str] = None
+    # Device number of the mount, e.g. 8:1
+    dev: Optional[str] = None
+    read_only: bool = False
+    # The block device that holds the filesystem, e.g. dm-0, if it is on one
+    block_device: Optional[str] = None
+    # The disks that ultimately back the filesystem, e.g. [sda, sdb] for LVM on RAID1
+    physical_disks: List[str] = Field(default_factory=list)
+
+    total_size: Optional[StorageSize] = None
+    free_size: Optional[StorageSize] = None
+    # Free space that unprivileged users can use
+    available_size: Optional[StorageSize] = None
+    total_inodes: Optional[int] = None
+    free_inodes: Optional[int] = None
+
+
+class NVMeNamespace(BaseModel):
+    # Block device of the namespace, e.g. nvme0n1
+    name: str
+    # Namespace ID within its controller or subsystem
+    nsid: Optional[int] = None
+    size: Optional[StorageSize] = None
+    logical_block_size: Optional[int] = None
+    # Maximum number of requests in flight in each hardware queue
+    nr_requests: Optional[int] = None
+    # Active I/O scheduler, e.g. none or mq-deadline
+    scheduler: Optional[str] = None
+    # Controllers through which the namespace is reached. More than one with native multipath.
+    controllers: List[str] = Field(default_factory=list)
+
+
+class NVMeController(BaseModel):
+    # e.g. nvme0
+    name: str
+    model: Optional[str] = None
+    serial: Optional[str] = None
+    firmware_rev: Optional[str] = None
+    # pcie/tcp/rdma/fc/loop
+    transport: Optional[str] = None
+    # PCI slot for PCIe, e.g. 0000:3d:00.0, or e.g. traddr=10.0.0.2,trsvcid=4420 for NVMe-oF
+    address: Optional[str] = None
+    # live/connecting/resetting/etc.
+    state: Optional[str] = None
+    numa_node: Optional[int] = None
+    # NVMe subsystem, e.g. nvme-subsys0, which all controllers of a multipath namespace share
+    subsystem: Optional[str] = None
+    subsystem_nqn: Optional[str] = None
+    namespaces: List[str] = Field(default_factory=list)
+
+
 class StorageInfo(ComponentInfo):
     modules: List[DiskInfo] = Field(default_factory=list)
+    volumes: List[VolumeInfo] = Field(default_factory=list)
+    nvme_controllers: List[NVMeController] = Field(default_factory=list)
+    nvme_namespaces: List[NVMeNamespace] = Field(default_factory=list)
+    # Queue settings of every block device by name, e.g. sda, and also those that are not disks, e.g. dm-0 and md0
+    block_queues: Dict[str, BlockQueue] = Field(default_factory=dict)
+    # Every block device, including partitions, device-mapper and MD RAID devices, and how they are stacked
+    block_devices: List[BlockDevice] = Field(default_factory=list)
+
+    def block_device(self, name: str) -> Optional[BlockDevice]:
+        """:param name: Kernel name, e.g. ``dm-0``"""
+        return next((device for device in self.block_devices if device.name == name), None)
+
+    def block_device_by_dev(self, dev: str) -> Optional[BlockDevice]:
+        """:param dev: Device number, e.g. ``253:0``"""
+        return next((device for device in self.block_devices if device.dev == dev), None)
@@ -0,0 +1,63 @@
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from pysysinfo.models.component_model import ComponentInfo
+
+
+class USBDevice(BaseModel):
+    """Information for one USB device, including hubs and the root hub of each bus, is stored here"""
+
+    #: The product name reported by the device, or from the USB ID database
+    name: Optional[str] = None
+
+    #: The manufacturer reported by the device, or the vendor from the USB ID database
+    manufacturer: Optional[str] = None
+
+    #: Format: ``0xPQRS``
+    vendor_id: Optional[str] = None
+
+    #: Format: ``0xPQRS``
+    product_id: Optional[str] = None
+
+    #: Where the device is plugged in, as bus-port.port..., e.g. ``1-2.3``. ``usb1`` for the root hub of bus 1.
+    port: str
+
+    #: Bus number, as shown by ``lsusb``
+    bus: Optional[int] = None
+
+    #: Device number on the bus, as shown by ``lsusb``. It changes when the device is plugged in again.
+    device_number: Optional[int] = None
+
+    serial: Optional[str] = None
+
+    #: Negotiated speed in Mbit/s, e.g. ``480`` for High Speed or ``5000`` for SuperSpeed
+    speed: Optional[float] = None
+
+    #: USB version the device supports, e.g. ``2.00``
+    usb_version: Optional[str] = None
+
+    #: Format: ``0xPQ``. ``0x00`` means each interface declares its own class.
+    device_class: Optional[str] = None
+
+    #: Name of the device class, e.g. ``Hub``
+    class_name: Optional[str] = None
+
+    #: Class of each interface, e.g. ``0x03`` for keyboards and mice (HID). Format: ``0xPQ``
+    interface_classes: List[str] = Field(default_factory=list)
+
+    #: Devices plugged into this device, if it is a hub
+    children: List["USBDevice"] = Field(default_factory=list)
+
+
+class USBInfo(ComponentInfo):
+    #: The root hub of each bus. Every other device is in the ``children`` of the hub it is plugged into.
+    devices: List[USBDevice] = Field(default_factory=list)
+
+    def iter_devices(self) -> Iterator[USBDevice]:
+        """Yields every device in the tree, each hub before the devices plugged into it."""
+        stack = list(reversed(self.devices))
+        while stack:
+            device = stack.pop()
+            yield device
+            stack.extend(reversed(device.children))
@@ -0,0 +1,170 @@
+import csv
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, List, NamedTuple, Optional
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+CODENAMES_CSV_PATH = os.path.join(DATA_PATH, "cpu_codenames.csv")
+CODENAMES_INDEX_PATH = os.path.join(DATA_PATH, "cpu_codenames.idx")
+
+#: CPUID vendor string -> vendor number in the index
+VENDORS: Dict[str, int] = {
+    "GenuineIntel": 1,
+    "AuthenticAMD": 2,
+    "HygonGenuine": 3,
+}
+
+# Index layout, all little-endian:
+#   header:  magic, version, record count, offset of the string table
+#   records: vendor, family, model, first stepping, last stepping,
+#            and the string table offsets of the codename, microarchitecture and generation.
+#            Sorted by (vendor, family, model, first stepping).
+#   strings: NUL-terminated UTF-8, each stored once
+_MAGIC = b"PSCN"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHII")
+_RECORD = struct.Struct("<BHHBBIII")
+
+
+class CPUCodename(NamedTuple):
+    #: e.g. ``Raptor Lake-S`` or ``Genoa``
+    codename: str
+    #: e.g. ``Raptor Cove`` or ``Zen 4``
+    microarchitecture: str
+    #: Product generation it launched as, e.g. ``13th/14th Gen Core`` or ``EPYC 9004``
+    generation: str
+
+
+def build_index(csv_path: str = CODENAMES_CSV_PATH) -> bytes:
+    """
+    Compiles the codename table into the binary index that ``CodenameManager`` reads.
+
+    :param csv_path: The table, with the columns
+                     ``vendor,family,model,stepping_min,stepping_max,codename,microarchitecture,generation``.
+                     Lines starting with ``#`` are comments.
+    :raises ValueError: If a row is malformed, or its vendor is unknown
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(line for line in f if not line.startswith("#")))
+
+    strings = bytearray()
+    string_offsets: Dict[str, int] = {}
+
+    def string_offset(value: str) -> int:
+        if value not in string_offsets:
+            string_offsets[value] = len(strings)
+            strings.extend(value.encode("utf-8") + b"\0")
+        return string_offsets[value]
+
+    records = []
+    for row in rows:
+        if row["vendor"] not in VENDORS:
+            raise ValueError(f"Unknown CPU vendor: {row['vendor']}")
+        records.append((
+            VENDORS[row["vendor"]], int(row["family"]), int(row["model"]),
+            int(row["stepping_min"]), int(row["stepping_max"]),
+            string_offset(row["codename"]), string_offset(row["microarchitecture"]),
+            string_offset(row["generation"]),
+        ))
+    records.sort(key=lambda record: record[:4])
+
+    string_table = _HEADER.size + len(records) * _RECORD.size
+    index = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(records), string_table))
+    for record in records:
+        index.extend(_RECORD.pack(*record))
+    index.extend(strings)
+    return bytes(index)
+
+
+class CodenameManager:
+    """
+    Looks up the codename and microarchitecture of a CPU from its CPUID signature.
+
+    The index is mapped into memory on the first lookup, so importing PySysInfo does not read it,
+    and a lookup is a binary search that only touches the pages it needs.
+    """
+
+    def __init__(self, path: str = CODENAMES_INDEX_PATH):
+        self.path = path
+        self._index: Optional[mmap.mmap] = None
+        self._count = 0
+        self._strings = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> mmap.mmap:
+        with self._lock:
+            if self._index is None:
+                fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                try:
+                    index = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                finally:
+                    # The mapping stays valid after the file is closed
+                    os.close(fd)
+                magic, version, count, strings = _HEADER.unpack_from(index, 0)
+                if magic != _MAGIC or version != _VERSION:
+                    index.close()
+                    raise ValueError(f"{self.path} is not a version {_VERSION} codename index")
+                self._count, self._strings = count, strings
+                self._index = index
+            return self._index
+
+    def _record(self, index: mmap.mmap, position: int) -> tuple:
+        return _RECORD.unpack_from(index, _HEADER.size + position * _RECORD.size)
+
+    def _string(self, index: mmap.mmap, offset: int) -> str:
+        start = self._strings + offset
+        return index[start:index.find(b"\0", start)].decode("utf-8")
+
+    def lookup(self, vendor: str, family: int, model: int, stepping: Optional[int] = None) -> Optional[CPUCodename]:
+        """
+        :param vendor: CPUID vendor string, e.g. ``GenuineIntel``, as in the ``vendor_id`` line of ``/proc/cpuinfo``
+        :param family: e.g. ``6``, as in the ``cpu family`` line of ``/proc/cpuinfo``
+        :param model: e.g. ``183``, as in the ``model`` line of ``/proc/cpuinfo``
+        :param stepping: Tells apart CPUs that share a model, e.g. Skylake-SP and Cascade Lake.
+                         If it is not given, such CPUs are not looked up.
+        :return: The codename, or ``None`` if the CPU is not in the index
+        """
+        vendor_number = VENDORS.get(vendor)
+        if vendor_number is None:
+            return None
+
+        index = self._load()
+        key = (vendor_number, family, model)
+
+        # Find the first record of this model
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(index, middle)[:3] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        candidates: List[tuple] = []
+        while low < self._count and (record := self._record(index, low))[:3] == key:
+            candidates.append(record)
+            low += 1
+
+        if stepping is not None:
+            candidates = [record for record in candidates if record[3] <= stepping <= record[4]]
+        if len(candidates) != 1:
+            return None
+
+        return CPUCodename(*(self._string(index, offset) for offset in candidates[0][5:]))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+
+#: Shared by every collector, so the index is mapped once per process
+default_codename_manager = CodenameManager()
+
+
+if __name__ == "__main__":
+    with open(CODENAMES_INDEX_PATH, "wb") as index_file:
+        index_file.write(build_index())
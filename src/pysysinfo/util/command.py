@@ -0,0 +1,254 @@
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from pysysinfo.util.deadline import DEFAULT_PROBE_TIMEOUT, Deadline, probe_timeout
+
+#: Cache lifetime, in seconds, for commands that describe hardware which does not change while the machine runs,
+#: e.g. ``uname -m`` or ``lspci -vmm``.
+STATIC_TTL = 300.0
+
+#: Cache lifetime, in seconds, for commands whose output changes at runtime, e.g. the current PCIe link generation.
+#: It only saves repeated spawns within a single collection.
+SHORT_TTL = 5.0
+
+#: Seconds to wait for a killed process to exit. A process stuck in the kernel (D state) is abandoned after this.
+KILL_GRACE = 1.0
+
+Command = Union[Sequence[str], str]
+
+
+def run_process(command: Command, timeout: Optional[float] = None, shell: bool = False,
+                text: bool = True) -> subprocess.CompletedProcess:
+    """
+    Runs a command and captures its output, like ``subprocess.run(capture_output=True)``.
+
+    ``subprocess.run`` waits without a limit for the process it killed on a timeout,
+    which never returns if the process is stuck in the kernel, e.g. ``nvidia-smi`` on a hung driver.
+    Here, a killed process that does not exit within ``KILL_GRACE`` is abandoned, and the caller gets on with it.
+
+    :raises subprocess.TimeoutExpired: If the command does not finish within ``timeout`` seconds
+    """
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell, text=text)
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        try:
+            process.communicate(timeout=KILL_GRACE)
+        except subprocess.TimeoutExpired:
+            # Only our ends of the pipes are closed. The process is reaped by `subprocess` if it ever exits.
+            for pipe in (process.stdout, process.stderr):
+                pipe.close()
+        raise
+    except BaseException:
+        process.kill()
+        raise
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+
+class CommandStats(BaseModel):
+    #: Number of times the program was actually started
+    spawns: int = 0
+    #: Number of calls answered from the cache
+    cache_hits: int = 0
+    #: Number of calls that waited for an identical command which was already running
+    deduplicated: int = 0
+    #: Number of spawns that raised, or exited with a non-zero code
+    failures: int = 0
+    #: Total time spent in spawned processes, in seconds
+    total_seconds: float = 0.0
+    #: Longest single spawn, in seconds
+    max_seconds: float = 0.0
+
+
+def _program(command: Command) -> str:
+    if isinstance(command, str):
+        return command.split(maxsplit=1)[0] if command.strip() else ""
+    return command[0] if command else ""
+
+
+class CommandRunner:
+    """
+    Runs the external tools used by the collectors.
+
+    Output is cached per command line for the TTL given by the caller, so repeated ``fetch_*`` calls
+    do not start the same tool again. If an identical command is already running, callers wait for its result
+    instead of starting another copy.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        """
+        :param max_workers: Maximum number of commands that ``run_many()`` runs at the same time
+        """
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._cache: Dict[tuple, Tuple[float, subprocess.CompletedProcess]] = {}
+        self._in_flight: Dict[tuple, Future] = {}
+        self._stats: Dict[str, CommandStats] = {}
+
+    def _stats_for(self, command: Command) -> CommandStats:
+        # Must be called with the lock held
+        return self._stats.setdefault(_program(command), CommandStats())
+
+    def _cached(self, key: tuple, command: Command) -> Optional[subprocess.CompletedProcess]:
+        # Must be called with the lock held
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._stats_for(command).cache_hits += 1
+        return result
+
+    def run(
+            self,
+            command: Command,
+            ttl: float = 0.0,
+            deadline: Optional[Deadline] = None,
+            shell: bool = False,
+            text: bool = True,
+            check: bool = False,
+            default_timeout: Optional[float] = DEFAULT_PROBE_TIMEOUT,
+    ) -> subprocess.CompletedProcess:
+        """
+        :param command: The argv list, or a string if ``shell`` is set
+        :param ttl: Seconds for which a successful result is reused. ``0`` disables caching,
+                    but identical concurrent calls still share one process.
+        :param deadline: The process is killed if it runs past this deadline
+        :param shell: Run the command through the shell
+        :param text: Decode stdout and stderr to ``str``
+        :param check: Raise ``subprocess.CalledProcessError`` if the command exits with a non-zero code
+        :param default_timeout: Seconds the command may run for when there is no deadline.
+                                ``None`` lets slow tools, e.g. ``system_profiler``, run for as long as they take.
+        :return: The completed process, with stdout and stderr captured
+        :raises subprocess.TimeoutExpired: If the command does not finish before the deadline
+        """
+        key = (command if isinstance(command, str) else tuple(command), shell, text)
+
+        with self._lock:
+            result = self._cached(key, command)
+        if result is None:
+            # Computed outside the lock, since it raises if the deadline has already passed
+            timeout = probe_timeout(
+                deadline, list(command) if not isinstance(command, str) else [command], default_timeout
+            )
+
+            with self._lock:
+                result = self._cached(key, command)
+                future = self._in_flight.get(key)
+                owner = result is None and future is None
+                if owner:
+                    future = self._in_flight[key] = Future()
+                elif result is None:
+                    self._stats_for(command).deduplicated += 1
+
+            if owner:
+                result = self._spawn(key, command, ttl, timeout, shell, text, future)
+            elif result is None:
+                try:
+                    result = future.result(timeout=timeout)
+                except FutureTimeoutError:
+                    raise subprocess.TimeoutExpired(command, timeout)
+
+        if check:
+            result.check_returncode()
+        return result
+
+    def _spawn(self, key: tuple, command: Command, ttl: float, timeout: Optional[float], shell: bool, text: bool,
+               future: Future) -> subprocess.CompletedProcess:
+        start = time.monotonic()
+        try:
+            # `run_process` is looked up on the module at call time, so it can be patched in tests
+            result = run_process(command, timeout=timeout, shell=shell, text=text)
+        except BaseException as e:
+            self._finish(key, command, time.monotonic() - start, None, ttl)
+            future.set_exception(e)
+            raise
+
+        self._finish(key, command, time.monotonic() - start, result, ttl)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: tuple, command: Command, duration: float,
+                result: Optional[subprocess.CompletedProcess], ttl: float) -> None:
+        succeeded = result is not None and getattr(result, "returncode", None) == 0
+        with self._lock:
+            del self._in_flight[key]
+            stats = self._stats_for(command)
+            stats.spawns += 1
+            stats.total_seconds += duration
+            stats.max_seconds = max(stats.max_seconds, duration)
+            if not succeeded:
+                stats.failures += 1
+            elif ttl > 0:
+                # Failures are not cached, since the tool may work on the next attempt
+                self._cache[key] = (time.monotonic() + ttl, result)
+
+    def run_many(
+            self,
+            commands: Sequence[Command],
+            ttl: float = 0.0,
+            deadline: Optional[Deadline] = None,
+            shell: bool = False,
+            text: bool = True,
+            default_timeout: Optional[float] = DEFAULT_PROBE_TIMEOUT,
+    ) -> List[Union[subprocess.CompletedProcess, Exception]]:
+        """
+        Runs independent commands in parallel.
+        With a ``ttl``, this also warms the cache, so later ``run()`` calls for the same commands return at once.
+
+        :return: The result of each command, in order. If a command raised, its exception is returned in its place.
+        """
+        if not commands:
+            return []
+
+        def run_one(command: Command) -> Union[subprocess.CompletedProcess, Exception]:
+            try:
+                return self.run(
+                    command, ttl=ttl, deadline=deadline, shell=shell, text=text, default_timeout=default_timeout
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(commands))) as executor:
+            return list(executor.map(run_one, commands))
+
+    def invalidate(self, command: Optional[Command] = None, program: Optional[str] = None) -> None:
+        """
+        Drops cached output. If neither ``command`` nor ``program`` is given, the whole cache is cleared.
+
+        :param command: Only drop the output of this command
+        :param program: Only drop the output of commands that run this program, e.g. ``lspci``
+        """
+        with self._lock:
+            if command is None and program is None:
+                self._cache.clear()
+                return
+            if command is not None:
+                target = command if isinstance(command, str) else tuple(command)
+                keys = [k for k in self._cache if k[0] == target]
+            else:
+                keys = [k for k in self._cache if _program(k[0]) == program]
+            for key in keys:
+                del self._cache[key]
+
+    def stats(self) -> Dict[str, CommandStats]:
+        """:return: Spawn counts and durations, per program name"""
+        with self._lock:
+            return {program: stats.model_copy() for program, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+#: The runner shared by all collectors.
+default_runner = CommandRunner()
@@ -0,0 +1,53 @@
+import subprocess
+import time
+from typing import List, Optional
+
+#: Timeout, in seconds, for a single external tool when no deadline is given.
+#: This keeps a wedged tool (e.g. ``nvidia-smi`` with a hung driver) from blocking forever.
+DEFAULT_PROBE_TIMEOUT = 10.0
+
+
+class Deadline:
+    """
+    An overall time budget, shared by every probe of a collection.
+
+    Each probe gets the time that is left, so a slow probe leaves less time for the ones after it,
+    and the whole collection finishes within the budget.
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        """
+        :param budget: The budget in seconds. ``None`` means there is no overall limit.
+        """
+        self.budget = budget
+        self._end = None if budget is None else time.monotonic() + budget
+
+    def remaining(self) -> Optional[float]:
+        """:return: Seconds left, or ``None`` if there is no limit"""
+        if self._end is None:
+            return None
+        return max(0.0, self._end - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self._end is not None and time.monotonic() >= self._end
+
+
+def probe_timeout(deadline: Optional[Deadline], command: List[str],
+                  default: Optional[float] = DEFAULT_PROBE_TIMEOUT) -> Optional[float]:
+    """
+    :param deadline: The deadline of the collection, if any
+    :param command: The command that is about to be run
+    :param default: The timeout when there is no deadline. ``None`` means the command may run for as long as it takes.
+    :return: The timeout to run this command with
+    :raises subprocess.TimeoutExpired: If the deadline has already passed, so the command is not started at all
+    """
+    if deadline is None:
+        return default
+
+    remaining = deadline.remaining()
+    if remaining is None:
+        return default
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(command, 0)
+    return remaining
@@ -0,0 +1,123 @@
+import os
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+#: Where distributions install the USB ID database, most common first
+USB_IDS_PATHS = (
+    "/usr/share/hwdata/usb.ids",
+    "/usr/share/misc/usb.ids",
+    "/usr/share/usb.ids",
+    "/var/lib/usbutils/usb.ids",
+)
+
+
+def parse_ids(content: str) -> Tuple[Dict[int, Tuple[str, Dict[int, str]]], Dict[int, str]]:
+    """
+    Parses a database in the format of ``usb.ids`` and ``pci.ids``::
+
+        vendor  vendor_name
+        <TAB>device  device_name
+        <TAB><TAB>subvendor subdevice  subsystem_name
+        C class  class_name
+        <TAB>subclass  subclass_name
+
+    Subsystems, subclasses and the other sections of ``usb.ids`` (e.g. HID usages) are skipped.
+
+    :return: vendor id -> (vendor name, device id -> device name), and class id -> class name
+    """
+    vendors: Dict[int, Tuple[str, Dict[int, str]]] = {}
+    classes: Dict[int, str] = {}
+    devices: Optional[Dict[int, str]] = None
+
+    for line in content.splitlines():
+        if not line or line.startswith("#"):
+            continue
+
+        if line.startswith("\t"):
+            # Only the devices of a vendor are kept. Deeper levels start with two tabs.
+            if devices is not None and not line.startswith("\t\t"):
+                item, _, name = line[1:].partition(" ")
+                try:
+                    devices[int(item, 16)] = name.strip()
+                except ValueError:
+                    pass
+            continue
+
+        devices = None
+        if line.startswith("C "):
+            item, _, name = line[2:].partition(" ")
+            try:
+                classes[int(item, 16)] = name.strip()
+            except ValueError:
+                pass
+            continue
+
+        item, _, name = line.partition(" ")
+        try:
+            vendor = int(item, 16)
+        except ValueError:
+            # Other sections start with an uppercase keyword, e.g. "AT" or "HID"
+            continue
+        devices = {}
+        vendors[vendor] = (name.strip(), devices)
+
+    return vendors, classes
+
+
+class IDsDatabase:
+    """
+    Resolves vendor, device and class ids to names from a ``usb.ids`` or ``pci.ids`` database,
+    without running ``lsusb`` or ``lspci``.
+
+    The database is read and parsed once, on the first lookup, and then shared by every lookup.
+    If no database is installed, every lookup returns ``None``.
+    """
+
+    def __init__(self, paths: Sequence[str]):
+        """:param paths: Candidate paths of the database. The first one that exists is read."""
+        self.paths = tuple(paths)
+        self._vendors: Optional[Dict[int, Tuple[str, Dict[int, str]]]] = None
+        self._classes: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[int, Tuple[str, Dict[int, str]]]:
+        with self._lock:
+            if self._vendors is None:
+                vendors, classes = {}, {}
+                for path in self.paths:
+                    if not os.path.isfile(path):
+                        continue
+                    try:
+                        # The databases are mostly UTF-8, but older copies have Latin-1 names
+                        with open(path, encoding="utf-8", errors="replace") as f:
+                            vendors, classes = parse_ids(f.read())
+                    except OSError:
+                        continue
+                    break
+                self._vendors, self._classes = vendors, classes
+            return self._vendors
+
+    def vendor(self, vendor_id: int) -> Optional[str]:
+        """:return: e.g. ``Logitech, Inc.`` for ``0x046d``"""
+        entry = self._load().get(vendor_id)
+        return entry[0] if entry else None
+
+    def device(self, vendor_id: int, device_id: int) -> Optional[str]:
+        """:return: e.g. ``Unifying Receiver`` for ``0x046d``, ``0xc52b``"""
+        entry = self._load().get(vendor_id)
+        return entry[1].get(device_id) if entry else None
+
+    def device_class(self, class_id: int) -> Optional[str]:
+        """:return: e.g. ``Hub`` for USB class ``0x09``"""
+        self._load()
+        return self._classes.get(class_id)
+
+    def clear(self) -> None:
+        """Drops the parsed database, so that the next lookup reads it again."""
+        with self._lock:
+            self._vendors = None
+            self._classes = {}
+
+
+#: Shared by every collector, so the database is parsed once per process
+default_usb_ids = IDsDatabase(USB_IDS_PATHS)
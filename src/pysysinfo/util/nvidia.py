@@ -1,10 +1,17 @@
+import math
 import subprocess
-from typing import Tuple
+import threading
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+from pysysinfo.util.command import KILL_GRACE, SHORT_TTL, default_runner
+from pysysinfo.util.deadline import Deadline
 
-def fetch_gpu_details_nvidia(device: str) -> Tuple[str, int, int, int]:
+
+def fetch_gpu_details_nvidia(device: str, deadline: Optional[Deadline] = None) -> Tuple[str, int, int, int]:
     """
     :param device: format: <domain>:<bus>:<slot>.<function>
+    :param deadline: ``nvidia-smi`` is killed if it runs past this deadline
     :return: GPU name, PCI Width, PCI Gen, Total VRAM in MB
     """
     # Combine all queries into a single comma-separated string
@@ -18,8 +25,8 @@ def fetch_gpu_details_nvidia(device: str) -> Tuple[str, int, int, int]:
         "--format=csv,noheader,nounits"
     ]
 
-    # Run the command
-    result = subprocess.run(command, capture_output=True, text=True)
+    # The current link generation changes with power state, so the output is only reused briefly
+    result = default_runner.run(command, ttl=SHORT_TTL, deadline=deadline)
 
     # Check for execution errors
     if result.returncode != 0:
@@ -40,3 +47,185 @@ def fetch_gpu_details_nvidia(device: str) -> Tuple[str, int, int, int]:
     vram_total = int(parts[3].strip())  # e.g., 16384 (MiB)
 
     return gpu_name, pci_width, pci_gen, vram_total
+
+
+#: Fields streamed by ``NvidiaSampler`` by default. ``pci.bus_id`` is always queried, and identifies the GPU.
+SAMPLER_FIELDS = ("utilization.gpu", "memory.used", "memory.total", "temperature.gpu", "power.draw")
+
+
+class WindowStats(NamedTuple):
+    minimum: float
+    maximum: float
+    mean: float
+    #: Number of samples in the window that had a value
+    count: int
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples. Old samples are overwritten, so memory stays constant."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = array("d", bytes(8 * capacity))
+        self._position = 0
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        self._data[self._position] = value
+        self._position = (self._position + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def values(self, window: Optional[int] = None) -> List[float]:
+        """
+        :param window: Only return this many of the most recent samples
+        :return: Samples, oldest first
+        """
+        if self._count < self.capacity:
+            ordered = self._data[:self._count]
+        else:
+            ordered = self._data[self._position:] + self._data[:self._position]
+        if window is not None:
+            ordered = ordered[-window:] if window > 0 else ordered[:0]
+        return ordered.tolist()
+
+
+def _parse_value(raw: str) -> float:
+    try:
+        return float(raw)
+    except ValueError:
+        # e.g. "[N/A]" or "[Not Supported]"
+        return math.nan
+
+
+class NvidiaSampler:
+    """
+    Samples every NVIDIA GPU through one long-running ``nvidia-smi --loop-ms`` process.
+
+    The streamed CSV is parsed line by line as it arrives, and each field is kept in a per-GPU ring buffer,
+    so statistics over recent samples are available without starting a process per sample.
+    """
+
+    def __init__(
+            self,
+            interval_ms: int = 1000,
+            capacity: int = 300,
+            fields: Sequence[str] = SAMPLER_FIELDS,
+            executable: str = "nvidia-smi",
+    ):
+        """
+        :param interval_ms: Time between samples, in milliseconds
+        :param capacity: Number of samples kept per GPU and field
+        :param fields: ``nvidia-smi --query-gpu`` fields to sample. They must be numeric.
+        :param executable: Path to ``nvidia-smi``
+        """
+        self.interval_ms = interval_ms
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self.executable = executable
+
+        # bus id -> field -> samples
+        self._buffers: Dict[str, Dict[str, RingBuffer]] = {}
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def command(self) -> List[str]:
+        return [
+            self.executable,
+            f"--query-gpu=pci.bus_id,{','.join(self.fields)}",
+            "--format=csv,noheader,nounits",
+            f"--loop-ms={self.interval_ms}",
+        ]
+
+    def feed(self, line: str) -> None:
+        """Folds one line of ``nvidia-smi`` CSV output into the buffers. Malformed lines are ignored."""
+        parts = [part.strip() for part in line.split(",")]
+        if len(parts) != len(self.fields) + 1 or not parts[0]:
+            return
+
+        bus_id = parts[0]
+        with self._lock:
+            buffers = self._buffers.get(bus_id)
+            if buffers is None:
+                buffers = self._buffers[bus_id] = {field: RingBuffer(self.capacity) for field in self.fields}
+            for field, raw in zip(self.fields, parts[1:]):
+                buffers[field].append(_parse_value(raw))
+
+    def _read(self, stream) -> None:
+        for line in stream:
+            self.feed(line)
+
+    def start(self) -> None:
+        """
+        :raises OSError: If ``nvidia-smi`` can not be started
+        """
+        self._process = subprocess.Popen(
+            self.command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
+        self._thread = threading.Thread(
+            target=self._read, args=(self._process.stdout,), name="pysysinfo-nvidia-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._process is None:
+            return
+
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            try:
+                self._process.wait(timeout=KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                # Stuck in the kernel (D state), e.g. on a hung driver. It is abandoned, as in `run_process()`.
+                pass
+        self._thread.join(timeout=KILL_GRACE)
+        if not self._thread.is_alive():
+            # Closing the pipe while the reader is blocked on it would block too.
+            # The reader is a daemon thread, and ends when the abandoned process exits.
+            self._process.stdout.close()
+        self._process = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def gpus(self) -> List[str]:
+        """:return: PCI bus ids of the GPUs seen so far"""
+        with self._lock:
+            return list(self._buffers)
+
+    def samples(self, bus_id: str, field: str, window: Optional[int] = None) -> List[float]:
+        """
+        :param bus_id: PCI bus id as reported by ``nvidia-smi``, e.g. ``00000000:01:00.0``
+        :param field: One of the sampled fields
+        :param window: Only return this many of the most recent samples
+        :return: Samples, oldest first. Missing values are ``nan``.
+        """
+        with self._lock:
+            buffers = self._buffers.get(bus_id)
+            if buffers is None:
+                return []
+            return buffers[field].values(window)
+
+    def stats(self, bus_id: str, field: str, window: Optional[int] = None) -> Optional[WindowStats]:
+        """:return: Minimum, maximum and mean of the window, or ``None`` if it has no values"""
+        values = [value for value in self.samples(bus_id, field, window) if not math.isnan(value)]
+        if not values:
+            return None
+        return WindowStats(min(values), max(values), math.fsum(values) / len(values), len(values))
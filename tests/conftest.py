@@ -0,0 +1,11 @@
+import pytest
+
+from pysysinfo.util.command import default_runner
+
+
+@pytest.fixture(autouse=True)
+def clear_command_cache():
+    # Tests mock `run_process` with different outputs for the same command line
+    default_runner.invalidate()
+    yield
+    default_runner.invalidate()
@@ -0,0 +1,140 @@
+import os
+import stat
+import time
+
+import pytest
+
+from pysysinfo.daemon.client import InventoryClient, query
+from pysysinfo.daemon.server import InventoryDaemon
+from pysysinfo.models.cpu_models import CPUInfo
+from pysysinfo.models.info_models import HardwareManagerInterface, LinuxHardwareInfo
+from pysysinfo.models.memory_models import MemoryInfo
+from pysysinfo.models.usb_models import USBDevice, USBInfo
+
+
+class FakeManager(HardwareManagerInterface):
+    def __init__(self):
+        self.info = LinuxHardwareInfo()
+        self.cpu_calls = 0
+
+    def fetch_cpu_info(self) -> CPUInfo:
+        self.cpu_calls += 1
+        self.info.cpu = CPUInfo(name=f"Test CPU {self.cpu_calls}", cores=4)
+        return self.info.cpu
+
+    def fetch_memory_info(self) -> MemoryInfo:
+        self.info.memory = MemoryInfo()
+        return self.info.memory
+
+    def fetch_usb_info(self) -> USBInfo:
+        self.info.usb = USBInfo(devices=[USBDevice(port="usb1")])
+        return self.info.usb
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    d = InventoryDaemon(manager=FakeManager(), socket_path=str(tmp_path / "inv.sock"))
+    d.start()
+    yield d
+    d.stop()
+
+
+class TestInventoryDaemon:
+
+    def test_query_single_component(self, daemon):
+        data = query("cpu", socket_path=daemon.socket_path)
+        assert data["name"] == "Test CPU 1"
+        assert data["cores"] == 4
+        assert data["status"]["type"] == "success"
+
+    def test_query_all_skips_unimplemented_components(self, daemon):
+        data = query("all", socket_path=daemon.socket_path)
+        # The interface's default fetch methods return None, so they are not served
+        assert set(data) == {"cpu", "memory", "usb"}
+        assert data["cpu"]["name"] == "Test CPU 1"
+        assert data["usb"]["devices"][0]["port"] == "usb1"
+
+    def test_query_unknown_component(self, daemon):
+        data = query("audio", socket_path=daemon.socket_path)
+        assert "error" in data
+
+    def test_persistent_connection(self, daemon):
+        with InventoryClient(daemon.socket_path) as client:
+            for _ in range(5):
+                assert client.query("cpu")["name"] == "Test CPU 1"
+        # Queries are served from memory, without collecting again
+        assert daemon.manager.cpu_calls == 1
+
+    def test_invalidate_triggers_refresh(self, daemon):
+        refreshed_at = daemon.last_refresh["cpu"]
+        daemon.invalidate("cpu")
+        deadline = time.monotonic() + 2
+        while daemon.last_refresh["cpu"] == refreshed_at and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert query("cpu", socket_path=daemon.socket_path)["name"] == "Test CPU 2"
+        assert query("all", socket_path=daemon.socket_path)["cpu"]["name"] == "Test CPU 2"
+
+    def test_invalidate_only_drops_the_component(self, tmp_path, monkeypatch):
+        topology_resets, dropped = [], []
+        monkeypatch.setattr("pysysinfo.daemon.server.invalidate_pci_topology", lambda: topology_resets.append(1))
+        monkeypatch.setattr("pysysinfo.daemon.server.default_runner.invalidate",
+                            lambda command=None, program=None: dropped.append(program))
+        d = InventoryDaemon(manager=FakeManager(), socket_path=str(tmp_path / "inv.sock"))
+
+        d.invalidate("usb")
+        d.invalidate("storage")
+        assert (topology_resets, dropped) == ([], [])
+
+        d.invalidate("network")
+        assert (topology_resets, dropped) == ([1], ["lspci"])
+
+    def test_stop_removes_socket(self, tmp_path):
+        path = tmp_path / "inv.sock"
+        d = InventoryDaemon(manager=FakeManager(), socket_path=str(path))
+        d.start()
+        assert path.exists()
+        d.stop()
+        assert not path.exists()
+
+    def test_socket_is_private(self, daemon):
+        assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+
+    def test_socket_is_private_from_bind(self, tmp_path, monkeypatch):
+        modes = []
+        chmod = os.chmod
+
+        def record(path, mode):
+            modes.append(stat.S_IMODE(os.stat(path).st_mode))
+            chmod(path, mode)
+
+        monkeypatch.setattr(os, "chmod", record)
+        d = InventoryDaemon(manager=FakeManager(), socket_path=str(tmp_path / "inv.sock"), socket_mode=0o660)
+        d.start()
+        d.stop()
+
+        # Before its mode was set, only the owner could connect
+        assert modes == [0o600]
+
+    @pytest.mark.parametrize("socket_mode, dir_mode", [(0o600, 0o700), (0o660, 0o710), (0o666, 0o711)])
+    def test_socket_dir_mode(self, tmp_path, socket_mode, dir_mode):
+        path = tmp_path / "run" / "inv.sock"
+        d = InventoryDaemon(manager=FakeManager(), socket_path=str(path), socket_mode=socket_mode)
+        umask = os.umask(0)
+        try:
+            d.start()
+        finally:
+            os.umask(umask)
+        d.stop()
+
+        assert stat.S_IMODE(os.stat(path.parent).st_mode) == dir_mode
+
+    def test_start_does_not_remove_other_files(self, tmp_path):
+        path = tmp_path / "inv.sock"
+        path.write_text("not a socket")
+        d = InventoryDaemon(manager=FakeManager(), socket_path=str(path))
+
+        with pytest.raises(FileExistsError):
+            d.start()
+        d.stop()
+        assert path.read_text() == "not a socket"
@@ -0,0 +1,119 @@
+import os
+import queue
+import struct
+import sys
+
+import pytest
+
+from pysysinfo.daemon.watcher import (
+    ChangeWatcher,
+    IN_CREATE,
+    IN_DELETE,
+    IN_Q_OVERFLOW,
+    _dev_component,
+    parse_inotify_events,
+    parse_uevent,
+)
+
+
+class TestParsing:
+
+    def test_parse_inotify_events(self):
+        name = b"sdb\0\0\0\0\0"
+        buffer = struct.pack("iIII", 1, IN_CREATE, 0, len(name)) + name
+        buffer += struct.pack("iIII", 2, IN_DELETE, 0, 0)
+
+        assert parse_inotify_events(buffer) == [(1, IN_CREATE, "sdb"), (2, IN_DELETE, "")]
+
+    def test_parse_uevent_block(self):
+        message = b"add@/devices/pci0000:00/block/sdb\0ACTION=add\0DEVPATH=/devices/pci0000:00/block/sdb\0" \
+                  b"SUBSYSTEM=block\0DEVNAME=sdb\0"
+        event = parse_uevent(message)
+
+        assert event.component == "storage"
+        assert event.action == "add"
+        assert event.name == "sdb"
+        assert event.source == "uevent"
+
+    def test_parse_uevent_net_interface(self):
+        message = b"remove@/devices/virtual/net/veth0\0ACTION=remove\0SUBSYSTEM=net\0INTERFACE=veth0\0"
+        event = parse_uevent(message)
+
+        assert event.component == "network"
+        assert event.name == "veth0"
+
+    def test_parse_uevent_unrelated_subsystem(self):
+        assert parse_uevent(b"change@/devices/x\0ACTION=change\0SUBSYSTEM=power_supply\0") is None
+
+    def test_parse_uevent_pci_and_usb(self):
+        pci = parse_uevent(b"add@/devices/pci0000:00/0000:00:1c.0/0000:03:00.0\0ACTION=add\0SUBSYSTEM=pci\0"
+                           b"DEVPATH=/devices/pci0000:00/0000:00:1c.0/0000:03:00.0\0")
+        usb = parse_uevent(b"remove@/devices/pci0000:00/0000:00:14.0/usb1/1-2\0ACTION=remove\0SUBSYSTEM=usb\0"
+                           b"DEVNAME=bus/usb/001/004\0")
+
+        assert (pci.component, pci.name) == ("pci", "0000:03:00.0")
+        assert (usb.component, usb.action) == ("usb", "remove")
+
+    def test_dev_component(self):
+        assert _dev_component("nvme0n1") == "storage"
+        assert _dev_component("dm-3") == "storage"
+        assert _dev_component("nvidia0") == "graphics"
+        assert _dev_component("tty1") is None
+
+
+class TestChangeWatcher:
+
+    def test_inotify_events_are_pushed(self, tmp_path):
+        events = queue.Queue()
+        watcher = ChangeWatcher(paths={str(tmp_path): "storage"}, netlink=False)
+        watcher.subscribe(events.put)
+        watcher.start()
+        try:
+            (tmp_path / "sdb").mkdir()
+            event = events.get(timeout=2)
+            assert (event.component, event.action, event.name) == ("storage", "add", "sdb")
+
+            (tmp_path / "sdb").rmdir()
+            event = events.get(timeout=2)
+            assert (event.component, event.action) == ("storage", "remove")
+        finally:
+            watcher.stop()
+
+    def test_unclassified_entries_are_ignored(self, tmp_path):
+        events = queue.Queue()
+        watcher = ChangeWatcher(paths={str(tmp_path): None}, netlink=False)
+        watcher.subscribe(events.put)
+        watcher.start()
+        try:
+            (tmp_path / "tty5").touch()
+            (tmp_path / "nvme1n1").touch()
+            assert events.get(timeout=2).name == "nvme1n1"
+            with pytest.raises(queue.Empty):
+                events.get(timeout=0.1)
+        finally:
+            watcher.stop()
+
+    def test_overflow_of_dev_watch(self):
+        events = []
+        watcher = ChangeWatcher(paths={"/dev": None, "/dev/dri": "graphics"}, netlink=False)
+        watcher.subscribe(events.append)
+        watcher._watches = {1: None, 2: "graphics"}
+        read_fd, write_fd = os.pipe()
+        watcher._inotify_fd = read_fd
+        try:
+            os.write(write_fd, struct.pack("iIII", -1, IN_Q_OVERFLOW, 0, 0))
+            watcher._handle_inotify()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        # Each component once, even though both watches can produce graphics
+        assert [(event.component, event.action) for event in events] == [("graphics", "change"), ("storage", "change")]
+
+    def test_unsupported_platform(self, monkeypatch):
+        monkeypatch.setattr(sys, "platform", "darwin")
+        watcher = ChangeWatcher()
+
+        with pytest.raises(NotImplementedError):
+            watcher.start()
+        watcher.stop()
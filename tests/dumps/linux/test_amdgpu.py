@@ -0,0 +1,96 @@
+from pysysinfo.dumps.linux.amdgpu import AMDGPUSampler, parse_dpm_clock
+from pysysinfo.dumps.linux.common import SysfsAttribute
+
+
+def _make_gpu(root, slot="0000:03:00.0", vendor="0x1002"):
+    device = root / slot
+    hwmon = device / "hwmon" / "hwmon4"
+    hwmon.mkdir(parents=True)
+    files = {
+        device / "vendor": vendor,
+        device / "gpu_busy_percent": "37",
+        device / "mem_info_vram_used": str(512 * 1024 ** 2),
+        device / "mem_info_vram_total": str(8 * 1024 ** 3),
+        device / "pp_dpm_sclk": "0: 500Mhz\n1: 1800Mhz *\n2: 2500Mhz\n",
+        device / "pp_dpm_mclk": "0: 96Mhz *\n1: 1000Mhz\n",
+        hwmon / "temp1_input": "45000",
+        hwmon / "temp1_label": "edge",
+        hwmon / "temp2_input": "52500",
+        hwmon / "temp2_label": "junction",
+        hwmon / "power1_average": "23000000",
+    }
+    for path, content in files.items():
+        path.write_text(content + "\n")
+    return device
+
+
+class TestSysfsAttribute:
+
+    def test_reads_fresh_value_every_time(self, tmp_path):
+        path = tmp_path / "gpu_busy_percent"
+        path.write_text("10\n")
+        with SysfsAttribute(str(path)) as attribute:
+            assert attribute.read_int() == 10
+            path.write_text("90\n")
+            assert attribute.read_int() == 90
+
+
+class TestAMDGPUSampler:
+
+    def test_parse_dpm_clock(self):
+        assert parse_dpm_clock("0: 500Mhz\n1: 800Mhz *\n") == 800
+        assert parse_dpm_clock("0: 500Mhz\n1: 800Mhz\n") is None
+        assert parse_dpm_clock("") is None
+
+    def test_sample(self, tmp_path):
+        _make_gpu(tmp_path)
+
+        with AMDGPUSampler(str(tmp_path)) as sampler:
+            samples = sampler.sample()
+
+        assert len(samples) == 1
+        sample = samples[0]
+        assert sample.slot == "0000:03:00.0"
+        assert sample.busy_percent == 37
+        assert sample.vram_used == 512 * 1024 ** 2
+        assert sample.vram_total == 8 * 1024 ** 3
+        assert sample.temperatures == {"edge": 45.0, "junction": 52.5}
+        assert sample.power_watts == 23.0
+        assert sample.sclk_mhz == 1800
+        assert sample.mclk_mhz == 96
+
+    def test_handles_are_reused_across_samples(self, tmp_path):
+        device = _make_gpu(tmp_path)
+
+        with AMDGPUSampler(str(tmp_path)) as sampler:
+            assert sampler.sample()[0].busy_percent == 37
+            (device / "gpu_busy_percent").write_text("99\n")
+            assert sampler.sample()[0].busy_percent == 99
+
+    def test_skips_other_vendors_and_unbound_devices(self, tmp_path):
+        _make_gpu(tmp_path, "0000:01:00.0", vendor="0x10de")
+        unbound = tmp_path / "0000:02:00.0"
+        unbound.mkdir()
+        (unbound / "vendor").write_text("0x1002\n")
+        _make_gpu(tmp_path, "0000:03:00.0")
+
+        with AMDGPUSampler(str(tmp_path)) as sampler:
+            assert sampler.slots == ["0000:03:00.0"]
+
+    def test_missing_attributes(self, tmp_path):
+        device = tmp_path / "0000:03:00.0"
+        device.mkdir()
+        (device / "vendor").write_text("0x1002\n")
+        (device / "mem_info_vram_total").write_text("1024\n")
+
+        with AMDGPUSampler(str(tmp_path)) as sampler:
+            sample = sampler.sample()[0]
+
+        assert sample.vram_total == 1024
+        assert sample.busy_percent is None
+        assert sample.temperatures == {}
+        assert sample.power_watts is None
+        assert sample.sclk_mhz is None
+
+    def test_no_pci_root(self, tmp_path):
+        assert AMDGPUSampler(str(tmp_path / "missing")).sample() == []
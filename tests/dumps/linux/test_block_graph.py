@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from pysysinfo.dumps.linux.block_graph import fetch_block_graph
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _make_device(devices, block, name, dev, sectors, parent=None, holders=(), slaves=(), extra=None):
+    path = devices / parent / name if parent else devices / name
+    path.mkdir(parents=True)
+    (path / "dev").write_text(dev + "\n")
+    (path / "size").write_text(f"{sectors}\n")
+    for relation, names in (("holders", holders), ("slaves", slaves)):
+        (path / relation).mkdir()
+        for other in names:
+            (path / relation / other).touch()
+    for relative, content in (extra or {}).items():
+        (path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (path / relative).write_text(content + "\n")
+    os.symlink(path, block / name)
+
+
+@pytest.fixture
+def block_root(tmp_path):
+    """
+    sda1 -> dm-1 (LUKS)
+    sda2 + sdb2 -> md0 (RAID1) -> dm-0 (LVM)
+    """
+    devices = tmp_path / "devices"
+    block = tmp_path / "class" / "block"
+    block.mkdir(parents=True)
+    gib = 2 * 1024 ** 2
+
+    _make_device(devices, block, "sda", "8:0", 100 * gib)
+    _make_device(devices, block, "sda1", "8:1", gib, parent="sda", holders=["dm-1"], extra={"partition": "1"})
+    _make_device(devices, block, "sda2", "8:2", 99 * gib, parent="sda", holders=["md0"], extra={"partition": "2"})
+    _make_device(devices, block, "sdb", "8:16", 100 * gib)
+    _make_device(devices, block, "sdb2", "8:18", 99 * gib, parent="sdb", holders=["md0"], extra={"partition": "2"})
+    _make_device(devices, block, "md0", "9:0", 99 * gib, holders=["dm-0"], slaves=["sda2", "sdb2"],
+                 extra={"md/level": "raid1"})
+    _make_device(devices, block, "dm-0", "253:0", 50 * gib, slaves=["md0"],
+                 extra={"dm/name": "vg0-data", "dm/uuid": "LVM-abcdef"})
+    _make_device(devices, block, "dm-1", "253:1", gib, slaves=["sda1"],
+                 extra={"dm/name": "luks-root", "dm/uuid": "CRYPT-LUKS2-1234"})
+    _make_device(devices, block, "loop0", "7:0", 0)
+    _make_device(devices, block, "zram0", "252:0", gib)
+    return str(block)
+
+
+class TestBlockGraph:
+
+    def test_devices(self, block_root):
+        status = Status()
+        graph = fetch_block_graph(block_root, status)
+
+        assert status.type == StatusType.SUCCESS
+        assert {d.name: d.kind for d in graph.devices} == {
+            "sda": "disk", "sda1": "partition", "sda2": "partition", "sdb": "disk", "sdb2": "partition",
+            "md0": "md", "dm-0": "lvm", "dm-1": "dm", "loop0": "loop", "zram0": "zram",
+        }
+
+        partition = graph.get("sda2")
+        assert partition.parent == "sda"
+        assert partition.partition_number == 2
+        assert partition.size.capacity == 99 * 1024
+
+        assert graph.get("md0").md_level == "raid1"
+        assert graph.get("md0").slaves == ["sda2", "sdb2"]
+        assert graph.get("dm-0").dm_name == "vg0-data"
+
+    def test_lookup_by_dev(self, block_root):
+        graph = fetch_block_graph(block_root)
+
+        assert graph.get_by_dev("253:0").name == "dm-0"
+        assert graph.get_by_dev("8:18").name == "sdb2"
+        assert graph.get_by_dev("1:1") is None
+
+    def test_physical_disks(self, block_root):
+        graph = fetch_block_graph(block_root)
+
+        assert graph.physical_disks("dm-0") == ["sda", "sdb"]
+        assert graph.physical_disks("dm-1") == ["sda"]
+        assert graph.physical_disks("sdb") == ["sdb"]
+        assert graph.physical_disks("zram0") == ["zram0"]
+        assert graph.physical_disks("missing") == []
+
+    def test_upper(self, block_root):
+        graph = fetch_block_graph(block_root)
+
+        assert sorted(graph.upper("sda")) == ["dm-0", "dm-1", "md0", "sda1", "sda2"]
+        assert graph.upper("dm-0") == []
+
+    def test_no_sys_class_block(self, tmp_path):
+        status = Status()
+        graph = fetch_block_graph(str(tmp_path / "missing"), status)
+
+        assert graph.devices == []
+        assert status.type == StatusType.FAILED
+
+    def test_unreadable_device_is_partial(self, block_root):
+        os.remove(os.path.join(block_root, "loop0", "dev"))
+
+        status = Status()
+        graph = fetch_block_graph(block_root, status)
+
+        assert graph.get("loop0") is None
+        assert status.type == StatusType.PARTIAL
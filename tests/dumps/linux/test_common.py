@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from pysysinfo.dumps.linux.common import (PCITopology, list_optional, natural_key, parse_link_speed,
+                                          pcie_gen_from_speed, read_int, read_optional)
+
+# A GPU behind a two-level PCIe switch, and a function on the root bus
+DEVICES = [
+    "pci0000:00/0000:00:1f.3",
+    "pci0000:00/0000:00:01.0",
+    "pci0000:00/0000:00:01.0/0000:01:00.0",
+    "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0",
+    "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0/0000:03:00.0",
+    "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0/0000:03:00.1",
+]
+
+
+@pytest.fixture
+def pci_root(tmp_path):
+    bus = tmp_path / "bus" / "pci" / "devices"
+    bus.mkdir(parents=True)
+    for device in DEVICES:
+        path = tmp_path / "devices" / device
+        path.mkdir(parents=True)
+        os.symlink(path, bus / os.path.basename(device))
+    return str(bus)
+
+
+class TestPCITopology:
+
+    def test_path_walks_upstream_bridges(self, pci_root):
+        topology = PCITopology(pci_root)
+
+        assert topology.path("0000:03:00.1") == "PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)/Pci(0x8,0x0)/Pci(0x0,0x1)"
+        assert topology.path("0000:00:1f.3") == "PciRoot(0x0)/Pci(0x1f,0x3)"
+        assert topology.parent("0000:03:00.0") == "0000:02:08.0"
+        assert topology.parent("0000:00:01.0") is None
+
+    def test_paths_share_prefixes(self, pci_root):
+        topology = PCITopology(pci_root)
+
+        gpu = topology.path("0000:03:00.0")
+        audio = topology.path("0000:03:00.1")
+
+        assert gpu.rsplit("/", 1)[0] == audio.rsplit("/", 1)[0]
+        assert topology.path("0000:02:08.0") == gpu.rsplit("/", 1)[0]
+
+    def test_unknown_device_falls_back_to_device_path(self, pci_root):
+        topology = PCITopology(pci_root)
+
+        assert topology.path("0001:05:00.0") == "PciRoot(0x1)/Pci(0x0,0x0)"
+        assert topology.path("not a slot") is None
+
+    def test_no_pci_bus(self, tmp_path):
+        assert PCITopology(str(tmp_path / "missing")).path("0000:00:02.0") == "PciRoot(0x0)/Pci(0x2,0x0)"
+
+    def test_hotplugged_device(self, tmp_path, pci_root):
+        topology = PCITopology(pci_root)
+        assert topology.path("0000:03:00.2") == "PciRoot(0x0)/Pci(0x0,0x2)"
+
+        device = tmp_path / "devices" / "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0/0000:03:00.2"
+        device.mkdir()
+        os.symlink(device, os.path.join(pci_root, "0000:03:00.2"))
+
+        assert topology.path("0000:03:00.2") == "PciRoot(0x0)/Pci(0x1,0x0)/Pci(0x0,0x0)/Pci(0x8,0x0)/Pci(0x0,0x2)"
+        assert topology.parent("0000:03:00.2") == "0000:02:08.0"
+        assert "0000:03:00.2" in topology.slots
+
+
+class TestLinkSpeed:
+
+    def test_decimal_form(self):
+        assert parse_link_speed("16.0 GT/s PCIe") == 16.0
+        assert pcie_gen_from_speed("2.5 GT/s PCIe") == 1
+        assert pcie_gen_from_speed("16.0 GT/s PCIe") == 4
+
+    def test_integer_form(self):
+        assert parse_link_speed("8 GT/s") == 8.0
+        assert pcie_gen_from_speed("5 GT/s") == 2
+        assert pcie_gen_from_speed("8 GT/s") == 3
+
+    def test_unknown(self):
+        assert parse_link_speed("Unknown") is None
+        assert pcie_gen_from_speed("Unknown") is None
+        assert pcie_gen_from_speed("3.0 GT/s") is None
+
+
+class TestSysfsHelpers:
+
+    def test_read_optional_and_int(self, tmp_path):
+        (tmp_path / "numa_node").write_text("-1\n")
+        (tmp_path / "model").write_text("Samsung SSD 980 PRO 1TB  \n")
+
+        assert read_optional(str(tmp_path / "model")) == "Samsung SSD 980 PRO 1TB"
+        assert read_optional(str(tmp_path / "missing")) is None
+        assert read_int(str(tmp_path / "numa_node")) == -1
+        assert read_int(str(tmp_path / "model")) is None
+        assert read_int(str(tmp_path / "missing")) is None
+
+    def test_natural_order(self, tmp_path):
+        for name in ("nvme10", "nvme2", "nvme1"):
+            (tmp_path / name).mkdir()
+
+        assert list_optional(str(tmp_path)) == ["nvme1", "nvme2", "nvme10"]
+        assert list_optional(str(tmp_path / "missing")) == []
+        assert sorted(["intel-rapl:10", "intel-rapl:0:1", "intel-rapl:2"], key=natural_key) == \
+            ["intel-rapl:0:1", "intel-rapl:2", "intel-rapl:10"]
@@ -1,6 +1,9 @@
 import builtins
+import platform
 import subprocess
 
+import pytest
+
 from pysysinfo.dumps.linux.cpu import (
     _arm_cpu_cores,
     _x86_cpu_cores,
@@ -14,6 +17,7 @@ from pysysinfo.dumps.linux.cpu import (
     fetch_cpu_info,
 )
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.deadline import Deadline
 
 
 class TestArmCpuCores:
@@ -31,7 +35,7 @@ class TestArmCpuCores:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout=output)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         cores = _arm_cpu_cores()
         assert cores == 2
@@ -45,7 +49,7 @@ class TestArmCpuCores:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout=output)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         cores = _arm_cpu_cores()
         assert cores == 1
@@ -54,7 +58,7 @@ class TestArmCpuCores:
         def mock_run(*args, **kwargs):
             raise RuntimeError("lscpu failed")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         assert _arm_cpu_cores() is None
 
@@ -205,7 +209,7 @@ class TestFetchArmCpuInfo:
 
         monkeypatch.setattr(
             "pysysinfo.dumps.linux.cpu._arm_cpu_cores",
-            lambda: 4,
+            lambda deadline=None: 4,
         )
 
         cpu = fetch_arm_cpu_info(raw)
@@ -224,7 +228,7 @@ class TestFetchArmCpuInfo:
             "Model\t: Raspberry Pi 4\n"
         )
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -236,7 +240,7 @@ class TestFetchArmCpuInfo:
             "CPU architecture: 8\n"
         )
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -249,7 +253,7 @@ class TestFetchArmCpuInfo:
             "Hardware\t: BCM2711\n"
         )
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -262,7 +266,7 @@ class TestFetchArmCpuInfo:
             "CPU architecture: 8\n"
         )
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -276,7 +280,7 @@ class TestFetchArmCpuInfo:
             "CPU architecture: 8\n"
         )
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: None)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: None)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -286,7 +290,7 @@ class TestFetchArmCpuInfo:
     def test_fetch_arm_cpu_info_all_missing(self, monkeypatch):
         raw = ""
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: None)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: None)
 
         cpu = fetch_arm_cpu_info(raw)
 
@@ -455,12 +459,46 @@ class TestFetchCpuInfo:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout="x86_64")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         cpu = fetch_cpu_info()
         assert cpu.architecture == "x86"
         assert cpu.name == "Intel CPU"
 
+    def test_fetch_cpu_info_uname_timeout_falls_back(self, monkeypatch):
+        raw = "Hardware\t: BCM2711\nCPU architecture: 8\nprocessor\t: 0\n"
+
+        def mock_open(*args, **kwargs):
+            from io import StringIO
+            return StringIO(raw)
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+
+        def mock_run(command, *args, **kwargs):
+            raise subprocess.TimeoutExpired(command, kwargs.get("timeout"))
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+        monkeypatch.setattr(platform, "machine", lambda: "aarch64")
+
+        cpu = fetch_cpu_info(Deadline(1))
+        assert cpu.architecture == "ARM"
+        # lscpu timed out as well
+        assert cpu.cores is None
+        assert cpu.status.type == StatusType.PARTIAL
+        assert any("Could not find CPU cores" in msg and "timed out" in msg for msg in cpu.status.messages)
+
+    def test_fetch_cpu_info_arm_expired_deadline(self, monkeypatch):
+        raw = "Hardware\t: BCM2711\nCPU architecture: 8\nprocessor\t: 0\n"
+
+        monkeypatch.setattr(
+            "pysysinfo.dumps.linux.cpu._arm_cpu_cores",
+            lambda deadline=None: pytest.fail("lscpu should not be run"),
+        )
+
+        cpu = fetch_arm_cpu_info(raw, Deadline(0))
+        assert cpu.status.type == StatusType.PARTIAL
+        assert any("deadline exceeded" in msg for msg in cpu.status.messages)
+
     def test_fetch_cpu_info_arm_aarch64(self, monkeypatch):
         raw = "Hardware\t: BCM2711\nCPU architecture: 8\nprocessor\t: 0\n"
 
@@ -473,9 +511,9 @@ class TestFetchCpuInfo:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout="aarch64")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_cpu_info()
         assert cpu.architecture == "ARM"
@@ -493,9 +531,9 @@ class TestFetchCpuInfo:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout="armv7l")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_cpu_info()
         assert cpu.architecture == "ARM"
@@ -538,9 +576,9 @@ class TestLinuxCPURealWorld:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout="aarch64")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
-        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda: 4)
+        monkeypatch.setattr("pysysinfo.dumps.linux.cpu._arm_cpu_cores", lambda deadline=None: 4)
 
         cpu = fetch_cpu_info()
         assert cpu.architecture == "ARM"
@@ -562,7 +600,7 @@ class TestLinuxCPURealWorld:
         def mock_run(*args, **kwargs):
             return subprocess.CompletedProcess(args, 0, stdout="x86_64")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         cpu = fetch_cpu_info()
         assert cpu.architecture == "x86"
@@ -572,3 +610,6 @@ class TestLinuxCPURealWorld:
         assert cpu.cores == 2
         assert cpu.threads == 4
         assert "SSE4.2" in cpu.sse_flags
+        assert cpu.codename == "Kaby Lake-U"
+        assert cpu.microarchitecture == "Skylake"
+        assert cpu.generation == "7th Gen Core"
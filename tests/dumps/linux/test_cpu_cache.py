@@ -0,0 +1,79 @@
+from pysysinfo.dumps.linux import cpu_cache
+from pysysinfo.dumps.linux.cpu_cache import fetch_caches
+from pysysinfo.models.status_models import Status, StatusType
+
+# 4 cores with 2 threads each (CPU N and N + 4 are siblings), and an L3 per pair of cores
+CORES = 4
+
+
+def _siblings(cpu):
+    core = cpu % CORES
+    return f"{core},{core + CORES}"
+
+
+def _l3(cpu):
+    first = (cpu % CORES) // 2 * 2
+    return f"{first}-{first + 1},{first + CORES}-{first + CORES + 1}"
+
+
+def _make_cpus(root):
+    (root / "online").write_text(f"0-{2 * CORES - 1}\n")
+    indexes = [
+        ("index0", 1, "Data", "32K", 8, _siblings),
+        ("index1", 1, "Instruction", "32K", 8, _siblings),
+        ("index2", 2, "Unified", "512K", 8, _siblings),
+        ("index3", 3, "Unified", "16384K", 16, _l3),
+    ]
+    for cpu in range(2 * CORES):
+        for index, level, kind, size, ways, shared in indexes:
+            path = root / f"cpu{cpu}" / "cache" / index
+            path.mkdir(parents=True)
+            for name, value in {
+                "level": level, "type": kind, "size": size, "ways_of_associativity": ways,
+                "coherency_line_size": 64, "shared_cpu_list": shared(cpu),
+            }.items():
+                (path / name).write_text(f"{value}\n")
+
+
+class TestCPUCaches:
+
+    def test_shared_caches_are_deduplicated(self, tmp_path):
+        _make_cpus(tmp_path)
+
+        status = Status()
+        caches = fetch_caches(str(tmp_path), status)
+
+        assert status.type == StatusType.SUCCESS
+        assert [(c.level, c.type) for c in caches].count((1, "Data")) == CORES
+        assert [(c.level, c.type) for c in caches].count((2, "Unified")) == CORES
+
+        l3 = [c for c in caches if c.level == 3]
+        assert [c.cpus for c in l3] == ["0-1,4-5", "2-3,6-7"]
+        assert l3[0].cpu_mask == 0b00110011
+        assert l3[0].size.capacity == 16384
+        assert (l3[0].ways, l3[0].line_size) == (16, 64)
+
+    def test_sibling_threads_are_not_read(self, tmp_path, monkeypatch):
+        _make_cpus(tmp_path)
+        read = []
+        original = cpu_cache.read_sysfs
+
+        def read_sysfs(path):
+            read.append(path)
+            return original(path)
+
+        monkeypatch.setattr(cpu_cache, "read_sysfs", read_sysfs)
+
+        fetch_caches(str(tmp_path))
+
+        assert not any("/cpu4/" in path or "/cpu7/" in path for path in read)
+        # One read of shared_cpu_list per cache instance
+        assert len([path for path in read if path.endswith("shared_cpu_list")]) == 3 * CORES + 2
+
+    def test_no_cache_info(self, tmp_path):
+        (tmp_path / "online").write_text("0\n")
+        (tmp_path / "cpu0").mkdir()
+
+        status = Status()
+        assert fetch_caches(str(tmp_path), status) == []
+        assert status.type == StatusType.SUCCESS
@@ -0,0 +1,75 @@
+from pysysinfo.dumps.linux.cpu_topology import fetch_core_clusters
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{content}\n")
+
+
+def _make_cpus(root, count, siblings=lambda cpu: str(cpu), capacity=None, max_freq=None):
+    _write(root / "online", f"0-{count - 1}")
+    for cpu in range(count):
+        _write(root / f"cpu{cpu}" / "topology" / "thread_siblings_list", siblings(cpu))
+        if capacity is not None:
+            _write(root / f"cpu{cpu}" / "cpu_capacity", capacity(cpu))
+        if max_freq is not None:
+            _write(root / f"cpu{cpu}" / "cpufreq" / "cpuinfo_max_freq", max_freq(cpu))
+
+
+class TestCoreClusters:
+
+    def test_hybrid_intel(self, tmp_path):
+        root, devices = tmp_path / "cpu", tmp_path / "devices"
+        # 8 P-cores with 2 threads each (CPU 2N and 2N + 1), and 8 E-cores
+        _make_cpus(root, 24, siblings=lambda cpu: f"{cpu & ~1}-{cpu | 1}" if cpu < 16 else str(cpu),
+                   max_freq=lambda cpu: 5400000 if cpu < 16 else 4300000)
+        _write(devices / "cpu_atom" / "cpus", "16-23")
+        _write(devices / "cpu_core" / "cpus", "0-15")
+
+        status = Status()
+        clusters = fetch_core_clusters(str(root), str(devices), status)
+
+        assert status.type == StatusType.SUCCESS
+        assert [(c.type, c.cpus, c.cores, c.threads) for c in clusters] == [
+            ("performance", "0-15", 8, 16),
+            ("efficiency", "16-23", 8, 8),
+        ]
+        assert clusters[0].max_frequency == 5400
+        assert clusters[1].cpu_mask == 0xff0000
+
+    def test_big_little_arm(self, tmp_path):
+        root = tmp_path / "cpu"
+        capacities = {0: 325, 4: 871, 7: 1024}
+        _make_cpus(root, 8, capacity=lambda cpu: capacities[max(c for c in capacities if c <= cpu)])
+        for first, related in ((0, "0-3"), (4, "4-6"), (7, "7")):
+            _write(root / "cpufreq" / f"policy{first}" / "related_cpus", related)
+
+        clusters = fetch_core_clusters(str(root), str(tmp_path / "devices"))
+
+        assert [(c.type, c.cpus, c.capacity) for c in clusters] == [
+            ("performance", "7", 1024),
+            ("balanced", "4-6", 871),
+            ("efficiency", "0-3", 325),
+        ]
+
+    def test_per_core_policies_with_the_same_capacity(self, tmp_path):
+        root = tmp_path / "cpu"
+        _make_cpus(root, 4, capacity=lambda cpu: 1024)
+        for cpu in range(4):
+            _write(root / "cpufreq" / f"policy{cpu}" / "related_cpus", cpu)
+
+        clusters = fetch_core_clusters(str(root), str(tmp_path / "devices"))
+
+        assert [(c.type, c.cpus, c.cores) for c in clusters] == [(None, "0-3", 4)]
+
+    def test_homogeneous_without_capacity(self, tmp_path):
+        root = tmp_path / "cpu"
+        _make_cpus(root, 4, siblings=lambda cpu: f"{cpu % 2},{cpu % 2 + 2}")
+
+        clusters = fetch_core_clusters(str(root), str(tmp_path / "devices"))
+
+        assert [(c.type, c.cpus, c.cores, c.threads, c.capacity) for c in clusters] == [(None, "0-3", 2, 4, None)]
+
+    def test_no_cpus(self, tmp_path):
+        assert fetch_core_clusters(str(tmp_path / "missing"), str(tmp_path / "devices")) == []
@@ -0,0 +1,135 @@
+import os
+
+import pytest
+
+from pysysinfo.dumps.linux import graphics
+from pysysinfo.dumps.linux.drm import scan_drm
+from pysysinfo.dumps.linux.graphics import fetch_graphics_info, iter_gpus
+from pysysinfo.models.status_models import StatusType
+
+
+@pytest.fixture
+def drm_root(tmp_path):
+    """A DRM class directory with a PCI GPU (card0) and an ARM SoC GPU (card1)."""
+    drivers = tmp_path / "drivers"
+    for driver in ("amdgpu", "panfrost"):
+        (drivers / driver).mkdir(parents=True)
+
+    pci_gpu = tmp_path / "devices" / "pci0000:00" / "0000:00:01.1" / "0000:03:00.0"
+    pci_gpu.mkdir(parents=True)
+    os.symlink(drivers / "amdgpu", pci_gpu / "driver")
+
+    soc_gpu = tmp_path / "devices" / "platform" / "fde60000.gpu"
+    (soc_gpu / "of_node").mkdir(parents=True)
+    (soc_gpu / "of_node" / "compatible").write_bytes(b"rockchip,rk3568-mali\0arm,mali-bifrost\0")
+    os.symlink(drivers / "panfrost", soc_gpu / "driver")
+
+    drm = tmp_path / "drm"
+    links = {"card0": pci_gpu, "renderD128": pci_gpu, "card1": soc_gpu, "renderD129": soc_gpu}
+    for name, device in links.items():
+        (drm / name).mkdir(parents=True)
+        os.symlink(device, drm / name / "device")
+
+    connectors = {"card0-HDMI-A-1": ("connected", "enabled"), "card0-DP-1": ("disconnected", "disabled")}
+    for name, (status, enabled) in connectors.items():
+        (drm / name).mkdir()
+        (drm / name / "status").write_text(status + "\n")
+        (drm / name / "enabled").write_text(enabled + "\n")
+
+    # Not a card, and should be ignored
+    (drm / "version").write_text("drm 1.1.0 20060810\n")
+    return str(drm)
+
+
+class TestScanDRM:
+
+    def test_cards(self, drm_root):
+        index = scan_drm(drm_root)
+
+        assert [card.name for card in index.cards] == ["card0", "card1"]
+
+        pci = index.by_name["card0"]
+        assert pci.pci_slot == "0000:03:00.0"
+        assert pci.driver == "amdgpu"
+        assert pci.render_node == "/dev/dri/renderD128"
+        assert pci.card_node == "/dev/dri/card0"
+        assert [(o.name, o.connected, o.enabled) for o in pci.outputs] == [
+            ("DP-1", False, False), ("HDMI-A-1", True, True)
+        ]
+
+        soc = index.by_name["card1"]
+        assert soc.pci_slot is None
+        assert soc.driver == "panfrost"
+        assert soc.render_node == "/dev/dri/renderD129"
+        assert soc.compatible == "rockchip,rk3568-mali"
+        assert soc.outputs == []
+
+    def test_render_node_lookup(self, drm_root):
+        index = scan_drm(drm_root)
+
+        assert index.render_node("0000:03:00.0") == "/dev/dri/renderD128"
+        assert index.render_node("0000:04:00.0") is None
+        assert index.by_render_node["/dev/dri/renderD129"].name == "card1"
+
+    def test_no_drm(self, tmp_path):
+        assert scan_drm(str(tmp_path / "missing")).cards == []
+
+
+class TestDRMGraphics:
+
+    def test_soc_gpu_without_pci_bus(self, monkeypatch, drm_root, tmp_path):
+        monkeypatch.setattr(graphics, "PCI_ROOT_PATH", str(tmp_path / "no-pci"))
+        monkeypatch.setattr(graphics, "scan_drm", lambda: scan_drm(drm_root))
+
+        graphics_info = fetch_graphics_info()
+
+        assert graphics_info.status.type == StatusType.SUCCESS
+        assert len(graphics_info.modules) == 1
+        gpu = graphics_info.modules[0]
+        assert gpu.name == "rockchip,rk3568-mali"
+        assert gpu.driver == "panfrost"
+        assert gpu.render_node == "/dev/dri/renderD129"
+        assert gpu.drm_card == "/dev/dri/card1"
+
+    def test_display_only_cards_are_not_gpus(self, monkeypatch, drm_root, tmp_path):
+        drm, devices = tmp_path / "drm", tmp_path / "devices" / "platform"
+        for card, render_node, device, driver in (
+                ("card2", None, "simple-framebuffer.0", "simpledrm"),
+                ("card3", "renderD130", "evdi.0", "evdi"),
+        ):
+            (devices / device).mkdir(parents=True)
+            (tmp_path / "drivers" / driver).mkdir()
+            os.symlink(tmp_path / "drivers" / driver, devices / device / "driver")
+            for name in filter(None, (card, render_node)):
+                (drm / name).mkdir()
+                os.symlink(devices / device, drm / name / "device")
+        monkeypatch.setattr(graphics, "PCI_ROOT_PATH", str(tmp_path / "no-pci"))
+        monkeypatch.setattr(graphics, "scan_drm", lambda: scan_drm(drm_root))
+
+        graphics_info = fetch_graphics_info()
+
+        assert [gpu.driver for gpu in graphics_info.modules] == ["panfrost"]
+        assert not scan_drm(drm_root).by_name["card2"].is_gpu
+
+    def test_vendor_filter_skips_soc_gpu(self, monkeypatch, drm_root, tmp_path):
+        monkeypatch.setattr(graphics, "PCI_ROOT_PATH", str(tmp_path / "no-pci"))
+        monkeypatch.setattr(graphics, "scan_drm", lambda: scan_drm(drm_root))
+
+        assert list(iter_gpus(vendor_id="0x1002")) == []
+
+    def test_pci_gpu_is_joined_to_its_card(self, monkeypatch, drm_root, tmp_path):
+        pci_root = tmp_path / "pci"
+        (pci_root / "0000:03:00.0").mkdir(parents=True)
+        (pci_root / "0000:03:00.0" / "class").write_text("0x030000\n")
+        (pci_root / "0000:03:00.0" / "vendor").write_text("0x1002\n")
+        monkeypatch.setattr(graphics, "PCI_ROOT_PATH", str(pci_root))
+        monkeypatch.setattr(graphics, "scan_drm", lambda: scan_drm(drm_root))
+
+        gpus = list(iter_gpus(fields={"vendor_id", "render_node", "outputs"}))
+
+        assert len(gpus) == 2
+        assert gpus[0].vendor_id == "0x1002"
+        assert gpus[0].render_node == "/dev/dri/renderD128"
+        assert [o.name for o in gpus[0].outputs] == ["DP-1", "HDMI-A-1"]
+        # The SoC GPU comes last
+        assert gpus[1].driver == "panfrost"
@@ -0,0 +1,93 @@
+from pysysinfo.dumps.linux.edac import EDACDimm, EDACPoller, iter_edac_dimms, join_edac_to_modules
+from pysysinfo.models.memory_models import MemoryModuleInfo, MemoryModuleSlot
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _make_dimm(root, controller, dimm, label, ce, ue):
+    path = root / controller / dimm
+    path.mkdir(parents=True)
+    (path / "dimm_label").write_text(label + "\n")
+    (path / "dimm_ce_count").write_text(f"{ce}\n")
+    (path / "dimm_ue_count").write_text(f"{ue}\n")
+    return path
+
+
+def _module(bank, channel):
+    return MemoryModuleInfo(slot=MemoryModuleSlot(bank=bank, channel=channel))
+
+
+class TestEDAC:
+
+    def test_iter_edac_dimms(self, tmp_path):
+        _make_dimm(tmp_path, "mc0", "dimm0", "P0 CHANNEL A DIMM 0", 3, 0)
+        _make_dimm(tmp_path, "mc1", "dimm2", "P0 CHANNEL B DIMM 0", 0, 1)
+        (tmp_path / "mc0" / "ce_count").write_text("3\n")
+
+        status = Status()
+        dimms = list(iter_edac_dimms(str(tmp_path), status))
+
+        assert status.type == StatusType.SUCCESS
+        assert dimms == [
+            EDACDimm("mc0", "dimm0", "P0 CHANNEL A DIMM 0", 3, 0),
+            EDACDimm("mc1", "dimm2", "P0 CHANNEL B DIMM 0", 0, 1),
+        ]
+
+    def test_unreadable_counters(self, tmp_path):
+        path = _make_dimm(tmp_path, "mc0", "dimm0", "DIMM_A1", 0, 0)
+        (path / "dimm_ce_count").unlink()
+        (path / "dimm_ue_count").unlink()
+
+        status = Status()
+        dimms = list(iter_edac_dimms(str(tmp_path), status))
+
+        assert dimms[0].corrected is None
+        assert status.type == StatusType.PARTIAL
+
+    def test_no_edac(self, tmp_path):
+        assert list(iter_edac_dimms(str(tmp_path / "missing"))) == []
+
+    def test_join_by_bank_and_device_locator(self):
+        # ghes_edac labels DIMMs with "<bank locator> <device locator>"
+        modules = [_module("P0 CHANNEL A", "DIMM 0"), _module("P0 CHANNEL B", "DIMM 0")]
+        dimms = [
+            EDACDimm("mc0", "dimm0", "P0 CHANNEL A DIMM 0", 3, 0),
+            EDACDimm("mc0", "dimm1", "P0 CHANNEL B DIMM 0", 0, 1),
+        ]
+
+        join_edac_to_modules(modules, dimms)
+
+        assert [(m.corrected_errors, m.uncorrected_errors) for m in modules] == [(3, 0), (0, 1)]
+
+    def test_join_by_prefixed_label(self):
+        modules = [_module("", "DIMM_A1"), _module("", "DIMM_B1")]
+        dimms = [
+            EDACDimm("mc0", "dimm0", "CPU0_DIMM_A1", 7, 0),
+            EDACDimm("mc0", "dimm1", "CPU0_DIMM_B1", 0, 0),
+            EDACDimm("mc1", "dimm0", "CPU1_DIMM_B1", 0, 2),
+        ]
+
+        join_edac_to_modules(modules, dimms)
+
+        assert modules[0].corrected_errors == 7
+        # Both sockets have a DIMM_B1, so the match is ambiguous
+        assert modules[1].corrected_errors is None
+
+    def test_same_label_on_two_controllers(self):
+        modules = [_module("", "DIMM_A1"), _module("P1", "DIMM_A1")]
+        dimms = [
+            EDACDimm("mc0", "dimm0", "DIMM_A1", 5, 0),
+            EDACDimm("mc1", "dimm0", "DIMM_A1", 0, 0),
+        ]
+
+        join_edac_to_modules(modules, dimms)
+
+        # Neither module gets the counters of the other socket's DIMM
+        assert [m.corrected_errors for m in modules] == [None, None]
+
+    def test_poller_re_reads_counters(self, tmp_path):
+        path = _make_dimm(tmp_path, "mc0", "dimm0", "DIMM_A1", 1, 0)
+
+        with EDACPoller(str(tmp_path)) as poller:
+            assert poller.poll() == [EDACDimm("mc0", "dimm0", "DIMM_A1", 1, 0)]
+            (path / "dimm_ce_count").write_text("5\n")
+            assert poller.poll()[0].corrected == 5
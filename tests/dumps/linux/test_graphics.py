@@ -3,6 +3,8 @@ import os
 import subprocess
 from unittest.mock import mock_open
 
+import pytest
+
 from pysysinfo.dumps.linux.graphics import (
     _vram_amd,
     _pcie_gen,
@@ -11,9 +13,12 @@ from pysysinfo.dumps.linux.graphics import (
     _populate_nvidia_info,
     _populate_lspci_info,
     fetch_graphics_info,
+    iter_gpus,
+    _plan_probes,
 )
 from pysysinfo.models.gpu_models import GPUInfo
 from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.deadline import Deadline
 
 
 class TestVramAmd:
@@ -319,7 +324,7 @@ class TestPopulateNvidiaInfo:
                 )
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         gpu = _populate_nvidia_info(gpu, device)
 
@@ -335,7 +340,7 @@ class TestPopulateNvidiaInfo:
         def mock_run(command, *args, **kwargs):
             raise subprocess.CalledProcessError(1, command)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         try:
             _populate_nvidia_info(gpu, device)
@@ -363,7 +368,7 @@ class TestPopulateLspciInfo:
                 return subprocess.CompletedProcess(command, 0, stdout=output)
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         gpu = _populate_lspci_info(gpu, device)
 
@@ -385,7 +390,7 @@ class TestPopulateLspciInfo:
                 return subprocess.CompletedProcess(command, 0, stdout=output)
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         gpu = _populate_lspci_info(gpu, device)
 
@@ -401,7 +406,7 @@ class TestPopulateLspciInfo:
         def mock_run(command, *args, **kwargs):
             raise FileNotFoundError("lspci not found")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         try:
             _populate_lspci_info(gpu, device)
@@ -457,7 +462,7 @@ class TestFetchGraphicsInfo:
                 return subprocess.CompletedProcess(command, 0, stdout=output)
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -504,7 +509,7 @@ class TestFetchGraphicsInfo:
                 return subprocess.CompletedProcess(command, 0, stdout=output)
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -550,7 +555,7 @@ class TestFetchGraphicsInfo:
                 return subprocess.CompletedProcess(command, 0, stdout=output)
             return subprocess.CompletedProcess(command, 1)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -601,7 +606,7 @@ class TestFetchGraphicsInfo:
         def mock_run(*args, **kwargs):
             raise FileNotFoundError("lspci not found")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -630,7 +635,7 @@ class TestFetchGraphicsInfo:
 
         monkeypatch.setattr(builtins, "open", custom_open)
         monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", lambda x: "PciRoot(0x0)/Pci(0x2,0x0)")
-        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
+        monkeypatch.setattr("pysysinfo.util.command.run_process", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
 
         info = fetch_graphics_info()
 
@@ -668,7 +673,7 @@ class TestFetchGraphicsInfo:
             raise Exception("PCI path failed")
 
         monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", mock_pci_path)
-        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
+        monkeypatch.setattr("pysysinfo.util.command.run_process", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
 
         info = fetch_graphics_info()
 
@@ -707,7 +712,7 @@ class TestFetchGraphicsInfo:
                 raise subprocess.CalledProcessError(1, command)
             return subprocess.CompletedProcess(command, 0, stdout="")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -747,7 +752,7 @@ class TestFetchGraphicsInfo:
                 raise FileNotFoundError("lspci not found")
             return subprocess.CompletedProcess(command, 0, stdout="")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
 
         info = fetch_graphics_info()
 
@@ -779,7 +784,7 @@ class TestFetchGraphicsInfo:
 
         monkeypatch.setattr(builtins, "open", custom_open)
         monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", lambda x: "PciRoot(0x0)/Pci(0x2,0x0)")
-        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
+        monkeypatch.setattr("pysysinfo.util.command.run_process", lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=""))
 
         info = fetch_graphics_info()
 
@@ -806,3 +811,182 @@ class TestFetchGraphicsInfo:
         assert len(info.modules) == 0
         assert info.status.type == StatusType.PARTIAL
         assert any("Could not open file" in msg for msg in info.status.messages)
+
+    def test_iter_gpus_vendor_filter(self, monkeypatch):
+        monkeypatch.setattr(os.path, "exists", lambda x: True)
+        monkeypatch.setattr(os, "listdir", lambda x: ["0000:00:02.0", "0000:01:00.0"])
+
+        vendors = {"0000:00:02.0": "0x8086", "0000:01:00.0": "0x10de"}
+
+        def custom_open(path, *args, **kwargs):
+            device = path.split("/")[5]
+            filename = os.path.basename(path)
+            if filename == "class":
+                return mock_open(read_data="0x030000")()
+            if filename == "vendor":
+                return mock_open(read_data=vendors[device])()
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(builtins, "open", custom_open)
+        monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", lambda x: "PciRoot(0x0)/Pci(0x2,0x0)")
+
+        commands = []
+
+        def mock_run(command, *args, **kwargs):
+            commands.append(command)
+            return subprocess.CompletedProcess(command, 0, stdout="")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        gpus = list(iter_gpus(vendor_id="0x8086"))
+
+        assert [g.vendor_id for g in gpus] == ["0x8086"]
+        # The NVIDIA GPU was skipped before nvidia-smi or lspci were run for it
+        assert all("0000:01:00.0" not in " ".join(c) for c in commands)
+
+
+class TestFieldProjection:
+    """Tests for the `fields` parameter of fetch_graphics_info."""
+
+    def test_plan_probes_all_fields(self):
+        assert _plan_probes(None) == {
+            "device_id", "link_width", "acpi_path", "pci_path", "pcie_gen", "amd", "nvidia", "lspci", "drm"
+        }
+
+    def test_plan_probes_ids_and_vram(self):
+        assert _plan_probes({"vendor_id", "device_id", "vram"}) == {"device_id", "amd", "nvidia"}
+
+    def test_plan_probes_unknown_field(self):
+        with pytest.raises(ValueError):
+            _plan_probes({"vendor_id", "colour"})
+
+    def test_fetch_graphics_info_projection_skips_probes(self, monkeypatch):
+        monkeypatch.setattr(os.path, "exists", lambda x: True)
+        monkeypatch.setattr(os, "listdir", lambda x: ["0000:01:00.0"])
+
+        file_contents = {
+            "class": "0x030000",
+            "vendor": "0x10de",
+            "device": "0x2684",
+        }
+        opened = []
+
+        def custom_open(path, *args, **kwargs):
+            opened.append(os.path.basename(path))
+            filename = os.path.basename(path)
+            if filename in file_contents:
+                return mock_open(read_data=file_contents[filename])()
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(builtins, "open", custom_open)
+
+        def mock_pci_path(device):
+            raise AssertionError("pci_path_linux should not be called")
+
+        monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", mock_pci_path)
+
+        commands = []
+
+        def mock_run(command, *args, **kwargs):
+            commands.append(command[0])
+            if command[0] == "nvidia-smi":
+                return subprocess.CompletedProcess(command, 0, stdout="NVIDIA GeForce RTX 4090, 16, 4, 24564")
+            return subprocess.CompletedProcess(command, 0, stdout="")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        info = fetch_graphics_info(fields={"vendor_id", "device_id", "vram"})
+
+        assert info.status.type == StatusType.SUCCESS
+        gpu = info.modules[0]
+        assert gpu.device_id == "0x2684"
+        assert gpu.vram.capacity == 24564
+        assert commands == ["nvidia-smi"]
+        assert set(opened) == {"class", "vendor", "device"}
+
+    def test_fetch_graphics_info_projection_vendor_only(self, monkeypatch):
+        monkeypatch.setattr(os.path, "exists", lambda x: True)
+        monkeypatch.setattr(os, "listdir", lambda x: ["0000:00:02.0"])
+
+        def custom_open(path, *args, **kwargs):
+            filename = os.path.basename(path)
+            if filename == "class":
+                return mock_open(read_data="0x030000")()
+            if filename == "vendor":
+                return mock_open(read_data="0x8086")()
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(builtins, "open", custom_open)
+
+        def mock_run(*args, **kwargs):
+            raise AssertionError("No external tools should be run")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        info = fetch_graphics_info(fields={"vendor_id"})
+
+        assert info.status.type == StatusType.SUCCESS
+        assert info.modules[0].vendor_id == "0x8086"
+        assert info.modules[0].device_id is None
+
+
+class TestDeadlines:
+    """Tests for the `deadline` parameter of fetch_graphics_info."""
+
+    def _mock_nvidia_sysfs(self, monkeypatch):
+        monkeypatch.setattr(os.path, "exists", lambda x: True)
+        monkeypatch.setattr(os, "listdir", lambda x: ["0000:01:00.0"])
+
+        file_contents = {
+            "class": "0x030000",
+            "vendor": "0x10de",
+            "device": "0x2684",
+            "current_link_width": "16",
+            "current_link_speed": "16.0 GT/s",
+            "path": "\\_SB.PCI0.PEG0.PEGP",
+        }
+
+        def custom_open(path, *args, **kwargs):
+            filename = os.path.basename(path)
+            if filename in file_contents:
+                return mock_open(read_data=file_contents[filename])()
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(builtins, "open", custom_open)
+        monkeypatch.setattr("pysysinfo.dumps.linux.graphics.pci_path_linux", lambda x: "PciRoot(0x0)/Pci(0x1,0x0)")
+
+    def test_hung_nvidia_smi_degrades_to_partial(self, monkeypatch):
+        self._mock_nvidia_sysfs(monkeypatch)
+        timeouts = {}
+
+        def mock_run(command, *args, **kwargs):
+            timeouts[command[0]] = kwargs.get("timeout")
+            if command[0] == "nvidia-smi":
+                raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+            return subprocess.CompletedProcess(command, 0, stdout="Vendor:\tNVIDIA Corporation\n")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        info = fetch_graphics_info(deadline=Deadline(5))
+
+        assert info.status.type == StatusType.PARTIAL
+        assert any("timed out" in msg for msg in info.status.messages)
+        # The GPU is still reported, with the data that could be collected
+        assert info.modules[0].manufacturer == "NVIDIA Corporation"
+        assert 0 < timeouts["nvidia-smi"] <= 5
+        assert timeouts["lspci"] <= timeouts["nvidia-smi"]
+
+    def test_expired_deadline_skips_external_tools(self, monkeypatch):
+        self._mock_nvidia_sysfs(monkeypatch)
+
+        def mock_run(*args, **kwargs):
+            raise AssertionError("No external tools should be started")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        info = fetch_graphics_info(deadline=Deadline(0))
+
+        assert info.status.type == StatusType.PARTIAL
+        assert len(info.modules) == 1
+        assert info.modules[0].device_id == "0x2684"
+        assert info.modules[0].pcie_gen == 4
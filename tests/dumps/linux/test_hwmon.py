@@ -0,0 +1,73 @@
+import os
+
+from pysysinfo.dumps.linux.hwmon import HwmonSampler, HwmonSensor
+
+
+def _make_chip(root, hwmon, name, device=None, **attributes):
+    path = root / hwmon
+    path.mkdir(parents=True)
+    (path / "name").write_text(name + "\n")
+    for attribute, value in attributes.items():
+        (path / attribute).write_text(f"{value}\n")
+    if device is not None:
+        target = root.parent / "devices" / device
+        target.mkdir(parents=True)
+        os.symlink(target, path / "device")
+    return path
+
+
+def _sysfs(tmp_path):
+    root = tmp_path / "hwmon"
+    _make_chip(root, "hwmon0", "coretemp", device="coretemp.0",
+               temp1_input=45000, temp1_label="Package id 0", temp2_input=43000, temp2_label="Core 0",
+               temp10_input=44000, temp10_label="Core 8", temp1_crit=100000)
+    _make_chip(root, "hwmon1", "nvme", device="nvme0", temp1_input=38850, temp1_label="Composite")
+    _make_chip(root, "hwmon2", "amdgpu", device="0000:03:00.0",
+               temp1_input=52000, temp1_label="edge", power1_input=35000000, in0_input=750, fan1_input=1200)
+    _make_chip(root, "hwmon3", "acpitz", temp1_input=27800)
+    return root
+
+
+class TestHwmonSampler:
+
+    def test_sensor_index(self, tmp_path):
+        with HwmonSampler(str(_sysfs(tmp_path))) as sampler:
+            sensors = sampler.sensors
+
+        assert [s.label for s in sensors[:3]] == ["Package id 0", "Core 0", "Core 8"]
+        assert sensors[3] == HwmonSensor("nvme", "hwmon1", "nvme0", "temperature", "Composite", "°C")
+        assert {(s.kind, s.unit) for s in sensors if s.chip == "amdgpu"} == {
+            ("temperature", "°C"), ("power", "W"), ("voltage", "V"), ("fan", "RPM"),
+        }
+        # Chips without a device, and sensors without a label
+        assert sensors[-1] == HwmonSensor("acpitz", "hwmon3", None, "temperature", "temp1", "°C")
+
+    def test_sample_scales_values(self, tmp_path):
+        with HwmonSampler(str(_sysfs(tmp_path))) as sampler:
+            values = dict(zip(((s.chip, s.label) for s in sampler.sensors), sampler.sample().values))
+
+        assert values[("coretemp", "Package id 0")] == 45.0
+        assert values[("nvme", "Composite")] == 38.85
+        assert values[("amdgpu", "power1")] == 35.0
+        assert values[("amdgpu", "in0")] == 0.75
+        assert values[("amdgpu", "fan1")] == 1200
+
+    def test_sample_rereads_values(self, tmp_path):
+        root = _sysfs(tmp_path)
+
+        with HwmonSampler(str(root)) as sampler:
+            first = sampler.sample()
+            (root / "hwmon1" / "temp1_input").write_text("61000\n")
+            (root / "hwmon0" / "temp2_input").write_text("\n")
+            second = sampler.sample()
+
+        assert first.values[3] == 38.85
+        assert second.values[3] == 61.0
+        # Unreadable sensors do not stop the others from being sampled
+        assert second.values[1] is None
+        assert second.timestamp >= first.timestamp
+
+    def test_no_hwmon(self, tmp_path):
+        with HwmonSampler(str(tmp_path / "missing")) as sampler:
+            assert sampler.sensors == []
+            assert sampler.sample().values == []
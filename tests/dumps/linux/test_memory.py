@@ -6,6 +6,7 @@ import pytest
 
 from pysysinfo.dumps.linux.memory import (
     fetch_memory_info,
+    iter_memory_modules,
     _part_no,
     _dimm_type,
     _dimm_slot,
@@ -13,7 +14,7 @@ from pysysinfo.dumps.linux.memory import (
     _ecc_support,
     _dimm_speed,
 )
-from pysysinfo.models.memory_models import MemoryModuleSlot
+from pysysinfo.models.memory_models import MemoryModuleSlot, NUMANodeInfo
 from pysysinfo.models.size_models import Megabyte, Kilobyte
 from pysysinfo.models.status_models import StatusType
 
@@ -205,6 +206,19 @@ class TestLinuxMemory:
         assert memory_info.status.type == StatusType.FAILED
         assert memory_info.status.messages is not None
 
+    def test_fetch_memory_info_no_dmi_with_numa_nodes(self, monkeypatch):
+        monkeypatch.setattr(os.path, "isdir", lambda x: False)
+        monkeypatch.setattr(
+            "pysysinfo.dumps.linux.memory.iter_numa_nodes", lambda status=None: iter([NUMANodeInfo(id=0)])
+        )
+
+        memory_info = fetch_memory_info()
+
+        # The NUMA nodes are still reported
+        assert memory_info.status.type == StatusType.PARTIAL
+        assert memory_info.modules == []
+        assert [node.id for node in memory_info.numa_nodes] == [0]
+
     def test_fetch_memory_info_permission_error(self, monkeypatch):
         monkeypatch.setattr(os.path, "isdir", lambda x: True)
 
@@ -221,6 +235,8 @@ class TestLinuxMemory:
             raise PermissionError("Permission denied")
 
         monkeypatch.setattr(builtins, "open", mock_open)
+        # The host's NUMA nodes would otherwise make the status PARTIAL
+        monkeypatch.setattr("pysysinfo.dumps.linux.memory.iter_numa_nodes", lambda status=None: iter([]))
 
         memory_info = fetch_memory_info()
 
@@ -532,3 +548,34 @@ class TestLinuxMemory:
         # The exception is caught by outer except block
         assert memory_info.status.type == StatusType.PARTIAL
         assert any("Error while fetching Memory Info" in msg for msg in memory_info.status.messages)
+
+    def test_iter_memory_modules_predicate(self, monkeypatch):
+        monkeypatch.setattr(os.path, "isdir", lambda x: True)
+        entries = []
+        for i in range(3):
+            entry = MagicMock()
+            entry.path = f"/sys/firmware/dmi/entries/17-{i}"
+            entry.name = f"17-{i}"
+            entries.append(entry)
+        monkeypatch.setattr(os, "scandir", lambda x: entries)
+
+        blobs = {
+            "/sys/firmware/dmi/entries/17-0/raw": self._create_dmi_blob(size_mb=8192, dev_loc="DIMM 0"),
+            "/sys/firmware/dmi/entries/17-1/raw": self._create_dmi_blob(size_mb=16384, dev_loc="DIMM 1"),
+            "/sys/firmware/dmi/entries/17-2/raw": self._create_dmi_blob(size_mb=16384, dev_loc="DIMM 2"),
+        }
+        opened = []
+
+        def mock_open(path, *args, **kwargs):
+            from io import BytesIO
+            opened.append(path)
+            return BytesIO(blobs[path])
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+
+        modules = iter_memory_modules(predicate=lambda m: m.capacity.capacity == 16384)
+        first = next(modules)
+
+        assert first.slot.channel == "DIMM 1"
+        # The generator stops reading entries once the caller stops asking
+        assert len(opened) == 2
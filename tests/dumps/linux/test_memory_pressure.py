@@ -0,0 +1,100 @@
+from pysysinfo.dumps.linux.memory_pressure import MemoryPressureSampler, parse_psi_line
+
+MEMINFO = """\
+MemTotal:       32658704 kB
+MemFree:         1024000 kB
+MemAvailable:   20480000 kB
+Buffers:          204800 kB
+Cached:         12288000 kB
+SwapCached:            0 kB
+SwapTotal:       8388604 kB
+SwapFree:        8388000 kB
+Dirty:               512 kB
+Writeback:             0 kB
+"""
+
+VMSTAT = """\
+nr_free_pages 256000
+pgmajfault 4321
+pswpin 12
+pswpout 34
+pgscan_direct_throttle 0
+pgscan_direct 56
+oom_kill 1
+"""
+
+PSI = """\
+some avg10=1.50 avg60=0.75 avg300=0.10 total=123456
+full avg10=0.25 avg60=0.05 avg300=0.00 total=7890
+"""
+
+
+def _write_files(tmp_path, meminfo=MEMINFO, vmstat=VMSTAT, psi=PSI):
+    paths = {}
+    for name, content in (("meminfo", meminfo), ("vmstat", vmstat), ("psi", psi)):
+        if content is not None:
+            (tmp_path / name).write_text(content)
+        paths[name] = str(tmp_path / name)
+    return paths
+
+
+class TestMemoryPressureSampler:
+
+    def test_parse_psi_line(self):
+        assert parse_psi_line(b"some avg10=1.50 avg60=0.75 avg300=0.10 total=123456") == (1.5, 0.75, 123456)
+
+    def test_sample(self, tmp_path):
+        paths = _write_files(tmp_path)
+
+        with MemoryPressureSampler(paths["meminfo"], paths["vmstat"], paths["psi"]) as sampler:
+            sample = sampler.sample()
+
+        assert sample.mem_total_kb == 32658704
+        assert sample.mem_available_kb == 20480000
+        assert sample.cached_kb == 12288000
+        assert sample.swap_free_kb == 8388000
+        assert sample.dirty_kb == 512
+        assert sample.pgmajfault == 4321
+        # Not confused with pgscan_direct_throttle
+        assert sample.pgscan_direct == 56
+        assert sample.oom_kill == 1
+        assert (sample.psi_some_avg10, sample.psi_some_avg60, sample.psi_some_total_us) == (1.5, 0.75, 123456)
+        assert (sample.psi_full_avg10, sample.psi_full_avg60, sample.psi_full_total_us) == (0.25, 0.05, 7890)
+
+    def test_values_are_re_read(self, tmp_path):
+        paths = _write_files(tmp_path)
+
+        with MemoryPressureSampler(paths["meminfo"], paths["vmstat"], paths["psi"]) as sampler:
+            first = sampler.sample()
+            (tmp_path / "meminfo").write_text(MEMINFO.replace("1024000", "2048000"))
+            (tmp_path / "vmstat").write_text(VMSTAT.replace("pgmajfault 4321", "pgmajfault 4400"))
+            second = sampler.sample()
+
+        assert (first.mem_free_kb, second.mem_free_kb) == (1024000, 2048000)
+        assert (first.pgmajfault, second.pgmajfault) == (4321, 4400)
+        assert second.timestamp >= first.timestamp
+
+    def test_changed_layout_is_learned_again(self, tmp_path):
+        paths = _write_files(tmp_path)
+
+        with MemoryPressureSampler(paths["meminfo"], paths["vmstat"], paths["psi"]) as sampler:
+            sampler.sample()
+            (tmp_path / "vmstat").write_text("nr_dirty 1\n" + VMSTAT)
+            assert sampler.sample().oom_kill == 1
+
+    def test_no_psi(self, tmp_path):
+        paths = _write_files(tmp_path, psi=None)
+
+        with MemoryPressureSampler(paths["meminfo"], paths["vmstat"], paths["psi"]) as sampler:
+            sample = sampler.sample()
+
+        assert sample.mem_total_kb == 32658704
+        assert sample.psi_some_avg10 is None
+        assert sample.psi_full_total_us is None
+
+    def test_large_file(self, tmp_path):
+        padding = "".join(f"nr_padding_{i} {i}\n" for i in range(2000))
+        paths = _write_files(tmp_path, vmstat=padding + VMSTAT)
+
+        with MemoryPressureSampler(paths["meminfo"], paths["vmstat"], paths["psi"]) as sampler:
+            assert sampler.sample().oom_kill == 1
@@ -0,0 +1,185 @@
+import errno
+import os
+import threading
+import time
+
+import pytest
+
+from pysysinfo.dumps.linux import mounts
+from pysysinfo.dumps.linux.block_graph import BlockGraph
+from pysysinfo.dumps.linux.mounts import MountEntry, fetch_volumes, parse_mountinfo, statvfs_many
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.storage_models import BlockDevice
+
+MOUNTINFO = """\
+22 1 8:2 / / rw,relatime shared:1 - ext4 /dev/sda2 rw,errors=remount-ro
+23 22 0:21 / /proc rw,nosuid,nodev,noexec,relatime shared:12 - proc proc rw
+24 22 253:0 / /srv/my\\040data ro,relatime shared:30 master:2 - xfs /dev/mapper/vg0-data rw
+25 22 0:48 / /mnt/nfs rw,relatime shared:40 - nfs4 server:/export rw,vers=4.2
+"""
+
+
+def _fake_statvfs(path):
+    return os.statvfs_result((4096, 4096, 1000, 250, 200, 500, 100, 100, 0, 255))
+
+
+def _graph():
+    return BlockGraph([
+        BlockDevice(name="sda", dev="8:0", kind="disk"),
+        BlockDevice(name="sda2", dev="8:2", kind="partition", parent="sda", holders=["dm-0"]),
+        BlockDevice(name="dm-0", dev="253:0", kind="lvm", slaves=["sda2"]),
+    ])
+
+
+class TestMounts:
+
+    @pytest.fixture(autouse=True)
+    def no_calls_in_flight(self, monkeypatch):
+        # Threads that earlier tests left hung must not make these skip their paths
+        monkeypatch.setattr(mounts, "_in_flight", set())
+
+    def test_parse_mountinfo(self):
+        entries = parse_mountinfo(MOUNTINFO)
+
+        assert entries[0] == MountEntry(22, "8:2", "/", ["rw", "relatime"], "ext4", "/dev/sda2")
+        # Optional fields are skipped, and escaped spaces are decoded
+        assert entries[2].mount_point == "/srv/my data"
+        assert entries[2].fs_type == "xfs"
+        assert entries[3].source == "server:/export"
+
+    def test_fetch_volumes(self, tmp_path, monkeypatch):
+        mountinfo = tmp_path / "mountinfo"
+        mountinfo.write_text(MOUNTINFO)
+        monkeypatch.setattr(os, "statvfs", _fake_statvfs)
+
+        status = Status()
+        volumes = fetch_volumes(str(mountinfo), graph=_graph(), status=status)
+
+        assert status.type == StatusType.SUCCESS
+        assert [v.mount_point for v in volumes] == ["/", "/srv/my data", "/mnt/nfs"]
+
+        root, data, nfs = volumes
+        assert root.block_device == "sda2"
+        assert root.physical_disks == ["sda"]
+        assert root.total_size.capacity == 4000
+        assert root.free_size.capacity == 1000
+        assert root.available_size.capacity == 800
+        assert (root.total_inodes, root.free_inodes) == (500, 100)
+
+        assert data.read_only
+        assert data.block_device == "dm-0"
+        assert data.physical_disks == ["sda"]
+
+        assert nfs.block_device is None
+
+    def test_keep_pseudo_filesystems(self, tmp_path, monkeypatch):
+        mountinfo = tmp_path / "mountinfo"
+        mountinfo.write_text(MOUNTINFO)
+        monkeypatch.setattr(os, "statvfs", _fake_statvfs)
+
+        volumes = fetch_volumes(str(mountinfo), skip_pseudo=False, graph=_graph())
+
+        assert "/proc" in [v.mount_point for v in volumes]
+
+    def test_hung_mount_times_out(self, tmp_path, monkeypatch):
+        mountinfo = tmp_path / "mountinfo"
+        mountinfo.write_text(MOUNTINFO)
+        release = threading.Event()
+
+        def statvfs(path):
+            if path == "/mnt/nfs":
+                release.wait()
+            return _fake_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", statvfs)
+
+        status = Status()
+        start = time.monotonic()
+        volumes = fetch_volumes(str(mountinfo), graph=_graph(), timeout=0.2, status=status)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert status.type == StatusType.PARTIAL
+        assert volumes[0].total_size is not None
+        assert volumes[2].total_size is None
+
+    def test_hung_mounts_do_not_starve_the_pool(self, monkeypatch):
+        release = threading.Event()
+
+        def statvfs(path):
+            if path.startswith("/hung"):
+                release.wait()
+            return _fake_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", statvfs)
+
+        paths = ["/hung1", "/hung2", "/ok1", "/ok2"]
+        results = statvfs_many(paths, timeout=0.2, max_workers=2)
+        release.set()
+
+        assert [type(r) for r in results] == [TimeoutError, TimeoutError, os.statvfs_result, os.statvfs_result]
+
+    def test_hung_mount_is_skipped_until_it_returns(self, monkeypatch):
+        release = threading.Event()
+        calls = []
+
+        def statvfs(path):
+            calls.append(path)
+            if path == "/hung":
+                release.wait()
+            return _fake_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", statvfs)
+
+        assert isinstance(statvfs_many(["/hung"], timeout=0.1)[0], TimeoutError)
+        # The first call is still blocked, so no second thread is spent on it
+        result = statvfs_many(["/hung", "/ok"], timeout=0.1)
+        assert isinstance(result[0], TimeoutError)
+        assert "has not returned yet" in str(result[0])
+        assert calls == ["/hung", "/ok"]
+
+        release.set()
+        deadline = time.monotonic() + 2
+        while mounts._in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert isinstance(statvfs_many(["/hung"], timeout=0.1)[0], os.statvfs_result)
+
+    def test_duplicate_paths(self, monkeypatch):
+        calls = []
+
+        def statvfs(path):
+            calls.append(path)
+            return _fake_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", statvfs)
+
+        results = statvfs_many(["/", "/srv", "/"])
+
+        assert [type(r) for r in results] == [os.statvfs_result] * 3
+        assert sorted(calls) == ["/", "/srv"]
+
+    def test_permission_denied(self, tmp_path, monkeypatch):
+        mountinfo = tmp_path / "mountinfo"
+        mountinfo.write_text(MOUNTINFO)
+
+        def statvfs(path):
+            if path == "/mnt/nfs":
+                raise PermissionError(errno.EACCES, "Permission denied", path)
+            return _fake_statvfs(path)
+
+        monkeypatch.setattr(os, "statvfs", statvfs)
+
+        status = Status()
+        volumes = fetch_volumes(str(mountinfo), graph=_graph(), status=status)
+
+        assert status.type == StatusType.SUCCESS
+        assert status.messages == []
+        assert volumes[2].mount_point == "/mnt/nfs"
+        assert volumes[2].total_size is None
+
+    def test_missing_mountinfo(self, tmp_path):
+        status = Status()
+
+        assert fetch_volumes(str(tmp_path / "missing"), graph=_graph(), status=status) == []
+        assert status.type == StatusType.PARTIAL
+
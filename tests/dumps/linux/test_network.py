@@ -0,0 +1,115 @@
+import builtins
+import os
+import subprocess
+from unittest.mock import mock_open
+
+from pysysinfo.dumps.linux.network import _nic_pci_slot, fetch_network_info, iter_nics
+from pysysinfo.models.status_models import StatusType
+
+DEVICE_LINKS = {
+    "/sys/class/net/eth0/device": "/sys/devices/pci0000:00/0000:00:04.0/virtio3",
+    "/sys/class/net/enp3s0/device": "/sys/devices/pci0000:00/0000:00:1c.0/0000:03:00.0",
+}
+
+PCI_FILES = {
+    "/sys/bus/pci/devices/0000:00:04.0/vendor": "0x1af4",
+    "/sys/bus/pci/devices/0000:00:04.0/device": "0x1041",
+    "/sys/bus/pci/devices/0000:03:00.0/vendor": "0x8086",
+    "/sys/bus/pci/devices/0000:03:00.0/device": "0x15f3",
+    "/sys/bus/pci/devices/0000:03:00.0/firmware_node/path": "\\_SB_.PC00.RP05.PXSX",
+}
+
+
+def _mock_sysfs(monkeypatch, lspci_calls=None):
+    monkeypatch.setattr(os.path, "isdir", lambda x: True)
+    monkeypatch.setattr(os, "listdir", lambda x: ["lo", "eth0", "enp3s0"])
+    monkeypatch.setattr(os.path, "exists", lambda x: x in DEVICE_LINKS)
+    monkeypatch.setattr(os.path, "realpath", lambda x: DEVICE_LINKS.get(x, x))
+    monkeypatch.setattr("pysysinfo.dumps.linux.network.pci_path_linux", lambda x: f"PciRoot(0x0)/Pci({x})")
+
+    def custom_open(path, *args, **kwargs):
+        if path in PCI_FILES:
+            return mock_open(read_data=PCI_FILES[path])()
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(builtins, "open", custom_open)
+
+    def mock_run(command, *args, **kwargs):
+        if lspci_calls is not None:
+            lspci_calls.append(command[2])
+        names = {"0000:00:04.0": "Virtio network device", "0000:03:00.0": "Ethernet Controller I225-V"}
+        output = f"Vendor:\tTest Vendor\nDevice:\t{names[command[2]]}\n"
+        return subprocess.CompletedProcess(command, 0, stdout=output)
+
+    monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+
+class TestLinuxNetwork:
+
+    def test_nic_pci_slot_through_virtio(self, monkeypatch):
+        monkeypatch.setattr(os.path, "realpath", lambda x: DEVICE_LINKS.get(x, x))
+        assert _nic_pci_slot("eth0") == "0000:00:04.0"
+        assert _nic_pci_slot("enp3s0") == "0000:03:00.0"
+
+    def test_nic_pci_slot_not_pci(self, monkeypatch):
+        monkeypatch.setattr(os.path, "realpath", lambda x: "/sys/devices/platform/soc/ethernet")
+        assert _nic_pci_slot("end0") is None
+
+    def test_fetch_network_info_no_sys_class_net(self, monkeypatch):
+        monkeypatch.setattr(os.path, "isdir", lambda x: False)
+
+        network_info = fetch_network_info()
+
+        assert network_info.status.type == StatusType.FAILED
+        assert "does not exist" in network_info.status.messages[0]
+
+    def test_fetch_network_info_success(self, monkeypatch):
+        _mock_sysfs(monkeypatch)
+
+        network_info = fetch_network_info()
+
+        assert network_info.status.type == StatusType.SUCCESS
+        # `lo` is virtual, and is skipped
+        assert len(network_info.modules) == 2
+        intel = network_info.modules[0]
+        assert intel.vendor_id == "0x8086"
+        assert intel.device_id == "0x15f3"
+        assert intel.name == "Ethernet Controller I225-V"
+        assert intel.manufacturer == "Test Vendor"
+        assert intel.acpi_path == "\\_SB_.PC00.RP05.PXSX"
+        assert intel.pci_path == "PciRoot(0x0)/Pci(0000:03:00.0)"
+        virtio = network_info.modules[1]
+        assert virtio.vendor_id == "0x1af4"
+        assert virtio.acpi_path is None
+
+    def test_iter_nics_vendor_filter_skips_lspci(self, monkeypatch):
+        lspci_calls = []
+        _mock_sysfs(monkeypatch, lspci_calls)
+
+        nics = list(iter_nics(vendor_id="0x8086"))
+
+        assert [n.device_id for n in nics] == ["0x15f3"]
+        assert lspci_calls == ["0000:03:00.0"]
+
+    def test_iter_nics_early_termination(self, monkeypatch):
+        lspci_calls = []
+        _mock_sysfs(monkeypatch, lspci_calls)
+
+        first = next(iter_nics())
+
+        assert first.vendor_id == "0x8086"
+        assert len(lspci_calls) == 1
+
+    def test_iter_nics_lspci_failure(self, monkeypatch):
+        _mock_sysfs(monkeypatch)
+
+        def mock_run(*args, **kwargs):
+            raise FileNotFoundError("lspci not found")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        network_info = fetch_network_info()
+
+        assert network_info.status.type == StatusType.PARTIAL
+        assert len(network_info.modules) == 2
+        assert any("LSPCI" in msg for msg in network_info.status.messages)
@@ -0,0 +1,118 @@
+import pytest
+
+from pysysinfo.dumps.linux.common import bitmap_cpus, parse_cpulist
+from pysysinfo.dumps.linux.numa import iter_numa_nodes, map_modules_to_nodes, parse_node_meminfo
+from pysysinfo.models.memory_models import MemoryModuleInfo, NUMANodeInfo
+from pysysinfo.models.size_models import Kilobyte, Megabyte
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _make_node(root, node_id, cpulist, total_kb, free_kb, distance, hugepages=None):
+    node = root / f"node{node_id}"
+    node.mkdir(parents=True)
+    (node / "cpulist").write_text(cpulist + "\n")
+    (node / "meminfo").write_text(
+        f"Node {node_id} MemTotal:       {total_kb} kB\n"
+        f"Node {node_id} MemFree:        {free_kb} kB\n"
+        f"Node {node_id} HugePages_Total:     0\n"
+    )
+    (node / "distance").write_text(distance + "\n")
+    for size_kb, (total, free) in (hugepages or {}).items():
+        pool = node / "hugepages" / f"hugepages-{size_kb}kB"
+        pool.mkdir(parents=True)
+        (pool / "nr_hugepages").write_text(f"{total}\n")
+        (pool / "free_hugepages").write_text(f"{free}\n")
+        (pool / "surplus_hugepages").write_text("0\n")
+
+
+def _module(capacity_mb, array_handle):
+    module = MemoryModuleInfo(capacity=Megabyte(capacity=capacity_mb))
+    module._array_handle = array_handle
+    return module
+
+
+def _node(node_id, total_kb):
+    return NUMANodeInfo(id=node_id, total_memory=Kilobyte(capacity=total_kb))
+
+
+class TestCpulist:
+
+    def test_parse_cpulist(self):
+        assert parse_cpulist("0-3,8,10-11\n") == 0b110100001111
+        assert parse_cpulist("") == 0
+
+    def test_bitmap_cpus(self):
+        assert bitmap_cpus(parse_cpulist("0-3,8,10-11")) == [0, 1, 2, 3, 8, 10, 11]
+        assert bitmap_cpus(parse_cpulist("127")) == [127]
+
+    def test_malformed(self):
+        with pytest.raises(ValueError):
+            parse_cpulist("0-a")
+
+
+class TestNUMANodes:
+
+    def test_parse_node_meminfo(self):
+        assert parse_node_meminfo("Node 1 MemTotal:  1024 kB\nNode 1 HugePages_Free:  3\n") == {
+            "MemTotal": 1024, "HugePages_Free": 3
+        }
+
+    def test_iter_numa_nodes(self, tmp_path):
+        _make_node(tmp_path, 0, "0-3,8-11", 16000000, 8000000, "10 21", {2048: (512, 500), 1048576: (2, 2)})
+        _make_node(tmp_path, 1, "4-7,12-15", 16000000, 12000000, "21 10")
+        (tmp_path / "possible").write_text("0-1\n")
+
+        status = Status()
+        nodes = list(iter_numa_nodes(str(tmp_path), status))
+
+        assert status.type == StatusType.SUCCESS
+        assert [n.id for n in nodes] == [0, 1]
+        node = nodes[0]
+        assert node.cpus == "0-3,8-11"
+        assert node.cpu_mask == 0xF0F
+        assert node.total_memory.capacity == 16000000
+        assert node.free_memory.capacity == 8000000
+        assert node.distances == [10, 21]
+        assert [(p.page_size.capacity, p.total, p.free) for p in node.hugepages] == [
+            (2048, 512, 500), (1048576, 2, 2)
+        ]
+        assert nodes[1].hugepages == []
+        # The bitmap is not part of the serialized model
+        assert "_cpu_mask" not in node.model_dump()
+
+    def test_missing_attribute_is_partial(self, tmp_path):
+        _make_node(tmp_path, 0, "0-3", 1024, 512, "10")
+        (tmp_path / "node0" / "distance").unlink()
+
+        status = Status()
+        nodes = list(iter_numa_nodes(str(tmp_path), status))
+
+        assert len(nodes) == 1
+        assert status.type == StatusType.PARTIAL
+        assert "NUMA node 0" in status.messages[0]
+
+    def test_no_numa_support(self, tmp_path):
+        assert list(iter_numa_nodes(str(tmp_path / "missing"))) == []
+
+
+class TestMapModulesToNodes:
+
+    def test_single_node(self):
+        modules = [_module(8192, 0x1000), _module(0, 0x1000)]
+        map_modules_to_nodes(modules, [_node(0, 16000000)])
+
+        assert modules[0].numa_node == 0
+        # Empty slots belong to no node
+        assert modules[1].numa_node is None
+
+    def test_one_array_per_node(self):
+        modules = [_module(8192, 0x2000), _module(8192, 0x1000), _module(8192, 0x2000)]
+        map_modules_to_nodes(modules, [_node(0, 16000000), _node(1, 16000000), _node(2, 0)])
+
+        assert [m.numa_node for m in modules] == [1, 0, 1]
+
+    def test_ambiguous_layout(self):
+        modules = [_module(8192, 0x1000), _module(8192, 0x1000)]
+        map_modules_to_nodes(modules, [_node(0, 16000000), _node(1, 16000000)])
+
+        assert [m.numa_node for m in modules] == [None, None]
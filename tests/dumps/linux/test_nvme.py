@@ -0,0 +1,94 @@
+from pysysinfo.dumps.linux.nvme import fetch_nvme
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _write(path, **attributes):
+    path.mkdir(parents=True, exist_ok=True)
+    for name, value in attributes.items():
+        (path / name).write_text(value + "\n")
+
+
+def _make_namespace(path, nsid, sectors, scheduler="[none] mq-deadline"):
+    _write(path, nsid=str(nsid), size=str(sectors))
+    _write(path / "queue", logical_block_size="4096", nr_requests="1023", scheduler=scheduler)
+
+
+def _make_controller(root, name, transport, address, numa_node="-1"):
+    _write(root / name, model="Samsung SSD 980 PRO 2TB", serial="S6B0NL0T123456      ", firmware_rev="5B2QGXA7",
+           transport=transport, address=address, state="live", numa_node=numa_node,
+           subsysnqn=f"nqn.2014.08.org.nvmexpress:{name}")
+    return root / name
+
+
+def _sysfs(tmp_path):
+    """
+    nvme0: local PCIe controller, with nvme0n1
+    nvme1, nvme2: two NVMe/TCP paths to the multipath namespace nvme1n1
+    """
+    classes = tmp_path / "nvme"
+    subsystems = tmp_path / "nvme-subsystem"
+
+    nvme0 = _make_controller(classes, "nvme0", "pcie", "0000:3d:00.0", numa_node="1")
+    _make_namespace(nvme0 / "nvme0n1", 1, 3907029168)
+    _write(subsystems / "nvme-subsys0" / "nvme0")
+
+    for name, path in (("nvme1", "nvme1c1n1"), ("nvme2", "nvme1c2n1")):
+        controller = _make_controller(classes, name, "tcp", "traddr=10.0.0.2,trsvcid=4420")
+        _make_namespace(controller / path, 1, 2097152)
+        _write(subsystems / "nvme-subsys1" / name)
+    _make_namespace(subsystems / "nvme-subsys1" / "nvme1n1", 1, 2097152, scheduler="none")
+
+    return str(classes), str(subsystems)
+
+
+class TestNVMe:
+
+    def test_controllers(self, tmp_path):
+        status = Status()
+        controllers, _ = fetch_nvme(*_sysfs(tmp_path), status=status)
+
+        assert status.type == StatusType.SUCCESS
+        assert [c.name for c in controllers] == ["nvme0", "nvme1", "nvme2"]
+
+        local = controllers[0]
+        assert local.serial == "S6B0NL0T123456"
+        assert local.transport == "pcie"
+        assert local.address == "0000:3d:00.0"
+        assert local.numa_node == 1
+        assert local.subsystem == "nvme-subsys0"
+        assert local.namespaces == ["nvme0n1"]
+
+        fabric = controllers[1]
+        assert fabric.transport == "tcp"
+        assert fabric.numa_node is None
+        assert fabric.namespaces == ["nvme1n1"]
+
+    def test_namespaces(self, tmp_path):
+        _, namespaces = fetch_nvme(*_sysfs(tmp_path))
+
+        assert [n.name for n in namespaces] == ["nvme0n1", "nvme1n1"]
+
+        local, shared = namespaces
+        assert local.nsid == 1
+        assert local.size.capacity == 1907729
+        assert local.logical_block_size == 4096
+        assert local.nr_requests == 1023
+        assert local.scheduler == "none"
+        assert local.controllers == ["nvme0"]
+
+        # The multipath namespace is listed once, with both of its paths
+        assert shared.controllers == ["nvme1", "nvme2"]
+
+    def test_natural_order(self, tmp_path):
+        for name in ("nvme10", "nvme2"):
+            _make_controller(tmp_path / "nvme", name, "pcie", "")
+
+        controllers, _ = fetch_nvme(str(tmp_path / "nvme"), str(tmp_path / "nvme-subsystem"))
+
+        assert [c.name for c in controllers] == ["nvme2", "nvme10"]
+
+    def test_no_nvme(self, tmp_path):
+        status = Status()
+
+        assert fetch_nvme(str(tmp_path / "nvme"), str(tmp_path / "nvme-subsystem"), status) == ([], [])
+        assert status.type == StatusType.SUCCESS
@@ -0,0 +1,98 @@
+import os
+
+from pysysinfo.dumps.linux.common import PCITopology
+from pysysinfo.dumps.linux.pcie import iter_pcie_links
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _make_function(tmp_path, function, **attributes):
+    path = tmp_path / "devices" / function
+    path.mkdir(parents=True)
+    for name, value in attributes.items():
+        (path / name).write_text(value + "\n")
+    bus = tmp_path / "bus"
+    bus.mkdir(exist_ok=True)
+    os.symlink(path, bus / os.path.basename(function))
+
+
+def _topology(tmp_path):
+    # Gen4 x16 root port -> Gen3 x4 NVMe controller, whose link trained at Gen3 x4 on the port's end,
+    # but at Gen3 x2 on the controller's end. And a Gen4 NIC at full speed. The host bridge has no link.
+    _make_function(tmp_path, "pci0000:00/0000:00:00.0", vendor="0x8086", device="0x1234", **{"class": "0x060000"})
+    _make_function(tmp_path, "pci0000:00/0000:00:01.0",
+                   vendor="0x8086", device="0x1235", current_link_speed="8.0 GT/s PCIe",
+                   max_link_speed="16.0 GT/s PCIe", current_link_width="4", max_link_width="16",
+                   **{"class": "0x060400"})
+    _make_function(tmp_path, "pci0000:00/0000:00:01.0/0000:01:00.0",
+                   vendor="0x144d", device="0xa808", current_link_speed="8.0 GT/s PCIe",
+                   max_link_speed="8.0 GT/s PCIe", current_link_width="2", max_link_width="4",
+                   **{"class": "0x010802"})
+    _make_function(tmp_path, "pci0000:00/0000:00:1c.0",
+                   vendor="0x8086", device="0x159b", current_link_speed="16.0 GT/s PCIe",
+                   max_link_speed="16.0 GT/s PCIe", current_link_width="8", max_link_width="8",
+                   **{"class": "0x020000"})
+    return PCITopology(str(tmp_path / "bus"))
+
+
+class TestPCIeLinks:
+
+    def test_iter_pcie_links(self, tmp_path):
+        status = Status()
+        links = list(iter_pcie_links(topology=_topology(tmp_path), status=status))
+
+        assert status.type == StatusType.SUCCESS
+        assert [link.slot for link in links] == ["0000:00:01.0", "0000:00:1c.0", "0000:01:00.0"]
+
+        nvme = links[2]
+        assert nvme.class_code == "0x010802"
+        assert nvme.bridge == "0000:00:01.0"
+        assert (nvme.current_speed, nvme.max_speed) == (8.0, 8.0)
+        assert (nvme.current_gen, nvme.max_gen) == (3, 3)
+        assert (nvme.current_width, nvme.max_width) == (2, 4)
+        assert (nvme.partner, nvme.supported_speed, nvme.supported_width) == ("0000:00:01.0", 8.0, 4)
+
+        root_port = links[0]
+        # Limited by the controller behind it
+        assert (root_port.partner, root_port.supported_speed, root_port.supported_width) == ("0000:01:00.0", 8.0, 4)
+
+    def test_degraded_links(self, tmp_path):
+        links = list(iter_pcie_links(predicate=lambda link: link.degraded, topology=_topology(tmp_path)))
+
+        # The root port trained at the most that the controller behind it supports, so it is not degraded
+        assert [link.slot for link in links] == ["0000:01:00.0"]
+
+    def test_links_through_a_switch(self, tmp_path):
+        link = {"vendor": "0x10b5", "device": "0x8747", "class": "0x060400"}
+        _make_function(tmp_path, "pci0000:00/0000:00:01.0", current_link_speed="8.0 GT/s PCIe",
+                       max_link_speed="16.0 GT/s PCIe", current_link_width="16", max_link_width="16", **link)
+        # The switch upstream port is Gen3 x16, and its downstream port is Gen3 x8
+        _make_function(tmp_path, "pci0000:00/0000:00:01.0/0000:01:00.0", current_link_speed="8.0 GT/s PCIe",
+                       max_link_speed="8.0 GT/s PCIe", current_link_width="16", max_link_width="16", **link)
+        _make_function(tmp_path, "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0",
+                       current_link_speed="8.0 GT/s PCIe", max_link_speed="8.0 GT/s PCIe",
+                       current_link_width="4", max_link_width="8", **link)
+        # A Gen4 x4 device, which trained at the Gen3 of the switch
+        _make_function(tmp_path, "pci0000:00/0000:00:01.0/0000:01:00.0/0000:02:08.0/0000:03:00.0",
+                       current_link_speed="8.0 GT/s PCIe", max_link_speed="16.0 GT/s PCIe",
+                       current_link_width="4", max_link_width="4", **{"class": "0x010802"})
+
+        links = {link.slot: link for link in iter_pcie_links(topology=PCITopology(str(tmp_path / "bus")))}
+
+        assert links["0000:00:01.0"].partner == "0000:01:00.0"
+        assert links["0000:01:00.0"].partner == "0000:00:01.0"
+        assert links["0000:02:08.0"].partner == "0000:03:00.0"
+        assert links["0000:03:00.0"].partner == "0000:02:08.0"
+        # Each link trained at the most that both of its ends support
+        assert not any(link.degraded for link in links.values())
+
+    def test_unknown_speed(self, tmp_path):
+        _make_function(tmp_path, "pci0000:00/0000:00:02.0", current_link_speed="Unknown",
+                       max_link_speed="Unknown", current_link_width="0", max_link_width="0")
+
+        assert list(iter_pcie_links(topology=PCITopology(str(tmp_path / "bus")))) == []
+
+    def test_no_pci_bus(self, tmp_path):
+        status = Status()
+
+        assert list(iter_pcie_links(topology=PCITopology(str(tmp_path / "missing")), status=status)) == []
+        assert status.type == StatusType.FAILED
@@ -0,0 +1,96 @@
+from pysysinfo.dumps.linux.rapl import RaplSample, RaplSampler
+from pysysinfo.models.status_models import Status, StatusType
+
+
+def _write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{content}\n")
+
+
+def _make_zone(root, zone, name, energy_uj, max_energy_range_uj=262143328850):
+    _write(root / zone / "name", name)
+    _write(root / zone / "energy_uj", energy_uj)
+    _write(root / zone / "max_energy_range_uj", max_energy_range_uj)
+
+
+def _sysfs(tmp_path):
+    powercap, cpus = tmp_path / "powercap", tmp_path / "cpu"
+    _write(cpus / "online", "0-3")
+    for cpu in range(4):
+        _write(cpus / f"cpu{cpu}" / "topology" / "physical_package_id", cpu // 2)
+
+    _make_zone(powercap, "intel-rapl:0", "package-0", 1000000)
+    _make_zone(powercap, "intel-rapl:0:0", "core", 500000)
+    _make_zone(powercap, "intel-rapl:0:1", "dram", 200000, max_energy_range_uj=65712999613)
+    _make_zone(powercap, "intel-rapl:1", "package-1", 3000000)
+    _make_zone(powercap, "intel-rapl:2", "psys", 0)
+    # Duplicates intel-rapl:0
+    _make_zone(powercap, "intel-rapl-mmio:0", "package-0", 1000000)
+    (powercap / "intel-rapl").mkdir()
+    return powercap, cpus
+
+
+class TestRaplSampler:
+
+    def test_domains(self, tmp_path):
+        powercap, cpus = _sysfs(tmp_path)
+
+        status = Status()
+        with RaplSampler(str(powercap), str(cpus), status) as sampler:
+            domains = sampler.domains
+
+        assert status.type == StatusType.SUCCESS
+        assert [(d.zone, d.name, d.package, d.cpus) for d in domains] == [
+            ("intel-rapl:0", "package-0", 0, "0-1"),
+            ("intel-rapl:0:0", "core", 0, "0-1"),
+            ("intel-rapl:0:1", "dram", 0, "0-1"),
+            ("intel-rapl:1", "package-1", 1, "2-3"),
+            ("intel-rapl:2", "psys", None, None),
+        ]
+        assert domains[2].max_energy_range_uj == 65712999613
+
+    def test_energy_and_power(self, tmp_path):
+        powercap, cpus = _sysfs(tmp_path)
+
+        with RaplSampler(str(powercap), str(cpus)) as sampler:
+            first = sampler.sample()
+            _write(powercap / "intel-rapl:0" / "energy_uj", 31000000)
+            second = sampler.sample()
+            energy = sampler.energy(first, second)
+            power = sampler.power(RaplSample(0.0, first.energy_uj), RaplSample(2.0, second.energy_uj))
+
+        assert first.energy_uj[0] == 1000000
+        assert energy[0] == 30.0
+        assert energy[1] == 0.0
+        assert power[0] == 15.0
+
+    def test_counter_wraparound(self, tmp_path):
+        powercap, cpus = _sysfs(tmp_path)
+
+        with RaplSampler(str(powercap), str(cpus)) as sampler:
+            earlier = RaplSample(0.0, [65712000000, None, 65712000000, 0, 0])
+            later = RaplSample(1.0, [1000000, 0, 1000000, 0, 0])
+            energy = sampler.energy(earlier, later)
+
+        # Each counter wraps around at its own range
+        assert energy[0] == (1000000 - 65712000000 + 262143328850) / 1_000_000
+        assert energy[1] is None
+        assert energy[2] == (1000000 - 65712000000 + 65712999613) / 1_000_000
+
+    def test_unreadable_domains(self, tmp_path):
+        powercap, cpus = _sysfs(tmp_path)
+        (powercap / "intel-rapl:1" / "energy_uj").unlink()
+
+        status = Status()
+        with RaplSampler(str(powercap), str(cpus), status) as sampler:
+            assert [d.zone for d in sampler.domains] == ["intel-rapl:0", "intel-rapl:0:0", "intel-rapl:0:1", "intel-rapl:2"]
+
+        assert status.type == StatusType.PARTIAL
+        assert "intel-rapl:1" in status.messages[0]
+
+    def test_no_powercap(self, tmp_path):
+        status = Status()
+        with RaplSampler(str(tmp_path / "missing"), str(tmp_path / "cpu"), status) as sampler:
+            assert sampler.domains == []
+            assert sampler.sample().energy_uj == []
+        assert status.type == StatusType.SUCCESS
@@ -2,12 +2,46 @@ import builtins
 import os
 from unittest.mock import MagicMock
 
-from pysysinfo.dumps.linux.storage import fetch_storage_info
-from pysysinfo.models.status_models import StatusType
+import pytest
+
+from pysysinfo.dumps.linux.block_graph import BlockGraph
+from pysysinfo.dumps.linux.storage import fetch_block_queues, fetch_storage_info, iter_disks, read_block_queue
+from pysysinfo.models.status_models import Status, StatusType
+from pysysinfo.models.size_models import Megabyte
+from pysysinfo.models.storage_models import BlockDevice, BlockQueue
+from pysysinfo.util.deadline import Deadline
+
+
+def _use_block_devices(monkeypatch, *names, sizes=None):
+    """Stands in for the block device graph, with these devices and their sizes in MB"""
+    sizes = sizes or {}
+    devices = [
+        BlockDevice(
+            name=name,
+            dev=f"8:{index * 16}",
+            kind="loop" if name.startswith("loop") else "dm" if name.startswith("dm-") else "disk",
+            size=Megabyte(capacity=sizes[name]) if name in sizes else None,
+        )
+        for index, name in enumerate(names)
+    ]
+    monkeypatch.setattr("pysysinfo.dumps.linux.storage.fetch_block_graph", lambda status=None: BlockGraph(devices))
 
 
 class TestLinuxStorage:
 
+    @pytest.fixture(autouse=True)
+    def hermetic(self, monkeypatch):
+        # Volumes, NVMe and queues are tested on their own, this keeps the host's out of these tests
+        self.volume_calls = []
+
+        def fetch_volumes(**kwargs):
+            self.volume_calls.append(kwargs)
+            return []
+
+        monkeypatch.setattr("pysysinfo.dumps.linux.storage.fetch_volumes", fetch_volumes)
+        monkeypatch.setattr("pysysinfo.dumps.linux.storage.fetch_nvme", lambda status=None: ([], []))
+        monkeypatch.setattr("pysysinfo.dumps.linux.storage.fetch_block_queues", lambda: {})
+
     def test_fetch_storage_info_no_sys_block(self, monkeypatch):
         monkeypatch.setattr(os.path, "isdir", lambda x: False)
 
@@ -16,9 +50,31 @@ class TestLinuxStorage:
         assert storage_info.status.type == StatusType.FAILED
         assert "does not exist" in storage_info.status.messages[0]
 
+    def test_fetch_storage_info_queues(self, monkeypatch):
+        _use_block_devices(monkeypatch, "sda", "dm-0")
+        queues = {"sda": BlockQueue(scheduler="mq-deadline"), "dm-0": BlockQueue(read_ahead_kb=4096)}
+        monkeypatch.setattr("pysysinfo.dumps.linux.storage.fetch_block_queues", lambda: queues)
+        mock_file = MagicMock()
+        mock_file.read.return_value = "0"
+        monkeypatch.setattr(builtins, "open", lambda path, mode="r": mock_file)
+
+        storage_info = fetch_storage_info()
+
+        # Queues are only kept by device name, for disks and other block devices alike
+        assert storage_info.block_queues["sda"].scheduler == "mq-deadline"
+        assert storage_info.block_queues["dm-0"].read_ahead_kb == 4096
+        assert "queue" not in storage_info.modules[0].model_dump()
+
+    def test_fetch_storage_info_deadline(self, monkeypatch):
+        monkeypatch.setattr(os.path, "isdir", lambda x: False)
+        deadline = Deadline(5)
+
+        fetch_storage_info(deadline)
+
+        assert self.volume_calls[0]["deadline"] is deadline
+
     def test_fetch_storage_info_nvme_success(self, monkeypatch):
-        monkeypatch.setattr(os.path, "isdir", lambda x: True)
-        monkeypatch.setattr(os, "listdir", lambda x: ["nvme0n1", "loop0"])
+        _use_block_devices(monkeypatch, "nvme0n1", "loop0", sizes={"nvme0n1": 953869})
 
         def mock_open(path, mode="r"):
             mock_file = MagicMock()
@@ -33,8 +89,6 @@ class TestLinuxStorage:
                 content = "0xa808"
             elif "nvme0n1/device/device/vendor" in path:
                 content = "0x144d"
-            elif "nvme0n1/size" in path:
-                content = "1953525168"  # 1TB in 512-byte blocks
 
             mock_file.read.return_value = content
             mock_file.__enter__.return_value = mock_file
@@ -53,13 +107,11 @@ class TestLinuxStorage:
         assert disk.connector == "PCIe"
         assert disk.vendor_id == "0x144d"
         assert disk.device_id == "0xa808"
-        # 1953525168 * 512 / 1024 / 1024 = 953869.7109375 MB -> 953869 MB
         assert disk.size is not None
         assert disk.size.capacity == 953869
 
     def test_fetch_storage_info_sd_success(self, monkeypatch):
-        monkeypatch.setattr(os.path, "isdir", lambda x: True)
-        monkeypatch.setattr(os, "listdir", lambda x: ["sda"])
+        _use_block_devices(monkeypatch, "sda", sizes={"sda": 953869})
 
         def mock_open(path, mode="r"):
             mock_file = MagicMock()
@@ -72,8 +124,6 @@ class TestLinuxStorage:
                 content = "0"
             elif "sda/device/vendor" in path:
                 content = "ATA"
-            elif "sda/size" in path:
-                content = "1953525168"
 
             mock_file.read.return_value = content
             mock_file.__enter__.return_value = mock_file
@@ -95,8 +145,7 @@ class TestLinuxStorage:
         assert disk.size.capacity == 953869
 
     def test_fetch_storage_info_partial_failure(self, monkeypatch):
-        monkeypatch.setattr(os.path, "isdir", lambda x: True)
-        monkeypatch.setattr(os, "listdir", lambda x: ["sda"])
+        _use_block_devices(monkeypatch, "sda")
 
         def mock_open(path, mode="r"):
             mock_file = MagicMock()
@@ -109,8 +158,6 @@ class TestLinuxStorage:
                 content = "0"
             elif "sda/device/vendor" in path:
                 content = "ATA"
-            elif "sda/size" in path:
-                content = "1000"
 
             mock_file.read.return_value = content
             mock_file.__enter__.return_value = mock_file
@@ -125,8 +172,7 @@ class TestLinuxStorage:
         assert len(storage_info.modules) == 1
 
     def test_fetch_storage_info_exception(self, monkeypatch):
-        monkeypatch.setattr(os.path, "isdir", lambda x: True)
-        monkeypatch.setattr(os, "listdir", lambda x: ["sda"])
+        _use_block_devices(monkeypatch, "sda")
 
         def mock_open(path, mode="r"):
             raise PermissionError("Access denied")
@@ -138,3 +184,159 @@ class TestLinuxStorage:
         assert storage_info.status.type == StatusType.PARTIAL
         assert any("Disk Info: Access denied" in msg for msg in storage_info.status.messages)
         assert len(storage_info.modules) == 1
+
+    def test_iter_disks_connector_filter(self, monkeypatch):
+        _use_block_devices(monkeypatch, "sda", "nvme0n1", "sdb")
+
+        opened = []
+
+        def mock_open(path, mode="r"):
+            opened.append(path)
+            mock_file = MagicMock()
+            mock_file.read.return_value = "0"
+            mock_file.__enter__.return_value = mock_file
+            return mock_file
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+
+        disks = list(iter_disks(connector="PCIe"))
+
+        assert len(disks) == 1
+        assert disks[0].connector == "PCIe"
+        # SCSI disks are skipped before any of their files are read
+        assert all("/sd" not in path for path in opened)
+
+    def test_iter_disks_vendor_filter(self, monkeypatch):
+        _use_block_devices(monkeypatch, "nvme0n1", "nvme1n1")
+        opened = []
+
+        def mock_open(path, mode="r"):
+            opened.append(path)
+            mock_file = MagicMock()
+            mock_file.read.return_value = "0x144D" if path == "/sys/block/nvme1n1/device/device/vendor" else "0x8086"
+            return mock_file
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+
+        disks = list(iter_disks(vendor_id="0x144d"))
+
+        assert [disk.name for disk in disks] == ["nvme1n1"]
+        # Disks of other vendors are skipped before anything but their vendor is read
+        assert [path for path in opened if "nvme0n1" in path] == ["/sys/block/nvme0n1/device/device/vendor"]
+
+    def test_iter_disks_predicate_and_early_termination(self, monkeypatch):
+        _use_block_devices(monkeypatch, "sda", "sdb", "sdc")
+
+        opened = []
+
+        def mock_open(path, mode="r"):
+            opened.append(path)
+            mock_file = MagicMock()
+            mock_file.read.return_value = "1" if "removable" in path and "sdb" in path else "0"
+            mock_file.__enter__.return_value = mock_file
+            return mock_file
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+
+        external = next(iter_disks(predicate=lambda d: d.location == "External"))
+
+        assert external.location == "External"
+        assert not any("sdc" in path for path in opened)
+
+    def test_iter_disks_virtual_and_mmc(self, monkeypatch):
+        _use_block_devices(monkeypatch, "vda", "xvda", "mmcblk0", "mmcblk0boot0", "mmcblk0rpmb", "sr0")
+        files = {
+            "/sys/block/vda/device/device": "0x0002",
+            "/sys/block/vda/device/vendor": "0x1af4",
+            "/sys/block/mmcblk0/device/name": "DG4064",
+            "/sys/block/mmcblk0/device/manfid": "0x000045",
+        }
+
+        def mock_open(path, mode="r"):
+            mock_file = MagicMock()
+            mock_file.read.return_value = files.get(path, "0")
+            return mock_file
+
+        monkeypatch.setattr(builtins, "open", mock_open)
+        status = Status()
+
+        disks = {disk.name: disk for disk in iter_disks(status=status)}
+
+        assert status.type == StatusType.SUCCESS
+        # The boot and RPMB areas of the eMMC are not disks of their own
+        assert list(disks) == ["vda", "xvda", "mmcblk0"]
+        vda = disks["vda"]
+        assert (vda.connector, vda.vendor_id, vda.device_id, vda.model) == ("VirtIO", "0x1af4", "0x0002", None)
+        assert disks["xvda"].connector == "Xen"
+        assert (disks["mmcblk0"].connector, disks["mmcblk0"].model) == ("MMC", "DG4064")
+        assert disks["mmcblk0"].vendor_id == "0x000045"
+
+    def test_iter_disks_skips_stacked_devices(self, monkeypatch):
+        # A disk that is assembled from others, e.g. by a driver that registers it as a disk, is not physical
+        devices = [
+            BlockDevice(name="sda", dev="8:0", kind="disk"),
+            BlockDevice(name="sdb", dev="8:16", kind="disk", slaves=["sda"]),
+        ]
+        mock_file = MagicMock()
+        mock_file.read.return_value = "0"
+        monkeypatch.setattr(builtins, "open", lambda path, mode="r": mock_file)
+
+        disks = list(iter_disks(graph=BlockGraph(devices)))
+
+        assert [disk.name for disk in disks] == ["sda"]
+
+    def test_fetch_storage_info_block_devices(self, monkeypatch):
+        _use_block_devices(monkeypatch, "sda", "dm-0")
+        mock_file = MagicMock()
+        mock_file.read.return_value = "0"
+        monkeypatch.setattr(builtins, "open", lambda path, mode="r": mock_file)
+
+        storage_info = fetch_storage_info()
+
+        assert [device.name for device in storage_info.block_devices] == ["sda", "dm-0"]
+        assert storage_info.block_device("dm-0").kind == "dm"
+        assert storage_info.block_device_by_dev("8:0").name == "sda"
+        assert storage_info.block_device("sdz") is None
+        # The graph is read once, and shared with the volumes
+        assert isinstance(self.volume_calls[0]["graph"], BlockGraph)
+
+    def test_read_block_queue(self, tmp_path):
+        queue = tmp_path / "sda" / "queue"
+        queue.mkdir(parents=True)
+        for name, value in {
+            "scheduler": "none [mq-deadline] kyber bfq",
+            "nr_requests": "64",
+            "read_ahead_kb": "128",
+            "max_sectors_kb": "1280",
+            "rq_affinity": "1",
+            "nomerges": "0",
+            "write_cache": "write back",
+            "physical_block_size": "4096",
+            "logical_block_size": "512",
+            "rotational": "1",
+        }.items():
+            (queue / name).write_text(value + "\n")
+
+        block_queue = read_block_queue(str(queue))
+
+        assert block_queue.scheduler == "mq-deadline"
+        assert block_queue.nr_requests == 64
+        assert block_queue.read_ahead_kb == 128
+        assert block_queue.max_sectors_kb == 1280
+        assert block_queue.rq_affinity == 1
+        assert block_queue.nomerges == 0
+        assert block_queue.write_cache == "write back"
+        assert (block_queue.physical_block_size, block_queue.logical_block_size) == (4096, 512)
+        assert block_queue.rotational is True
+
+    def test_fetch_block_queues(self, tmp_path):
+        (tmp_path / "dm-0" / "queue").mkdir(parents=True)
+        (tmp_path / "dm-0" / "queue" / "read_ahead_kb").write_text("4096\n")
+        # Devices without a request queue are skipped
+        (tmp_path / "loop0").mkdir()
+
+        queues = fetch_block_queues(str(tmp_path))
+
+        assert list(queues) == ["dm-0"]
+        assert queues["dm-0"].read_ahead_kb == 4096
+        assert queues["dm-0"].scheduler is None
@@ -0,0 +1,90 @@
+from pysysinfo.dumps.linux.usb import fetch_usb_info
+from pysysinfo.models.status_models import StatusType
+from pysysinfo.util.ids import IDsDatabase
+
+USB_IDS = """\
+1d6b  Linux Foundation
+	0002  2.0 root hub
+05e3  Genesys Logic, Inc.
+	0610  Hub
+046d  Logitech, Inc.
+	c52b  Unifying Receiver
+C 09  Hub
+"""
+
+
+def _make_device(root, name, **attributes):
+    path = root / name
+    path.mkdir(parents=True)
+    for attribute, value in attributes.items():
+        (path / attribute).write_text(f"{value}\n")
+
+
+def _sysfs(tmp_path):
+    root = tmp_path / "devices"
+    _make_device(root, "usb1", idVendor="1d6b", idProduct="0002", bDeviceClass="09", busnum=1, devnum=1,
+                 speed=480, version=" 2.00", manufacturer="Linux 6.1.0 xhci-hcd", product="xHCI Host Controller")
+    _make_device(root, "1-0:1.0", bInterfaceClass="09")
+    _make_device(root, "1-2", idVendor="05e3", idProduct="0610", bDeviceClass="09", busnum=1, devnum=2, speed=480)
+    _make_device(root, "1-2:1.0", bInterfaceClass="09")
+    _make_device(root, "1-2.10", idVendor="0403", idProduct="6001", bDeviceClass="00", busnum=1, devnum=4,
+                 speed=12, manufacturer="FTDI", product="Console 10", serial="A10")
+    _make_device(root, "1-2.3", idVendor="046d", idProduct="c52b", bDeviceClass="00", busnum=1, devnum=3,
+                 speed=12)
+    _make_device(root, "1-2.3:1.0", bInterfaceClass="03")
+    _make_device(root, "1-2.3:1.1", bInterfaceClass="03")
+    _make_device(root, "1-2.3:1.2", bInterfaceClass="ff")
+    _make_device(root, "usb2", idVendor="1d6b", idProduct="0003", bDeviceClass="09", busnum=2, devnum=1,
+                 speed=5000)
+    return root
+
+
+def _ids(tmp_path):
+    path = tmp_path / "usb.ids"
+    path.write_text(USB_IDS)
+    return IDsDatabase([str(path)])
+
+
+class TestUSB:
+
+    def test_hub_tree(self, tmp_path):
+        usb_info = fetch_usb_info(str(_sysfs(tmp_path)), _ids(tmp_path))
+
+        assert usb_info.status.type == StatusType.SUCCESS
+        assert [device.port for device in usb_info.devices] == ["usb1", "usb2"]
+        hub = usb_info.devices[0].children[0]
+        assert hub.port == "1-2"
+        assert [device.port for device in hub.children] == ["1-2.3", "1-2.10"]
+        assert [device.port for device in usb_info.iter_devices()] == ["usb1", "1-2", "1-2.3", "1-2.10", "usb2"]
+
+    def test_device_attributes(self, tmp_path):
+        usb_info = fetch_usb_info(str(_sysfs(tmp_path)), _ids(tmp_path))
+        devices = {device.port: device for device in usb_info.iter_devices()}
+
+        root_hub = devices["usb1"]
+        assert (root_hub.vendor_id, root_hub.product_id) == ("0x1d6b", "0x0002")
+        assert (root_hub.manufacturer, root_hub.name) == ("Linux 6.1.0 xhci-hcd", "xHCI Host Controller")
+        assert (root_hub.bus, root_hub.device_number, root_hub.speed) == (1, 1, 480)
+        assert (root_hub.usb_version, root_hub.device_class, root_hub.class_name) == ("2.00", "0x09", "Hub")
+
+        serial = devices["1-2.10"]
+        assert (serial.manufacturer, serial.name, serial.serial, serial.speed) == ("FTDI", "Console 10", "A10", 12)
+        assert (serial.device_class, serial.class_name) == ("0x00", None)
+
+        assert devices["1-2.3"].interface_classes == ["0x03", "0xff"]
+        assert devices["usb1"].interface_classes == ["0x09"]
+
+    def test_names_from_ids_database(self, tmp_path):
+        usb_info = fetch_usb_info(str(_sysfs(tmp_path)), _ids(tmp_path))
+        devices = {device.port: device for device in usb_info.iter_devices()}
+
+        assert (devices["1-2"].manufacturer, devices["1-2"].name) == ("Genesys Logic, Inc.", "Hub")
+        assert (devices["1-2.3"].manufacturer, devices["1-2.3"].name) == ("Logitech, Inc.", "Unifying Receiver")
+        # Unknown to the database, and the device reports no strings
+        assert devices["usb2"].name is None
+
+    def test_no_usb(self, tmp_path):
+        usb_info = fetch_usb_info(str(tmp_path / "missing"), _ids(tmp_path))
+
+        assert usb_info.status.type == StatusType.FAILED
+        assert usb_info.devices == []
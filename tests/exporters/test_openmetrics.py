@@ -0,0 +1,132 @@
+import urllib.request
+
+from pysysinfo.exporters import openmetrics
+from pysysinfo.exporters.openmetrics import CONTENT_TYPE, OpenMetricsExporter, serve
+from pysysinfo.models.cpu_models import CPUInfo
+from pysysinfo.models.gpu_models import GPUInfo, GraphicsInfo
+from pysysinfo.models.info_models import HardwareManagerInterface, LinuxHardwareInfo
+from pysysinfo.models.memory_models import MemoryInfo, MemoryModuleInfo, MemoryModuleSlot
+from pysysinfo.models.size_models import Megabyte
+from pysysinfo.models.status_models import StatusType
+from pysysinfo.models.storage_models import DiskInfo, StorageInfo
+from pysysinfo.models.usb_models import USBDevice, USBInfo
+
+
+class FakeManager(HardwareManagerInterface):
+    def __init__(self):
+        self.info = LinuxHardwareInfo(
+            cpu=CPUInfo(name="Intel(R) Core(TM) i5-7200U", vendor="intel", architecture="x86", cores=2, threads=4),
+            memory=MemoryInfo(modules=[
+                MemoryModuleInfo(capacity=Megabyte(capacity=8192), slot=MemoryModuleSlot(channel="A", bank="0")),
+                MemoryModuleInfo(capacity=Megabyte(capacity=8192), slot=MemoryModuleSlot(channel="B", bank="0")),
+            ]),
+            storage=StorageInfo(modules=[DiskInfo(model="Samsung SSD", size=Megabyte(capacity=1024))]),
+            graphics=GraphicsInfo(modules=[
+                GPUInfo(name="Radeon \"RX\" 5700", vendor_id="0x1002", vram=Megabyte(capacity=8192))
+            ]),
+            usb=USBInfo(devices=[
+                USBDevice(port="usb1", vendor_id="0x1d6b", product_id="0x0002", class_name="Hub", children=[
+                    USBDevice(port="1-2", vendor_id="0x046d", product_id="0xc52b", name="Unifying Receiver"),
+                ]),
+            ]),
+        )
+
+
+class TestOpenMetricsExporter:
+
+    def test_render_static_info(self):
+        text = OpenMetricsExporter(FakeManager()).render()
+
+        assert text.endswith("# EOF\n")
+        assert '# TYPE pysysinfo_cpu info' in text
+        assert 'pysysinfo_cpu_info{name="Intel(R) Core(TM) i5-7200U",vendor="intel",architecture="x86"} 1' in text
+        assert "pysysinfo_cpu_cores 2" in text
+        assert "pysysinfo_memory_modules 2" in text
+        assert f"pysysinfo_memory_capacity_bytes {16384 * 1024 ** 2}" in text
+        assert f'pysysinfo_gpu_vram_bytes{{index="0",name="Radeon \\"RX\\" 5700"}} {8192 * 1024 ** 2}' in text
+        assert f'pysysinfo_disk_size_bytes{{index="0",model="Samsung SSD"}} {1024 ** 3}' in text
+        assert 'pysysinfo_usb_device_info{port="usb1",vendor_id="0x1d6b",product_id="0x0002",class="Hub"} 1' in text
+        assert ('pysysinfo_usb_device_info{port="1-2",vendor_id="0x046d",product_id="0xc52b",'
+                'name="Unifying Receiver"} 1') in text
+        assert 'pysysinfo_component_status{component="usb",pysysinfo_component_status="success"} 1' in text
+
+    def test_render_status_stateset(self):
+        manager = FakeManager()
+        manager.info.storage.status.type = StatusType.PARTIAL
+        text = OpenMetricsExporter(manager).render()
+
+        assert 'pysysinfo_component_status{component="storage",pysysinfo_component_status="partial"} 1' in text
+        assert 'pysysinfo_component_status{component="storage",pysysinfo_component_status="success"} 0' in text
+        assert 'pysysinfo_component_status{component="cpu",pysysinfo_component_status="success"} 1' in text
+        # Each family is declared once
+        assert text.count("# TYPE pysysinfo_component_status") == 1
+
+    def test_render_is_cached_until_component_is_replaced(self):
+        manager = FakeManager()
+        exporter = OpenMetricsExporter(manager)
+        exporter.render()
+
+        # Mutating in place is not picked up, since the component object is the same
+        manager.info.cpu.cores = 8
+        assert "pysysinfo_cpu_cores 2" in exporter.render()
+
+        manager.info.cpu = CPUInfo(name="New CPU", cores=8)
+        assert "pysysinfo_cpu_cores 8" in exporter.render()
+
+    def test_samplers_are_rendered_every_scrape(self):
+        exporter = OpenMetricsExporter(FakeManager())
+        values = iter([10.5, 20])
+        exporter.add_sampler(
+            "pysysinfo_gpu_busy_percent",
+            lambda: [("pysysinfo_gpu_busy_percent", {"index": "0"}, next(values))],
+            "GPU utilization",
+        )
+
+        assert 'pysysinfo_gpu_busy_percent{index="0"} 10.5' in exporter.render()
+        assert 'pysysinfo_gpu_busy_percent{index="0"} 20' in exporter.render()
+
+    def test_failing_sampler_is_skipped(self):
+        exporter = OpenMetricsExporter(FakeManager())
+
+        def broken():
+            raise RuntimeError("sensor gone")
+
+        exporter.add_sampler("pysysinfo_broken", broken)
+        text = exporter.render()
+
+        assert "pysysinfo_broken" not in text
+        assert text.endswith("# EOF\n")
+
+    def test_non_finite_values(self):
+        exporter = OpenMetricsExporter(FakeManager())
+        exporter.add_sampler("pysysinfo_temperature_celsius", lambda: [
+            ("pysysinfo_temperature_celsius", {"sensor": "a"}, float("nan")),
+            ("pysysinfo_temperature_celsius", {"sensor": "b"}, float("inf")),
+        ])
+        text = exporter.render()
+
+        assert 'pysysinfo_temperature_celsius{sensor="a"} NaN' in text
+        assert 'pysysinfo_temperature_celsius{sensor="b"} +Inf' in text
+
+    def test_label_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(openmetrics, "LABEL_CACHE_SIZE", 3)
+        exporter = OpenMetricsExporter(FakeManager())
+        mounts = iter(range(100))
+        exporter.add_sampler("pysysinfo_volume_used_bytes", lambda: [
+            ("pysysinfo_volume_used_bytes", {"mount_point": f"/mnt/{next(mounts)}"}, 1)
+        ])
+
+        for _ in range(10):
+            exporter.render()
+
+        assert len(exporter._label_cache) <= 3
+
+    def test_serve_metrics_endpoint(self):
+        server = serve(OpenMetricsExporter(FakeManager()), port=0, address="127.0.0.1")
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                assert "pysysinfo_cpu_cores 2" in response.read().decode()
+        finally:
+            server.shutdown()
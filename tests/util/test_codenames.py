@@ -0,0 +1,59 @@
+import pytest
+
+from pysysinfo.util.codenames import CODENAMES_INDEX_PATH, CPUCodename, CodenameManager, build_index
+
+TABLE = """\
+# comment
+vendor,family,model,stepping_min,stepping_max,codename,microarchitecture,generation
+GenuineIntel,6,85,5,7,Cascade Lake,Cascade Lake,2nd Gen Xeon Scalable
+GenuineIntel,6,85,0,4,Skylake-SP,Skylake,1st Gen Xeon Scalable
+AuthenticAMD,25,97,0,255,Raphael,Zen 4,Ryzen 7000
+GenuineIntel,6,94,0,255,Skylake-S,Skylake,6th Gen Core
+"""
+
+
+@pytest.fixture
+def manager(tmp_path):
+    table = tmp_path / "codenames.csv"
+    table.write_text(TABLE)
+    index = tmp_path / "codenames.idx"
+    index.write_bytes(build_index(str(table)))
+    manager = CodenameManager(str(index))
+    yield manager
+    manager.close()
+
+
+class TestCodenameManager:
+
+    def test_lookup(self, manager):
+        assert manager.lookup("AuthenticAMD", 25, 97, 2) == CPUCodename("Raphael", "Zen 4", "Ryzen 7000")
+        assert manager.lookup("GenuineIntel", 6, 94).codename == "Skylake-S"
+
+    def test_stepping_tells_apart_shared_models(self, manager):
+        assert manager.lookup("GenuineIntel", 6, 85, 4).codename == "Skylake-SP"
+        assert manager.lookup("GenuineIntel", 6, 85, 7).codename == "Cascade Lake"
+        # Ambiguous without a stepping
+        assert manager.lookup("GenuineIntel", 6, 85) is None
+
+    def test_unknown_cpu(self, manager):
+        assert manager.lookup("GenuineIntel", 6, 1) is None
+        assert manager.lookup("AuthenticAMD", 26, 97) is None
+        assert manager.lookup("CentaurHauls", 6, 15) is None
+
+    def test_index_is_loaded_lazily(self, tmp_path):
+        manager = CodenameManager(str(tmp_path / "missing.idx"))
+
+        # Nothing is read until the first lookup
+        with pytest.raises(OSError):
+            manager.lookup("GenuineIntel", 6, 94)
+
+    def test_invalid_index(self, tmp_path):
+        index = tmp_path / "codenames.idx"
+        index.write_bytes(b"\0" * 64)
+
+        with pytest.raises(ValueError):
+            CodenameManager(str(index)).lookup("GenuineIntel", 6, 94)
+
+    def test_bundled_index_is_up_to_date(self):
+        with open(CODENAMES_INDEX_PATH, "rb") as f:
+            assert f.read() == build_index()
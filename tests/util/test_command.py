@@ -0,0 +1,241 @@
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from pysysinfo.util.command import CommandRunner, run_process
+from pysysinfo.util.deadline import DEFAULT_PROBE_TIMEOUT, Deadline
+
+
+def _counting_run(calls, delay=0.0, returncode=0):
+    def mock_run(command, *args, **kwargs):
+        calls.append(command)
+        if delay:
+            time.sleep(delay)
+        return subprocess.CompletedProcess(command, returncode, stdout=f"out {len(calls)}", stderr="")
+
+    return mock_run
+
+
+class TestCommandRunner:
+
+    def test_output_is_cached_within_ttl(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+
+        first = runner.run(["uname", "-m"], ttl=60)
+        second = runner.run(["uname", "-m"], ttl=60)
+
+        assert first.stdout == second.stdout == "out 1"
+        assert len(calls) == 1
+        stats = runner.stats()["uname"]
+        assert stats.spawns == 1
+        assert stats.cache_hits == 1
+
+    def test_no_ttl_always_spawns(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+
+        runner.run(["uname", "-m"])
+        runner.run(["uname", "-m"])
+
+        assert len(calls) == 2
+
+    def test_expired_entry_is_refreshed(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+
+        runner.run(["uname", "-m"], ttl=0.01)
+        time.sleep(0.02)
+        assert runner.run(["uname", "-m"], ttl=0.01).stdout == "out 2"
+
+    def test_failures_are_not_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls, returncode=1))
+        runner = CommandRunner()
+
+        runner.run(["nvidia-smi"], ttl=60)
+        runner.run(["nvidia-smi"], ttl=60)
+
+        assert len(calls) == 2
+        assert runner.stats()["nvidia-smi"].failures == 2
+
+    def test_check_raises_on_non_zero_exit(self, monkeypatch):
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run([], returncode=2))
+
+        with pytest.raises(subprocess.CalledProcessError):
+            CommandRunner().run("wmic memorychip get Capacity", shell=True, check=True)
+
+    def test_invalidate(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+
+        runner.run(["uname", "-m"], ttl=60)
+        runner.run(["lscpu", "-p"], ttl=60)
+        runner.invalidate(["uname", "-m"])
+        runner.run(["uname", "-m"], ttl=60)
+        runner.run(["lscpu", "-p"], ttl=60)
+
+        assert calls == [["uname", "-m"], ["lscpu", "-p"], ["uname", "-m"]]
+
+    def test_invalidate_program(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+
+        lspci = ["lspci", "-s", "0000:01:00.0", "-vmm"]
+        runner.run(lspci, ttl=60)
+        runner.run(["lscpu", "-p"], ttl=60)
+        runner.invalidate(program="lspci")
+        runner.run(lspci, ttl=60)
+        runner.run(["lscpu", "-p"], ttl=60)
+
+        assert calls == [lspci, ["lscpu", "-p"], lspci]
+
+    def test_concurrent_identical_commands_share_one_spawn(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls, delay=0.1))
+        runner = CommandRunner()
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(runner.run(["lspci", "-s", "0000:01:00.0", "-vmm"])))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert [r.stdout for r in results] == ["out 1"] * 4
+        assert runner.stats()["lspci"].deduplicated == 3
+
+    def test_waiter_exception_is_shared(self, monkeypatch):
+        started = threading.Event()
+
+        def mock_run(command, *args, **kwargs):
+            started.set()
+            time.sleep(0.05)
+            raise FileNotFoundError("lspci not found")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+        runner = CommandRunner()
+        errors = []
+
+        def target():
+            try:
+                runner.run(["lspci"])
+            except FileNotFoundError as e:
+                errors.append(e)
+
+        owner = threading.Thread(target=target)
+        owner.start()
+        started.wait()
+        target()
+        owner.join()
+
+        assert len(errors) == 2
+
+    def test_run_many_runs_in_parallel(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls, delay=0.1))
+        runner = CommandRunner()
+
+        start = time.monotonic()
+        results = runner.run_many([["sysctl", "a"], ["sysctl", "b"], ["sysctl", "c"], ["uname", "-m"]], ttl=60)
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 4
+        assert elapsed < 0.3
+        # The cache is warm now
+        runner.run(["sysctl", "b"], ttl=60)
+        assert len(calls) == 4
+
+    def test_run_many_returns_exceptions_in_place(self, monkeypatch):
+        def mock_run(command, *args, **kwargs):
+            if command[0] == "missing":
+                raise FileNotFoundError(command[0])
+            return subprocess.CompletedProcess(command, 0, stdout="ok")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+
+        results = CommandRunner().run_many([["uname"], ["missing"]])
+
+        assert results[0].stdout == "ok"
+        assert isinstance(results[1], FileNotFoundError)
+
+    def test_expired_deadline_with_cached_output(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr("pysysinfo.util.command.run_process", _counting_run(calls))
+        runner = CommandRunner()
+        runner.run(["uname", "-m"], ttl=60)
+
+        # Cached output needs no time, so it is returned even past the deadline
+        assert runner.run(["uname", "-m"], ttl=60, deadline=Deadline(0)).stdout == "out 1"
+        with pytest.raises(subprocess.TimeoutExpired):
+            runner.run(["lscpu", "-p"], ttl=60, deadline=Deadline(0))
+        assert len(calls) == 1
+
+    def test_default_timeout(self, monkeypatch):
+        timeouts = []
+
+        def mock_run(command, *args, **kwargs):
+            timeouts.append(kwargs["timeout"])
+            return subprocess.CompletedProcess(command, 0, stdout="")
+
+        monkeypatch.setattr("pysysinfo.util.command.run_process", mock_run)
+        runner = CommandRunner()
+
+        runner.run(["lscpu", "-p"])
+        # Slow tools, e.g. system_profiler on a cold cache, can opt out of the limit
+        runner.run(["system_profiler", "SPDisplaysDataType"], default_timeout=None)
+        runner.run_many([["ioreg", "-l"]], default_timeout=None)
+        # A deadline still applies
+        runner.run(["sysctl", "hw.memsize"], deadline=Deadline(5), default_timeout=None)
+
+        assert timeouts[0] == DEFAULT_PROBE_TIMEOUT
+        assert timeouts[1:3] == [None, None]
+        assert 0 < timeouts[3] <= 5
+
+
+class TestRunProcess:
+
+    def test_output_is_captured(self):
+        result = run_process(["echo", "hello"], timeout=5)
+
+        assert result.returncode == 0
+        assert result.stdout == "hello\n"
+
+    def test_timeout_kills_the_process(self):
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_process(["sleep", "10"], timeout=0.1)
+        assert time.monotonic() - start < 2
+
+    def test_process_that_does_not_exit_is_abandoned(self, monkeypatch):
+        class StuckProcess:
+            args = ["nvidia-smi"]
+
+            def __init__(self, *args, **kwargs):
+                self.stdout, self.stderr = open(os.devnull), open(os.devnull)
+                self.killed = False
+
+            def communicate(self, timeout=None):
+                # Like a process in D state, which ignores SIGKILL
+                raise subprocess.TimeoutExpired(self.args, timeout)
+
+            def kill(self):
+                self.killed = True
+
+        monkeypatch.setattr(subprocess, "Popen", StuckProcess)
+        monkeypatch.setattr("pysysinfo.util.command.KILL_GRACE", 0.01)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_process(["nvidia-smi"], timeout=0.01)
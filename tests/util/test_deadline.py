@@ -0,0 +1,33 @@
+import subprocess
+import time
+
+import pytest
+
+from pysysinfo.util.deadline import DEFAULT_PROBE_TIMEOUT, Deadline, probe_timeout
+
+
+class TestDeadline:
+
+    def test_unlimited(self):
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert not deadline.expired
+        assert probe_timeout(deadline, ["lspci"]) == DEFAULT_PROBE_TIMEOUT
+
+    def test_no_deadline_uses_default_probe_timeout(self):
+        assert probe_timeout(None, ["lspci"]) == DEFAULT_PROBE_TIMEOUT
+
+    def test_remaining_decreases(self):
+        deadline = Deadline(5)
+        first = deadline.remaining()
+        time.sleep(0.01)
+        assert deadline.remaining() < first
+        assert 0 < probe_timeout(deadline, ["lspci"]) <= 5
+
+    def test_expired_deadline_does_not_start_probe(self):
+        deadline = Deadline(0)
+        assert deadline.expired
+        assert deadline.remaining() == 0
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            probe_timeout(deadline, ["nvidia-smi"])
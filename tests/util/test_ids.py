@@ -0,0 +1,76 @@
+from pysysinfo.util.ids import IDsDatabase, parse_ids
+
+USB_IDS = """\
+#
+#	List of USB ID's
+#
+# Syntax:
+# vendor  vendor_name
+#	device  device_name				<-- single tab
+
+1d6b  Linux Foundation
+	0002  2.0 root hub
+	0003  3.0 root hub
+046d  Logitech, Inc.
+	c52b  Unifying Receiver
+0403  Future Technology Devices International, Ltd
+	6001  FT232 Serial (UART) IC
+		0403 6001  subsystem entry that is skipped
+
+# List of known device classes, subclasses and protocols
+C 00  (Defined at Interface level)
+C 03  Human Interface Device
+	01  Boot Interface Subclass
+		01  Keyboard
+C 09  Hub
+	00  Unused
+
+AT 0409  English - United States
+HID 00  Undefined
+R 00  Undefined Item
+"""
+
+
+class TestParseIDs:
+
+    def test_vendors_and_devices(self):
+        vendors, classes = parse_ids(USB_IDS)
+
+        assert vendors[0x1d6b][0] == "Linux Foundation"
+        assert vendors[0x1d6b][1] == {0x0002: "2.0 root hub", 0x0003: "3.0 root hub"}
+        assert vendors[0x0403][1] == {0x6001: "FT232 Serial (UART) IC"}
+        assert classes == {0x00: "(Defined at Interface level)", 0x03: "Human Interface Device", 0x09: "Hub"}
+
+    def test_other_sections_are_skipped(self):
+        vendors, _ = parse_ids(USB_IDS)
+        assert set(vendors) == {0x1d6b, 0x046d, 0x0403}
+
+
+class TestIDsDatabase:
+
+    def test_lookup(self, tmp_path):
+        path = tmp_path / "usb.ids"
+        path.write_text(USB_IDS)
+        ids = IDsDatabase([str(tmp_path / "missing.ids"), str(path)])
+
+        assert ids.vendor(0x046d) == "Logitech, Inc."
+        assert ids.device(0x046d, 0xc52b) == "Unifying Receiver"
+        assert ids.device(0x046d, 0xffff) is None
+        assert ids.device(0xffff, 0x0001) is None
+        assert ids.device_class(0x09) == "Hub"
+
+    def test_parsed_once(self, tmp_path):
+        path = tmp_path / "usb.ids"
+        path.write_text(USB_IDS)
+        ids = IDsDatabase([str(path)])
+
+        assert ids.vendor(0x1d6b) == "Linux Foundation"
+        path.write_text("1d6b  Renamed\n")
+        assert ids.vendor(0x1d6b) == "Linux Foundation"
+        ids.clear()
+        assert ids.vendor(0x1d6b) == "Renamed"
+
+    def test_no_database(self, tmp_path):
+        ids = IDsDatabase([str(tmp_path / "usb.ids")])
+        assert ids.vendor(0x1d6b) is None
+        assert ids.device_class(0x09) is None
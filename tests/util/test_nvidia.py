@@ -0,0 +1,147 @@
+import math
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from pysysinfo.util import nvidia
+from pysysinfo.util.nvidia import NvidiaSampler, RingBuffer
+
+FAKE_NVIDIA_SMI = """\
+import sys
+import time
+
+loop_ms = int([a for a in sys.argv if a.startswith("--loop-ms=")][0].split("=")[1])
+fields = [a for a in sys.argv if a.startswith("--query-gpu=")][0].split("=")[1].split(",")
+assert fields[0] == "pci.bus_id"
+
+tick = 0
+while True:
+    for bus_id, base in (("00000000:01:00.0", 10), ("00000000:02:00.0", 50)):
+        print(f"{bus_id}, {base + tick}, {1024 * (tick + 1)}, 8192, [N/A], 75.50", flush=True)
+    tick += 1
+    time.sleep(loop_ms / 1000)
+"""
+
+
+@pytest.fixture
+def fake_nvidia_smi(tmp_path):
+    script = tmp_path / "nvidia-smi"
+    script.write_text(f"#!{sys.executable}\n" + FAKE_NVIDIA_SMI)
+    script.chmod(0o755)
+    return str(script)
+
+
+def _wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestRingBuffer:
+
+    def test_keeps_most_recent_samples(self):
+        buffer = RingBuffer(3)
+        for value in range(5):
+            buffer.append(value)
+
+        assert len(buffer) == 3
+        assert buffer.values() == [2.0, 3.0, 4.0]
+        assert buffer.values(window=2) == [3.0, 4.0]
+
+    def test_partially_filled(self):
+        buffer = RingBuffer(4)
+        buffer.append(1)
+        assert buffer.values() == [1.0]
+        assert buffer.values(window=0) == []
+
+
+class TestNvidiaSampler:
+
+    def test_feed(self):
+        sampler = NvidiaSampler(capacity=10, fields=("utilization.gpu", "memory.used"))
+        sampler.feed("00000000:01:00.0, 10, 100\n")
+        sampler.feed("00000000:01:00.0, 30, [N/A]\n")
+        sampler.feed("garbage\n")
+
+        assert sampler.gpus == ["00000000:01:00.0"]
+        stats = sampler.stats("00000000:01:00.0", "utilization.gpu")
+        assert (stats.minimum, stats.maximum, stats.mean, stats.count) == (10, 30, 20, 2)
+        # Missing values are kept as nan, but are not part of the statistics
+        assert math.isnan(sampler.samples("00000000:01:00.0", "memory.used")[1])
+        assert sampler.stats("00000000:01:00.0", "memory.used").count == 1
+
+    def test_unknown_gpu(self):
+        sampler = NvidiaSampler()
+        assert sampler.samples("00000000:09:00.0", "memory.used") == []
+        assert sampler.stats("00000000:09:00.0", "memory.used") is None
+
+    def test_streams_from_one_process(self, fake_nvidia_smi):
+        sampler = NvidiaSampler(interval_ms=10, capacity=5, executable=fake_nvidia_smi)
+        with sampler:
+            # Wait until the buffer has wrapped around, i.e. the first sample (50) was overwritten
+            assert _wait_for(lambda: sampler.samples("00000000:02:00.0", "utilization.gpu")[:1] > [50])
+            process = sampler._process
+            assert sampler.running
+
+        assert not sampler.running
+        assert process.poll() is not None
+        assert sorted(sampler.gpus) == ["00000000:01:00.0", "00000000:02:00.0"]
+
+        # Only the most recent samples are kept
+        utilization = sampler.samples("00000000:02:00.0", "utilization.gpu")
+        assert len(utilization) == 5
+        assert utilization == sorted(utilization)
+        assert utilization[0] > 50
+
+        stats = sampler.stats("00000000:01:00.0", "memory.total", window=3)
+        assert (stats.minimum, stats.maximum, stats.mean) == (8192, 8192, 8192)
+        assert sampler.stats("00000000:01:00.0", "temperature.gpu") is None
+        assert sampler.stats("00000000:01:00.0", "power.draw").mean == 75.5
+
+    def test_missing_executable(self, tmp_path):
+        sampler = NvidiaSampler(executable=str(tmp_path / "missing"))
+        with pytest.raises(OSError):
+            sampler.start()
+        assert not sampler.running
+
+    def test_stop_abandons_a_stuck_process(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+
+        class StuckProcess:
+            # Ignores SIGTERM and SIGKILL, like a process in uninterruptible sleep
+            stdout = open(read_fd)
+
+            def terminate(self):
+                pass
+
+            def kill(self):
+                pass
+
+            def wait(self, timeout=None):
+                raise subprocess.TimeoutExpired("nvidia-smi", timeout)
+
+            def poll(self):
+                return None
+
+        monkeypatch.setattr(nvidia.subprocess, "Popen", lambda *args, **kwargs: StuckProcess())
+        monkeypatch.setattr(nvidia, "KILL_GRACE", 0.1)
+        sampler = NvidiaSampler()
+        sampler.start()
+        reader = sampler._thread
+        try:
+            start = time.monotonic()
+            sampler.stop()
+            assert time.monotonic() - start < 2
+            assert not sampler.running
+            # The reader is still blocked on the pipe, so it was left open
+            assert not StuckProcess.stdout.closed
+        finally:
+            os.close(write_fd)
+            reader.join(timeout=2)
+            StuckProcess.stdout.close()